@@ -32,6 +32,13 @@ class Settings(BaseSettings):
     cloudflare_zone_id: str = ""  # Zone ID for DNS management (found in domain overview)
     cloudflare_domain: str = ""  # Base domain (e.g., woowtech.io)
 
+    # Pod resource usage sampling (requires metrics-server)
+    metrics_enabled: bool = False  # Set to true to sample pod CPU/memory and ship to Odoo
+    metrics_interval: int = 60  # seconds between samples
+    metrics_batch_size: int = 500  # max samples per push to Odoo
+    metrics_buffer_size: int = 20000  # samples kept while Odoo is unreachable (oldest dropped)
+    odoo_metrics_url: str = ""  # e.g. http://odoo:8069/api/paas/metrics/ingest
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -11,6 +11,7 @@ from src.api import init, namespaces, releases, routes, tunnels
 from src.config import settings
 from src.models.schemas import ErrorResponse, HealthResponse
 from src.services.helm import HelmService
+from src.services.metrics import MetricsSampler
 
 # Configure logging
 logging.basicConfig(
@@ -35,8 +36,18 @@ async def lifespan(app: FastAPI):
         logger.critical(f"Helm not available: {e} - Service cannot start!")
         raise RuntimeError(f"Helm is required but not available: {e}")
 
+    sampler = None
+    if settings.metrics_enabled:
+        if settings.odoo_metrics_url:
+            sampler = MetricsSampler()
+            sampler.start()
+        else:
+            logger.warning("Metrics sampling enabled but ODOO_METRICS_URL not set - disabled")
+
     yield
 
+    if sampler:
+        await sampler.stop()
     logger.info("Shutting down PaaS Operator Service...")
 
 
@@ -0,0 +1,190 @@
+"""Pod resource usage sampler.
+
+Periodically reads pod CPU/memory from the Kubernetes metrics API,
+aggregates it per Helm release and pushes batched samples to Odoo,
+which stores them as downsampled time series for quota sizing.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.config import settings
+from src.services.helm import KubectlException, KubernetesService
+
+logger = logging.getLogger(__name__)
+
+# Label Helm sets on every resource of a release
+RELEASE_LABEL = "app.kubernetes.io/instance"
+
+_CPU_SUFFIXES = {"n": 1e-6, "u": 1e-3, "m": 1.0}
+_MEMORY_SUFFIXES = {
+    "Ki": 1024, "Mi": 1024 ** 2, "Gi": 1024 ** 3, "Ti": 1024 ** 4,
+    "k": 1000, "K": 1000, "M": 1000 ** 2, "G": 1000 ** 3, "T": 1000 ** 4,
+}
+
+
+def parse_cpu_quantity(quantity: str) -> float:
+    """Convert a Kubernetes CPU quantity to millicores.
+
+    Args:
+        quantity: CPU quantity (e.g. "250m", "1", "123456789n")
+
+    Returns:
+        CPU usage in millicores
+    """
+    if not quantity:
+        return 0.0
+    suffix = quantity[-1]
+    if suffix in _CPU_SUFFIXES:
+        return float(quantity[:-1]) * _CPU_SUFFIXES[suffix]
+    return float(quantity) * 1000
+
+
+def parse_memory_quantity(quantity: str) -> int:
+    """Convert a Kubernetes memory quantity to bytes.
+
+    Args:
+        quantity: Memory quantity (e.g. "128Mi", "1Gi", "524288Ki", "1000")
+
+    Returns:
+        Memory usage in bytes
+    """
+    if not quantity:
+        return 0
+    for suffix in ("Ki", "Mi", "Gi", "Ti"):
+        if quantity.endswith(suffix):
+            return int(float(quantity[:-2]) * _MEMORY_SUFFIXES[suffix])
+    if quantity[-1] in _MEMORY_SUFFIXES:
+        return int(float(quantity[:-1]) * _MEMORY_SUFFIXES[quantity[-1]])
+    return int(float(quantity))
+
+
+def aggregate_pod_metrics(data: Dict[str, Any], timestamp: int) -> List[Dict[str, Any]]:
+    """Sum pod metrics per (namespace, release).
+
+    Args:
+        data: PodMetricsList returned by the metrics.k8s.io API
+        timestamp: Sample time (epoch seconds) applied to all samples
+
+    Returns:
+        List of samples with namespace, release, timestamp,
+        cpu_millicores, memory_bytes and pods
+    """
+    totals: Dict[tuple, Dict[str, Any]] = {}
+    for item in data.get("items", []):
+        metadata = item.get("metadata", {})
+        namespace = metadata.get("namespace", "")
+        release = (metadata.get("labels") or {}).get(RELEASE_LABEL)
+        if not release or not namespace.startswith(settings.namespace_prefix):
+            continue
+
+        sample = totals.setdefault((namespace, release), {
+            "namespace": namespace,
+            "release": release,
+            "timestamp": timestamp,
+            "cpu_millicores": 0.0,
+            "memory_bytes": 0,
+            "pods": 0,
+        })
+        sample["pods"] += 1
+        for container in item.get("containers", []):
+            usage = container.get("usage", {})
+            sample["cpu_millicores"] += parse_cpu_quantity(usage.get("cpu", ""))
+            sample["memory_bytes"] += parse_memory_quantity(usage.get("memory", ""))
+
+    for sample in totals.values():
+        sample["cpu_millicores"] = round(sample["cpu_millicores"], 2)
+    return list(totals.values())
+
+
+class MetricsSampler:
+    """Samples release resource usage on an interval and ships it to Odoo.
+
+    Sample timestamps are aligned to the interval, so Odoo can drop the
+    duplicates produced when several operator replicas sample at once.
+    Samples stay buffered (bounded) while Odoo is unreachable.
+    """
+
+    def __init__(self, kubernetes: Optional[KubernetesService] = None):
+        self.kubernetes = kubernetes or KubernetesService()
+        self.interval = max(settings.metrics_interval, 10)
+        self.buffer: deque = deque(maxlen=settings.metrics_buffer_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def collect(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Read current pod metrics for all PaaS namespaces.
+
+        Returns:
+            Per-release samples (empty if the metrics API is unavailable)
+        """
+        now = time.time() if now is None else now
+        timestamp = int(now) // self.interval * self.interval
+        try:
+            result = self.kubernetes._run_command(
+                ["get", "--raw", "/apis/metrics.k8s.io/v1beta1/pods"]
+            )
+        except KubectlException as e:
+            logger.warning(f"Pod metrics unavailable: {e.message} {e.stderr}")
+            return []
+        return aggregate_pod_metrics(json.loads(result.stdout), timestamp)
+
+    async def flush(self) -> int:
+        """Push buffered samples to Odoo in batches.
+
+        Returns:
+            Number of samples delivered
+        """
+        delivered = 0
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            while self.buffer:
+                batch = [self.buffer[i] for i in range(min(len(self.buffer), settings.metrics_batch_size))]
+                try:
+                    response = await client.post(
+                        settings.odoo_metrics_url,
+                        json={"samples": batch},
+                        headers={"X-API-Key": settings.api_key},
+                    )
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    logger.warning(f"Failed to push {len(batch)} metric samples to Odoo: {e}")
+                    break
+                for _ in batch:
+                    self.buffer.popleft()
+                delivered += len(batch)
+        return delivered
+
+    async def run_once(self) -> None:
+        """Take one sample and push everything buffered."""
+        samples = await asyncio.to_thread(self.collect)
+        self.buffer.extend(samples)
+        if self.buffer:
+            await self.flush()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception(f"Metrics sampling failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background sampling task."""
+        if self._task is None:
+            logger.info(f"Starting pod metrics sampler (interval={self.interval}s)")
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the background sampling task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
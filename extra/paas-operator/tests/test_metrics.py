@@ -0,0 +1,128 @@
+"""Tests for the pod metrics sampler."""
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.services.helm import KubectlException
+from src.services.metrics import (
+    MetricsSampler,
+    aggregate_pod_metrics,
+    parse_cpu_quantity,
+    parse_memory_quantity,
+)
+
+
+def _pod(namespace, release, cpu, memory):
+    labels = {"app.kubernetes.io/instance": release} if release else {}
+    return {
+        "metadata": {"namespace": namespace, "labels": labels},
+        "containers": [{"name": "main", "usage": {"cpu": cpu, "memory": memory}}],
+    }
+
+
+class TestQuantityParsing:
+    """Test cases for Kubernetes quantity parsing."""
+
+    def test_parse_cpu_quantity(self):
+        """Test CPU quantities are converted to millicores."""
+        assert parse_cpu_quantity("250m") == 250
+        assert parse_cpu_quantity("2") == 2000
+        assert parse_cpu_quantity("123456789n") == pytest.approx(123.456789)
+        assert parse_cpu_quantity("1500u") == pytest.approx(1.5)
+        assert parse_cpu_quantity("") == 0
+
+    def test_parse_memory_quantity(self):
+        """Test memory quantities are converted to bytes."""
+        assert parse_memory_quantity("128Mi") == 128 * 1024 ** 2
+        assert parse_memory_quantity("1Gi") == 1024 ** 3
+        assert parse_memory_quantity("2k") == 2000
+        assert parse_memory_quantity("1024") == 1024
+        assert parse_memory_quantity("") == 0
+
+
+class TestAggregatePodMetrics:
+    """Test cases for per-release aggregation."""
+
+    def test_sums_pods_per_release(self):
+        """Test pods of the same release are summed and foreign pods skipped."""
+        data = {"items": [
+            _pod("paas-ws-1", "svc-a", "100m", "64Mi"),
+            _pod("paas-ws-1", "svc-a", "50m", "64Mi"),
+            _pod("paas-ws-2", "svc-b", "10m", "1Mi"),
+            _pod("kube-system", "coredns", "5m", "1Mi"),
+            _pod("paas-ws-1", None, "5m", "1Mi"),
+        ]}
+
+        samples = {s["release"]: s for s in aggregate_pod_metrics(data, 1200)}
+
+        assert set(samples) == {"svc-a", "svc-b"}
+        assert samples["svc-a"]["cpu_millicores"] == 150
+        assert samples["svc-a"]["memory_bytes"] == 128 * 1024 ** 2
+        assert samples["svc-a"]["pods"] == 2
+        assert samples["svc-a"]["timestamp"] == 1200
+
+
+class TestMetricsSampler:
+    """Test cases for MetricsSampler."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        with patch("src.services.metrics.settings") as mock:
+            mock.metrics_interval = 60
+            mock.metrics_batch_size = 2
+            mock.metrics_buffer_size = 100
+            mock.namespace_prefix = "paas-ws-"
+            mock.odoo_metrics_url = "http://odoo/api/paas/metrics/ingest"
+            mock.api_key = "test-key"
+            yield mock
+
+    def test_collect_aligns_timestamp(self, mock_settings):
+        """Test sample timestamps are floored to the interval."""
+        kubernetes = MagicMock()
+        kubernetes._run_command.return_value = Mock(
+            stdout=json.dumps({"items": [_pod("paas-ws-1", "svc-a", "100m", "64Mi")]})
+        )
+        sampler = MetricsSampler(kubernetes)
+
+        samples = sampler.collect(now=1000.5)
+
+        assert samples[0]["timestamp"] == 960
+        kubernetes._run_command.assert_called_once_with(
+            ["get", "--raw", "/apis/metrics.k8s.io/v1beta1/pods"]
+        )
+
+    def test_collect_metrics_api_unavailable(self, mock_settings):
+        """Test missing metrics-server yields no samples."""
+        kubernetes = MagicMock()
+        kubernetes._run_command.side_effect = KubectlException("failed", "kubectl", "not found")
+
+        assert MetricsSampler(kubernetes).collect() == []
+
+    @pytest.mark.asyncio
+    async def test_flush_batches(self, mock_settings):
+        """Test buffered samples are pushed in batches."""
+        sampler = MetricsSampler(MagicMock())
+        sampler.buffer.extend([{"n": i} for i in range(5)])
+        response = Mock(raise_for_status=Mock())
+
+        with patch("httpx.AsyncClient.post", new=AsyncMock(return_value=response)) as post:
+            delivered = await sampler.flush()
+
+        assert delivered == 5
+        assert post.await_count == 3
+        assert post.await_args_list[0].kwargs["headers"] == {"X-API-Key": "test-key"}
+        assert not sampler.buffer
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_buffer_on_failure(self, mock_settings):
+        """Test samples stay buffered when Odoo is unreachable."""
+        sampler = MetricsSampler(MagicMock())
+        sampler.buffer.extend([{"n": i} for i in range(3)])
+
+        with patch("httpx.AsyncClient.post", new=AsyncMock(side_effect=httpx.ConnectError("down"))):
+            delivered = await sampler.flush()
+
+        assert delivered == 0
+        assert len(sampler.buffer) == 3
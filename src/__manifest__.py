@@ -1,6 +1,6 @@
 {
     'name': 'Woow PaaS Platform',
-    'version': '18.0.1.0.4',
+    'version': '18.0.1.0.5',
     'category': 'WOOW',
     'summary': 'Woow PaaS Platform - Base Module',
     'description': '''
@@ -17,6 +17,7 @@
         'views/menu.xml',
         'data/ai_assistant_data.xml',
         'data/mcp_server_cron.xml',
+        'data/cloud_service_cron.xml',
         'views/project_task_views.xml',
         'views/ai_config_views.xml',
         'views/cloud_app_template_views.xml',
@@ -3,3 +3,4 @@ from . import ai_assistant
 from . import oauth2
 from . import smart_home
 from . import ha_api
+from . import metrics
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import asyncio
 import base64
-import html
 import json
 import logging
 from typing import Any
@@ -12,8 +10,22 @@ from werkzeug.wrappers import Response
 
 from odoo.http import request, route, Controller
 
+from ..services.generation_buffer import (
+    find_generation, get_generation, parse_event_id, start_generation,
+)
+from ..services.list_version import get_version_token
+from ..services.pagination import InvalidCursor, paginate
+from ..services.stream_ticket import STREAM_TICKET_TTL, InvalidTicket, make_ticket, verify_ticket
+
 _logger = logging.getLogger(__name__)
 
+# Keyset pagination sort keys (field, descending); see services/pagination.py
+PROJECT_PAGE_ORDER = [('sequence', False), ('id', False)]
+TASK_PAGE_ORDER = [('priority', True), ('sequence', False), ('id', True)]
+
+# Size of the text chunks a cached AI answer is replayed in over SSE
+CACHED_ANSWER_CHUNK_CHARS = 64
+
 
 class AiAssistantController(Controller):
     """Controller for AI assistant and support API endpoints."""
@@ -35,10 +47,7 @@ class AiAssistantController(Controller):
 
         Returns True if an access record exists for the current user.
         """
-        return request.env['woow_paas_platform.workspace_access'].sudo().search_count([
-            ('workspace_id', '=', workspace.id),
-            ('user_id', '=', request.env.user.id),
-        ]) > 0
+        return bool(workspace.get_user_roles(request.env.user))
 
     def _check_project_access(self, project):
         """Verify the current user has access to the project via cloud service.
@@ -133,6 +142,7 @@ class AiAssistantController(Controller):
         channel_id: int = 0,
         limit: int = 50,
         before_id: int = 0,
+        list_version: str = '',
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Get chat history for a channel.
@@ -141,9 +151,11 @@ class AiAssistantController(Controller):
             channel_id: The discuss.channel ID.
             limit: Maximum number of messages to return.
             before_id: Only return messages with ID less than this (pagination).
+            list_version: Version token from a previous response; if the
+                history is unchanged only ``not_modified`` is returned.
 
         Returns:
-            dict: Response with message list and attachments.
+            dict: Response with message list, attachments and list_version.
         """
         if not channel_id:
             return {'success': False, 'error': 'channel_id is required'}
@@ -162,47 +174,17 @@ class AiAssistantController(Controller):
         if before_id:
             domain.append(('id', '<', before_id))
 
-        messages = request.env['mail.message'].sudo().search(
-            domain,
-            order='id desc',
-            limit=limit,
-        )
+        version_token = get_version_token(request.env['mail.message'].sudo(), domain)
+        if list_version and list_version == version_token:
+            return {'success': True, 'not_modified': True, 'list_version': version_token}
 
-        # Collect all AI assistant partner IDs to identify AI messages
-        ai_partner_ids = set(
-            request.env['ai.assistant'].sudo().search([]).mapped('partner_id.id')
-        )
-        # Also include partner_root for backward compatibility with old messages
-        ai_partner_ids.add(request.env.ref('base.partner_root').id)
-
-        data = []
-        for msg in reversed(messages):
-            attachments = []
-            for att in msg.attachment_ids:
-                attachments.append({
-                    'id': att.id,
-                    'name': att.name,
-                    'mimetype': att.mimetype,
-                    'file_size': att.file_size,
-                    'url': f'/web/content/{att.id}?download=true',
-                })
-
-            is_ai = msg.author_id.id in ai_partner_ids
-            data.append({
-                'id': msg.id,
-                'body': html.unescape(msg.body) if is_ai and msg.body else (msg.body or ''),
-                'author_id': msg.author_id.id if msg.author_id else None,
-                'author_name': msg.author_id.name if msg.author_id else 'Unknown',
-                'is_ai': is_ai,
-                'date': msg.date.isoformat() if msg.date else None,
-                'message_type': msg.message_type,
-                'attachments': attachments,
-            })
+        data = request.env['mail.message'].sudo()._read_chat_history(domain, limit=limit)
 
         return {
             'success': True,
             'data': data,
             'count': len(data),
+            'list_version': version_token,
         }
 
     @route('/api/ai/chat/post', auth='user', methods=['POST'], type='json')
@@ -318,17 +300,113 @@ class AiAssistantController(Controller):
             'res_model': 'discuss.channel',
             'res_id': channel_id,
         })
+        return self._json_response(self._post_upload_message(channel, attachment))
+
+    @route('/api/ai/chat/upload/chunked', auth='user', methods=['POST'], type='http')
+    def api_ai_chat_upload_chunked(self, action: str = '', **kwargs: Any) -> Response:
+        """Resumable chunked upload of a channel attachment.
+
+        Chunks are written straight to a part file in the filestore, so a
+        request holds at most one chunk in memory. Multipart form data,
+        with ``csrf_token`` and:
+
+        - ``action=init``: ``channel_id``, ``file_name``, ``file_size``;
+          returns ``upload_id``, ``chunk_size`` and ``received`` (0)
+        - ``action=append``: ``upload_id``, ``offset``, ``chunk`` (file part),
+          optional ``checksum`` (SHA-256 hex of the chunk); returns
+          ``received``. A wrong offset answers 409 with the current one.
+        - ``action=status``: ``upload_id``; returns ``received`` and
+          ``file_size``, to resume after a dropped connection
+        - ``action=finalize``: ``upload_id``; attaches the file to a new
+          channel message, same response as ``/api/ai/chat/upload``
+
+        Returns:
+            JSON response with the upload state.
+        """
+        from ..models.chat_upload import UPLOAD_CHUNK_SIZE, ChatUploadError
+
+        Upload = request.env['woow_paas_platform.chat_upload'].sudo()
 
-        # Post a message with the attachment (escape filename to prevent XSS)
+        if action == 'init':
+            try:
+                channel_id = int(kwargs.get('channel_id', 0))
+                file_size = int(kwargs.get('file_size', -1))
+            except (TypeError, ValueError):
+                return self._json_response({'success': False, 'error': 'Invalid channel_id or file_size'}, 400)
+            file_name = (kwargs.get('file_name') or '').strip()
+            if not channel_id or not file_name or file_size < 0:
+                return self._json_response(
+                    {'success': False, 'error': 'channel_id, file_name and file_size are required'}, 400,
+                )
+            if file_size > self.MAX_UPLOAD_SIZE:
+                return self._json_response({'success': False, 'error': 'File too large (max 10 MB)'}, 413)
+            channel = request.env['discuss.channel'].sudo().browse(channel_id)
+            if not channel.exists():
+                return self._json_response({'success': False, 'error': 'Channel not found'}, 404)
+            if not self._check_channel_access(channel):
+                return self._json_response({'success': False, 'error': 'Access denied'}, 403)
+            upload = Upload.create({
+                'channel_id': channel.id,
+                'user_id': request.env.uid,
+                'file_name': file_name,
+                'file_size': file_size,
+            })
+            return self._json_response({'success': True, 'data': {
+                'upload_id': upload.token,
+                'chunk_size': UPLOAD_CHUNK_SIZE,
+                'received': 0,
+            }})
+
+        if action not in ('append', 'status', 'finalize'):
+            return self._json_response({'success': False, 'error': f'Unknown action: {action}'}, 400)
+
+        upload = Upload.search([
+            ('token', '=', kwargs.get('upload_id') or ''),
+            ('user_id', '=', request.env.uid),
+        ], limit=1)
+        if not upload:
+            return self._json_response({'success': False, 'error': 'Upload not found'}, 404)
+
+        try:
+            if action == 'status':
+                return self._json_response({'success': True, 'data': {
+                    'received': upload._get_received(),
+                    'file_size': upload.file_size,
+                }})
+
+            if action == 'append':
+                chunk = kwargs.get('chunk')
+                try:
+                    offset = int(kwargs.get('offset', -1))
+                except (TypeError, ValueError):
+                    offset = -1
+                if not chunk or offset < 0:
+                    return self._json_response({'success': False, 'error': 'chunk and offset are required'}, 400)
+                received = upload._append_chunk(offset, chunk.stream, kwargs.get('checksum'))
+                return self._json_response({'success': True, 'data': {'received': received}})
+
+            channel = upload.channel_id
+            if not self._check_channel_access(channel):
+                return self._json_response({'success': False, 'error': 'Access denied'}, 403)
+            attachment = upload._finalize()
+            return self._json_response(self._post_upload_message(channel, attachment))
+        except ChatUploadError as exc:
+            result = {'success': False, 'error': exc.message}
+            if exc.received is not None:
+                result['received'] = exc.received
+            return self._json_response(result, exc.status)
+
+    def _post_upload_message(self, channel, attachment) -> dict[str, Any]:
+        """Post a channel message carrying an uploaded attachment."""
+        # Escape filename to prevent XSS
         message = channel.message_post(
-            body=f'Uploaded: {escape(file_name)}',
+            body=f'Uploaded: {escape(attachment.name)}',
             message_type='comment',
             subtype_xmlid='mail.mt_comment',
             author_id=request.env.user.partner_id.id,
             attachment_ids=[attachment.id],
         )
-
-        result = {
+        return {
             'success': True,
             'data': {
                 'message_id': message.id,
@@ -342,31 +420,78 @@ class AiAssistantController(Controller):
             },
         }
 
+    @staticmethod
+    def _json_response(result: dict[str, Any], status: int = 200) -> Response:
         return Response(
             json.dumps(result),
             content_type='application/json',
-            status=200,
+            status=status,
         )
 
     # ==================== SSE Streaming ====================
 
-    @route('/api/ai/stream/<int:channel_id>', auth='user', methods=['GET'], type='http')
-    def api_ai_stream(self, channel_id: int, **kwargs: Any):
+    @route('/api/ai/chat/stream-ticket', auth='user', methods=['POST'], type='json')
+    def api_ai_stream_ticket(self, channel_id: int, **kwargs: Any) -> dict[str, Any]:
+        """Validate a request to stream the AI reply and issue a stream ticket.
+
+        The stream itself is served by the gevent process, which does not
+        hold a prefork worker while the reply is generated; it trusts the
+        signed ticket instead of the session (see services/stream_ticket.py).
+
+        Args:
+            channel_id: The discuss.channel ID.
+
+        Returns:
+            dict: ``ticket`` and ``expires_in`` (seconds), or an error with
+            an ``error_code``.
+        """
+        channel = request.env['discuss.channel'].sudo().browse(int(channel_id or 0))
+        if not channel.exists():
+            return {'success': False, 'error': 'Channel not found', 'error_code': 'channel_not_found'}
+        if not self._check_channel_access(channel):
+            return {'success': False, 'error': 'Access denied', 'error_code': 'access_denied'}
+
+        assistant = self._get_channel_assistant(channel)
+        if not assistant:
+            return {'success': False, 'error': 'No AI assistant available', 'error_code': 'no_agent'}
+
+        last_message = self._get_last_user_message(channel, assistant)
+        if not last_message:
+            return {'success': False, 'error': 'No user message found', 'error_code': 'no_message'}
+
+        return {
+            'success': True,
+            'data': {
+                'ticket': make_ticket(request.env, channel.id, last_message.id),
+                'expires_in': STREAM_TICKET_TTL,
+            },
+        }
+
+    @route('/api/ai/stream/<int:channel_id>', auth='none', methods=['GET'], type='http')
+    def api_ai_stream(self, channel_id: int, ticket: str = '', **kwargs: Any):
         """Server-Sent Events endpoint for streaming AI responses.
 
-        Retrieves the latest user message from the channel, generates
-        a streaming AI response, and sends it back as SSE events.
+        Served by the gevent process (nginx routes ``/api/ai/stream/`` to
+        port 8072) and authenticated by a ticket from
+        ``/api/ai/chat/stream-ticket``. Generates a streaming AI response to
+        the ticket's message and sends it back as SSE events.
 
         Args:
             channel_id: The discuss.channel ID.
+            ticket: Signed stream ticket.
 
         Returns:
             werkzeug.Response: SSE stream with text/event-stream content type.
         """
-        # Validate CSRF token (GET endpoints bypass Odoo's automatic check)
-        csrf_token = kwargs.get('csrf_token', '')
-        if not csrf_token or not request.validate_csrf(csrf_token):
-            return self._sse_error_response('Invalid request', 'csrf_error')
+        if not request.db:
+            return self._sse_error_response('Invalid request', 'invalid_ticket')
+        try:
+            payload = verify_ticket(request.env, ticket)
+        except InvalidTicket as exc:
+            return self._sse_error_response(str(exc), 'invalid_ticket')
+        if payload['channel_id'] != channel_id:
+            return self._sse_error_response('Invalid request', 'invalid_ticket')
+        request.update_env(user=payload['uid'])
 
         channel = request.env['discuss.channel'].sudo().browse(channel_id)
         if not channel.exists():
@@ -387,19 +512,43 @@ class AiAssistantController(Controller):
             _logger.error('AI client error for assistant %s in channel %s: %s', assistant.name, channel_id, exc.message)
             return self._sse_error_response('AI provider not configured', 'provider_not_configured')
 
-        # Get the latest user message (exclude messages from the assistant's partner)
+        # The user message the ticket was issued for
         assistant_partner_id = assistant.partner_id.id
-        last_message = request.env['mail.message'].sudo().search([
+        last_message = request.env['mail.message'].sudo().browse(payload['message_id']).exists()
+        if not last_message:
+            return self._sse_error_response('No user message found', 'no_message')
+
+        # Reconnects resume the generation answering this message instead of
+        # starting a new one: from the Last-Event-ID header (EventSource
+        # auto-reconnect) or parameter (manual reconnect), else from the start
+        db_name = request.env.cr.dbname
+        generation_key = (db_name, channel_id, last_message.id)
+        gen_id, after_seq = parse_event_id(
+            request.httprequest.headers.get('Last-Event-ID') or kwargs.get('last_event_id', ''),
+        )
+        generation = get_generation(gen_id) if gen_id else None
+        if not generation or generation.key != generation_key:
+            generation, after_seq = find_generation(generation_key), 0
+        if generation:
+            return self._sse_generation_response(generation, after_seq)
+
+        # Answered already (e.g. by another worker, or the buffer expired)
+        reply = request.env['mail.message'].sudo().search([
             ('res_id', '=', channel_id),
             ('model', '=', 'discuss.channel'),
             ('message_type', '=', 'comment'),
-            ('author_id', '!=', assistant_partner_id),
+            ('author_id', '=', assistant_partner_id),
+            ('id', '>', last_message.id),
         ], order='id desc', limit=1)
+        if reply:
+            return self._sse_response(['data: ' + json.dumps({
+                'chunk': '',
+                'done': True,
+                'full_response': reply.plain_body or '',
+                'message_id': reply.id,
+            }) + '\n\n'])
 
-        if not last_message:
-            return self._sse_error_response('No user message found', 'no_message')
-
-        user_message = last_message.body or ''
+        user_message = last_message.plain_body or last_message.body or ''
 
         # Pre-fetch ORM data before entering the generator
         system_prompt = ''
@@ -412,25 +561,27 @@ class AiAssistantController(Controller):
         if cloud_context:
             system_prompt = (system_prompt + '\n\n' + cloud_context).strip()
 
-        history = channel._get_chat_history(limit=20)
-        messages = client.build_messages(
-            system_prompt=system_prompt,
-            history=history,
-            user_message=user_message,
-        )
+        # Summary + newest turns within the assistant's token budget
+        messages = channel._get_ai_prompt_messages(assistant, client, system_prompt, user_message)
         root_partner_id = assistant_partner_id
 
-        # Pre-capture DB info for use inside the generator where the
-        # original request cursor may no longer be valid.
-        db_name = request.env.cr.dbname
+        # Opt-in response cache: same question in the same context
+        ResponseCache = request.env['woow_paas_platform.ai_response_cache']
+        cache_probe = ResponseCache._make_probe(
+            assistant, client, system_prompt, user_message, history=messages[:-1],
+        )
+        cached_answer = ResponseCache._find_answer(cache_probe)
+
+        # Pre-capture DB info for use inside the generation thread, which
+        # outlives the request cursor.
         uid = request.env.uid
         context = dict(request.env.context)
 
-        # Pre-fetch MCP tools and build config before the generator
-        # (ORM cursor may not be valid inside the streaming generator).
+        # Pre-fetch MCP tools and build the tool objects before the generation
+        # (no ORM cursor in the generation thread).
         # Combine system-scope tools from the assistant and user-scope tools
         # from the cloud service linked to this channel's task/project.
-        from ..models.ai_client import _build_mcp_server_config, _build_prefixed_enabled_names
+        from ..services.mcp_pool import build_mcp_tools
         mcp_tools = assistant.get_enabled_mcp_tools()
 
         # Also gather user-scope MCP tools from the cloud service
@@ -438,50 +589,40 @@ class AiAssistantController(Controller):
         if user_mcp_tools:
             mcp_tools = (mcp_tools | user_mcp_tools) if mcp_tools else user_mcp_tools
 
-        mcp_server_config = None
-        mcp_tool_names = None
-        if mcp_tools:
-            mcp_server_config = _build_mcp_server_config(mcp_tools)
-            mcp_tool_names = _build_prefixed_enabled_names(mcp_tools)
+        # Built from the synced schemas; calls go through pooled sessions
+        agent_tools = build_mcp_tools(mcp_tools) if mcp_tools else []
 
-        def generate():
+        def produce(generation):
             full_response = ''
+            tool_failed = False
             try:
-                tool_events = None
-                if mcp_server_config:
-                    try:
-                        tool_events = asyncio.run(
-                            client._async_agent_stream(
-                                messages, mcp_server_config, mcp_tool_names,
-                            )
-                        )
-                    except Exception as exc:
-                        _logger.warning(
-                            'MCP tool stream failed, falling back to text-only: %s', exc,
-                        )
-
-                if tool_events is not None:
-                    for event in tool_events:
-                        event_type = event.get('type', 'text_chunk')
-                        if event_type == 'text_chunk':
-                            chunk = event.get('content', '')
-                            full_response += chunk
-                            event_data = json.dumps({
-                                'chunk': chunk, 'done': False,
-                            })
-                            yield f'data: {event_data}\n\n'
-                        elif event_type in ('tool_call', 'tool_result', 'tool_error'):
-                            yield f'data: {json.dumps({**event, "done": False})}\n\n'
+                if cached_answer:
+                    # Replayed at once through the same event stream
+                    events = (
+                        {'type': 'text_chunk', 'content': cached_answer[i:i + CACHED_ANSWER_CHUNK_CHARS]}
+                        for i in range(0, len(cached_answer), CACHED_ANSWER_CHUNK_CHARS)
+                    )
+                elif agent_tools:
+                    # Tool calls, results and text are flushed the moment
+                    # the agent emits them
+                    events = client.stream_agent_events(messages, agent_tools)
                 else:
-                    for chunk in client.chat_completion_stream(messages):
+                    events = (
+                        {'type': 'text_chunk', 'content': chunk}
+                        for chunk in client.chat_completion_stream(messages)
+                    )
+
+                for event in events:
+                    event_type = event.get('type', 'text_chunk')
+                    if event_type == 'text_chunk':
+                        chunk = event.get('content', '')
                         full_response += chunk
-                        event_data = json.dumps({
-                            'chunk': chunk, 'done': False,
-                        })
-                        yield f'data: {event_data}\n\n'
+                        generation.publish({'chunk': chunk, 'done': False})
+                    elif event_type in ('tool_call', 'tool_result', 'tool_error'):
+                        tool_failed = tool_failed or event_type == 'tool_error'
+                        generation.publish({**event, 'done': False})
             except AIClientError as exc:
-                error_data = json.dumps({'error': exc.message, 'done': True})
-                yield f'data: {error_data}\n\n'
+                generation.publish({'error': exc.message, 'done': True}, final=True)
                 return
 
             # Persist the AI response BEFORE sending the done signal so
@@ -514,6 +655,19 @@ class AiAssistantController(Controller):
                     )
                     warning = 'AI 回覆已生成但無法儲存，請重新整理頁面確認。'
 
+            # Answers that relied on a failed tool call are not reused
+            if cache_probe and full_response and not cached_answer and not tool_failed:
+                try:
+                    import odoo
+                    from odoo import api as odoo_api
+                    with odoo.registry(db_name).cursor() as new_cr:
+                        new_env = odoo_api.Environment(new_cr, uid, context)
+                        new_env['woow_paas_platform.ai_response_cache']._store_answer(
+                            cache_probe, full_response,
+                        )
+                except Exception as exc:
+                    _logger.warning('Failed to cache AI response for channel %s: %s', channel_id, exc)
+
             # Send the done signal (with message_id when available)
             done_payload = {
                 'chunk': '',
@@ -522,12 +676,34 @@ class AiAssistantController(Controller):
             }
             if saved_message_id:
                 done_payload['message_id'] = saved_message_id
+            if cached_answer:
+                done_payload['cached'] = True
             if warning:
                 done_payload['warning'] = warning
-            yield f'data: {json.dumps(done_payload)}\n\n'
+            generation.publish(done_payload, final=True)
+
+        # Runs on its own thread: a dropped connection does not stop it
+        generation = start_generation(generation_key, produce)
+        return self._sse_generation_response(generation, 0)
+
+    def _sse_generation_response(self, generation, after_seq: int) -> Response:
+        """Stream a generation's events after ``after_seq``, then follow it.
+
+        Each event carries ``id: <generation>:<seq>`` for resuming.
+        """
+        def stream():
+            for seq, payload in generation.follow(after_seq):
+                if payload is None:
+                    yield ': keepalive\n\n'
+                else:
+                    yield f'id: {generation.id}:{seq}\ndata: {json.dumps(payload)}\n\n'
 
+        return self._sse_response(stream())
+
+    @staticmethod
+    def _sse_response(body) -> Response:
         return Response(
-            generate(),
+            body,
             content_type='text/event-stream',
             headers={
                 'Cache-Control': 'no-cache',
@@ -536,6 +712,15 @@ class AiAssistantController(Controller):
             },
         )
 
+    def _get_last_user_message(self, channel, assistant):
+        """Latest comment of the channel not authored by the assistant."""
+        return request.env['mail.message'].sudo().search([
+            ('res_id', '=', channel.id),
+            ('model', '=', 'discuss.channel'),
+            ('message_type', '=', 'comment'),
+            ('author_id', '!=', assistant.partner_id.id),
+        ], order='id desc', limit=1)
+
     def _get_channel_assistant(self, channel):
         """Find the appropriate AI assistant for a channel.
 
@@ -575,41 +760,10 @@ class AiAssistantController(Controller):
     def _get_cloud_service_context_for_channel(self, channel) -> str:
         """Build cloud service context for AI system prompt.
 
-        Looks up the task linked to this channel, then the project's
-        cloud service, and assembles relevant context.
-
         Returns:
             A formatted context string, or empty string if not applicable.
         """
-        task = request.env['project.task'].sudo().search([
-            ('channel_id', '=', channel.id),
-        ], limit=1)
-        if not task or not task.project_id or not task.project_id.cloud_service_id:
-            return ''
-
-        service = task.project_id.cloud_service_id
-        template = service.template_id
-
-        parts = ['## Cloud Service Information']
-        if template:
-            parts.append(f'- Application: {template.name}')
-            if template.category:
-                parts.append(f'- Category: {template.category}')
-            if template.description:
-                parts.append(f'- Description: {template.description}')
-
-        parts.append(f'- Service Name: {service.name}')
-        parts.append(f'- Status: {service.state or "unknown"}')
-
-        if service.subdomain:
-            parts.append(f'- URL: https://{service.subdomain}')
-        if service.error_message:
-            parts.append(f'- Error: {service.error_message}')
-
-        if service.helm_values:
-            parts.append(f'- Configuration (Helm Values):\n```json\n{service.helm_values}\n```')
-
-        return '\n'.join(parts)
+        return channel.sudo()._get_cloud_service_context()
 
     def _get_user_mcp_tools_for_channel(self, channel):
         """Get user-scope MCP tools from the cloud service linked to this channel.
@@ -738,7 +892,7 @@ class AiAssistantController(Controller):
                 return {'success': False, 'error': 'Access denied'}
 
         if action == 'list':
-            return self._list_projects(workspace, cloud_service)
+            return self._list_projects(workspace, cloud_service, kwargs)
         elif action == 'create':
             if not cloud_service and not workspace:
                 return {'success': False, 'error': 'cloud_service_id is required for create'}
@@ -883,14 +1037,25 @@ class AiAssistantController(Controller):
                 })
         return result.sorted('sequence')
 
-    def _list_projects(self, workspace=None, cloud_service=None) -> dict[str, Any]:
-        """List projects, optionally filtered by cloud service or workspace."""
+    def _list_projects(self, workspace=None, cloud_service=None, params: dict | None = None) -> dict[str, Any]:
+        """List projects, optionally filtered by cloud service or workspace.
+
+        Paged with ``limit`` / ``cursor`` params; the response carries
+        ``next_cursor`` until the last page.
+        """
+        params = params or {}
         domain = []
         if cloud_service:
             domain.append(('cloud_service_id', '=', cloud_service.id))
         elif workspace:
             domain.append(('cloud_service_id.workspace_id', '=', workspace.id))
-        projects = request.env['project.project'].sudo().search(domain)
+        try:
+            projects, next_cursor = paginate(
+                request.env['project.project'].sudo(), domain, PROJECT_PAGE_ORDER,
+                params.get('limit'), params.get('cursor'),
+            )
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
         data = [{
             'id': proj.id,
             'name': proj.name,
@@ -906,6 +1071,7 @@ class AiAssistantController(Controller):
             'success': True,
             'data': data,
             'count': len(data),
+            'next_cursor': next_cursor,
         }
 
     def _create_project(self, params: dict, cloud_service=None, workspace=None) -> dict[str, Any]:
@@ -1006,7 +1172,11 @@ class AiAssistantController(Controller):
     # ==================== Private: Task Helpers ====================
 
     def _list_tasks(self, workspace, params: dict) -> dict[str, Any]:
-        """List tasks, optionally filtered by workspace."""
+        """List tasks, optionally filtered by workspace.
+
+        Paged with ``limit`` / ``cursor`` params; the response carries
+        ``next_cursor`` until the last page.
+        """
         project_id = params.get('project_id')
         domain = []
         if workspace:
@@ -1017,12 +1187,19 @@ class AiAssistantController(Controller):
             except (ValueError, TypeError):
                 return {'success': False, 'error': 'Invalid project_id'}
 
-        tasks = request.env['project.task'].sudo().search(domain)
+        try:
+            tasks, next_cursor = paginate(
+                request.env['project.task'].sudo(), domain, TASK_PAGE_ORDER,
+                params.get('limit'), params.get('cursor'),
+            )
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
         data = [self._serialize_task(task) for task in tasks]
         return {
             'success': True,
             'data': data,
             'count': len(data),
+            'next_cursor': next_cursor,
         }
 
     def _create_task(self, workspace, params: dict) -> dict[str, Any]:
@@ -11,10 +11,15 @@ from typing import Any
 
 from odoo.http import Controller, Response, request, route
 
+from ..services.list_version import combine_version_tokens, get_version_token
+from ..services.pagination import InvalidCursor, paginate
 from .oauth2 import verify_oauth_token
 
 _logger = logging.getLogger(__name__)
 
+# Keyset pagination sort keys (field, descending); see services/pagination.py
+HOME_PAGE_ORDER = [('create_date', True), ('id', True)]
+
 
 def _json_response(data: dict, status: int = 200) -> Response:
     """Return a JSON response with proper content-type header.
@@ -33,6 +38,19 @@ def _json_response(data: dict, status: int = 200) -> Response:
     )
 
 
+def _etag_not_modified(etag: str) -> bool:
+    """Check the request's ``If-None-Match`` header against an ETag.
+
+    Args:
+        etag: Quoted entity tag of the current representation.
+
+    Returns:
+        True if the client already holds this representation.
+    """
+    if_none_match = request.httprequest.headers.get('If-None-Match', '')
+    return etag in [tag.strip() for tag in if_none_match.split(',')]
+
+
 def _json_error(error: str, detail: str, status: int = 400) -> Response:
     """Return a JSON error response.
 
@@ -80,11 +98,11 @@ def _get_user_workspaces(user: Any) -> Any:
     Returns:
         Recordset of ``woow_paas_platform.workspace``.
     """
-    access_records = request.env['woow_paas_platform.workspace_access'].sudo().search([
-        ('user_id', '=', user.id),
-        ('workspace_id.state', '=', 'active'),
+    memberships = request.env['woow_paas_platform.workspace_access']._get_user_roles(user.id)
+    return request.env['woow_paas_platform.workspace'].sudo().search([
+        ('id', 'in', list(memberships)),
+        ('state', '=', 'active'),
     ])
-    return access_records.mapped('workspace_id')
 
 
 def _check_workspace_access(user: Any, workspace_id: int) -> Any | None:
@@ -97,14 +115,13 @@ def _check_workspace_access(user: Any, workspace_id: int) -> Any | None:
     Returns:
         Workspace browse record if accessible, ``None`` otherwise.
     """
-    access = request.env['woow_paas_platform.workspace_access'].sudo().search([
-        ('user_id', '=', user.id),
-        ('workspace_id', '=', workspace_id),
-        ('workspace_id.state', '=', 'active'),
-    ], limit=1)
-    if not access:
+    memberships = request.env['woow_paas_platform.workspace_access']._get_user_roles(user.id)
+    if workspace_id not in memberships:
+        return None
+    workspace = request.env['woow_paas_platform.workspace'].sudo().browse(workspace_id).exists()
+    if not workspace or workspace.state != 'active':
         return None
-    return access.workspace_id
+    return workspace
 
 
 class HAIntegrationController(Controller):
@@ -158,9 +175,16 @@ class HAIntegrationController(Controller):
         Args:
             workspace_id: Workspace database ID.
 
+        Query parameters ``limit`` and ``cursor`` page through the homes
+        (newest first); follow ``next_cursor`` until it is null.
+
+        Supports conditional requests: the response carries an ``ETag``
+        (per page) and a matching ``If-None-Match`` yields ``304 Not
+        Modified`` without loading any homes.
+
         Returns:
             JSON with ``homes`` array containing id, name, state,
-            subdomain, tunnel_status.
+            subdomain, tunnel_status, and ``next_cursor``.
         """
         result = _authenticate(required_scopes=['smarthome:read'])
         if isinstance(result, Response):
@@ -171,9 +195,20 @@ class HAIntegrationController(Controller):
         if not workspace:
             return _json_error('Forbidden', 'No access to this workspace', 403)
 
-        homes = request.env['woow_paas_platform.smart_home'].sudo().search([
-            ('workspace_id', '=', workspace.id),
-        ])
+        SmartHome = request.env['woow_paas_platform.smart_home'].sudo()
+        home_domain = [('workspace_id', '=', workspace.id)]
+        limit = kwargs.get('limit')
+        cursor = kwargs.get('cursor')
+        etag = '"%s"' % combine_version_tokens(
+            get_version_token(SmartHome, home_domain), cursor or '', str(limit or ''),
+        )
+        if _etag_not_modified(etag):
+            return Response(status=304, headers={'ETag': etag})
+
+        try:
+            homes, next_cursor = paginate(SmartHome, home_domain, HOME_PAGE_ORDER, limit, cursor)
+        except InvalidCursor:
+            return _json_error('Bad Request', 'Invalid cursor')
         data = [
             {
                 'id': h.id,
@@ -184,7 +219,9 @@ class HAIntegrationController(Controller):
             }
             for h in homes
         ]
-        return _json_response({'homes': data})
+        response = _json_response({'homes': data, 'next_cursor': next_cursor})
+        response.headers['ETag'] = etag
+        return response
 
     # ==================== Single Home Detail ====================
 
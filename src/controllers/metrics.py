@@ -0,0 +1,64 @@
+"""PaaS Operator metrics ingest controller.
+
+Receives batched pod resource samples pushed by the PaaS Operator's
+metrics sampler and stores them as service usage series.
+"""
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+from typing import Any
+
+from odoo.http import Controller, Response, request, route
+
+from .ha_api import _json_error, _json_response
+
+_logger = logging.getLogger(__name__)
+
+# Upper bound on samples accepted in one push
+INGEST_MAX_SAMPLES = 5000
+
+
+class OperatorMetricsController(Controller):
+    """Endpoints called by the PaaS Operator.
+
+    Authenticated with the same API key Odoo uses to call the operator
+    (``woow_paas_platform.operator_api_key``), sent as ``X-API-Key``.
+    """
+
+    @route(
+        '/api/paas/metrics/ingest',
+        type='http', auth='none', methods=['POST'], csrf=False,
+    )
+    def ingest_metrics(self, **kwargs: Any) -> Response:
+        """Store a batch of per-release CPU/memory samples.
+
+        Body: ``{"samples": [{namespace, release, timestamp,
+        cpu_millicores, memory_bytes, pods}, ...]}``
+
+        Returns:
+            JSON with ``accepted`` and ``unknown`` sample counts.
+        """
+        api_key = request.env['ir.config_parameter'].sudo().get_param(
+            'woow_paas_platform.operator_api_key', '',
+        )
+        provided = request.httprequest.headers.get('X-API-Key', '')
+        if not api_key or not hmac.compare_digest(provided.encode(), api_key.encode()):
+            return _json_error('Unauthorized', 'Invalid API key', 401)
+
+        try:
+            payload = json.loads(request.httprequest.get_data() or b'{}')
+        except ValueError:
+            return _json_error('Bad Request', 'Body must be JSON')
+        samples = payload.get('samples') if isinstance(payload, dict) else None
+        if not isinstance(samples, list):
+            return _json_error('Bad Request', 'samples must be a list')
+        if len(samples) > INGEST_MAX_SAMPLES:
+            return _json_error('Bad Request', f'At most {INGEST_MAX_SAMPLES} samples per request', 413)
+
+        samples = [s for s in samples if isinstance(s, dict)]
+        result = request.env['woow_paas_platform.service_usage_series'].sudo()._ingest_samples(samples)
+        if result['unknown']:
+            _logger.debug("Ignored %d usage samples for unknown releases", result['unknown'])
+        return _json_response(result)
@@ -10,18 +10,40 @@ from typing import Any
 
 from odoo.http import request, route, Controller
 
+from ..models.cloud_service import SERVICE_TRANSITIONAL_STATES, deep_merge, unflatten_dotpath_keys
+from ..models.service_usage_series import USAGE_PERIODS
 from ..models.workspace_access import (
     ROLE_OWNER, ROLE_ADMIN, ROLE_USER,
     ASSIGNABLE_ROLES,
 )
+from ..services.list_version import get_version_token, combine_version_tokens
+from ..services.pagination import InvalidCursor, paginate, paginate_entries
 from ..services.paas_operator import (
     get_paas_operator_client,
+    run_operator_batch,
+    BATCH_MAX_WORKERS,
     PaaSOperatorError,
     PaaSOperatorConnectionError,
 )
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of items accepted by a single batch service request
+BATCH_MAX_ITEMS = 500
+
+# Keyset pagination sort keys (field, descending); see services/pagination.py
+WORKSPACE_PAGE_ORDER = [('create_date', True), ('id', True)]
+MEMBER_PAGE_ORDER = [('role', True), ('create_date', True), ('id', True)]
+TEMPLATE_PAGE_ORDER = [('name', False), ('id', False)]
+SERVICE_PAGE_ORDER = [('create_date', True), ('id', True)]
+SMART_HOME_PAGE_ORDER = [('create_date', True), ('id', True)]
+BATCH_ACTIONS = ('batch_create', 'batch_upgrade', 'batch_delete', 'batch_rollback')
+
+# Workspace dashboard: number of recent tasks embedded, and the stage names
+# counted as finished (same rule as /api/support/stats)
+DASHBOARD_RECENT_TASKS = 5
+DONE_STAGE_NAMES = ('Done', 'Cancelled')
+
 
 class PaasController(Controller):
     @route("/woow", auth="user", website=False)
@@ -68,7 +90,7 @@ class PaasController(Controller):
     # ==================== Workspace API ====================
 
     @route("/api/workspaces", auth="user", methods=["POST"], type="json")
-    def api_workspace(self, action: str = 'list', name: str | None = None, description: str | None = None, **kwargs: Any) -> dict[str, Any]:
+    def api_workspace(self, action: str = 'list', name: str | None = None, description: str | None = None, list_version: str | None = None, items: list[Any] | None = None, create_namespaces: bool = False, limit: int | None = None, cursor: str | None = None, **kwargs: Any) -> dict[str, Any]:
         """
         Handle workspace collection operations via JSON-RPC.
 
@@ -76,8 +98,17 @@ class PaasController(Controller):
             action (str): Operation type. One of:
                 - 'list': Get all accessible workspaces
                 - 'create': Create a new workspace
+                - 'bulk_create': Provision many workspaces (system admins only)
             name (str, optional): Workspace name (required for create)
             description (str, optional): Workspace description
+            list_version (str, optional): Version token from a previous
+                list response; if unchanged, no data is returned
+            items (list, optional): For bulk_create, dicts with name and
+                optional description and owner_id
+            create_namespaces (bool): For bulk_create, also pre-create the
+                K8s namespaces through the operator
+            limit (int, optional): Page size (for list)
+            cursor (str, optional): ``next_cursor`` of the previous page (for list)
             **kwargs: Additional parameters (ignored)
 
         Returns:
@@ -86,11 +117,22 @@ class PaasController(Controller):
                 - data (dict|list): Result data (on success)
                 - error (str): Error message (on failure)
                 - count (int): Item count (for list operations)
+                - next_cursor (str|None): Cursor of the next page (for list operations)
+                - list_version (str): List version token (for list operations)
+                - not_modified (bool): True when ``list_version`` still matches
         """
         if action == 'list':
-            return self._list_workspaces()
+            return self._list_workspaces(list_version, limit, cursor)
         elif action == 'create':
             return self._create_workspace(name, description)
+        elif action == 'bulk_create':
+            if not request.env.user.has_group('base.group_system'):
+                return {'success': False, 'error': 'Permission denied'}
+            if not items or not isinstance(items, list):
+                return {'success': False, 'error': 'Items are required'}
+            if len(items) > BATCH_MAX_ITEMS:
+                return {'success': False, 'error': f'Too many items (maximum {BATCH_MAX_ITEMS})'}
+            return self._bulk_create_workspaces(items, bool(create_namespaces))
         else:
             return {'success': False, 'error': f'Unknown action: {action}'}
 
@@ -124,12 +166,30 @@ class PaasController(Controller):
         else:
             return {'success': False, 'error': f'Unknown action: {action}'}
 
-    def _list_workspaces(self) -> dict[str, Any]:
+    @route("/api/workspaces/<int:workspace_id>/dashboard", auth="user", methods=["POST"], type="json")
+    def api_workspace_dashboard(self, workspace_id: int, limit: int | None = None, **kwargs: Any) -> dict[str, Any]:
+        """
+        Get the aggregated workspace dashboard via JSON-RPC.
+
+        Args:
+            workspace_id (int): Target workspace ID (from URL path)
+            limit (int, optional): Page size for the embedded service list
+            **kwargs: Additional parameters (ignored)
+
+        Returns:
+            dict: JSON response, see ``_get_workspace_dashboard``
+        """
+        return self._get_workspace_dashboard(workspace_id, limit)
+
+    def _list_workspaces(self, list_version: str | None = None, limit: int | None = None, cursor: str | None = None) -> dict[str, Any]:
         """
         Get all workspaces accessible by the current user.
 
         Queries workspace_access records to find all workspaces where
         the current user has any access level and the workspace is active.
+        Answers ``not_modified`` without loading records when
+        ``list_version`` matches the current version token. Results are
+        paged newest first; pass ``next_cursor`` back as ``cursor``.
 
         Returns:
             dict: Response containing:
@@ -140,30 +200,47 @@ class PaasController(Controller):
                     - member_count: Total number of members
                     - is_owner: Whether current user owns this workspace
                     - created_date: ISO format creation timestamp
-                - count (int): Number of workspaces
+                - count (int): Number of workspaces in this page
+                - next_cursor (str|None): Cursor of the next page
+                - list_version (str): List version token
         """
         user = request.env.user
+        Workspace = request.env['woow_paas_platform.workspace']
         WorkspaceAccess = request.env['woow_paas_platform.workspace_access']
 
-        # Find all workspaces where user has access
-        access_records = WorkspaceAccess.search([
-            ('user_id', '=', user.id),
-            ('workspace_id.state', '=', 'active'),
-        ])
+        # Workspaces and their member lists (role, member_count) feed the payload
+        version_token = combine_version_tokens(
+            get_version_token(Workspace, [
+                ('access_ids.user_id', '=', user.id),
+                ('state', '=', 'active'),
+            ]),
+            get_version_token(WorkspaceAccess, [
+                ('workspace_id.access_ids.user_id', '=', user.id),
+                ('workspace_id.state', '=', 'active'),
+            ]),
+        )
+        if list_version and not cursor and list_version == version_token:
+            return {'success': True, 'not_modified': True, 'list_version': version_token}
 
-        # Prefetch related workspace data to avoid N+1 queries
-        access_records.mapped('workspace_id')
+        # Find workspaces where user has access
+        try:
+            page, next_cursor = paginate(Workspace, [
+                ('access_ids.user_id', '=', user.id),
+                ('state', '=', 'active'),
+            ], WORKSPACE_PAGE_ORDER, limit, cursor)
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
+        roles = page.get_user_roles(user)
 
         workspaces = []
-        for access in access_records:
-            ws = access.workspace_id
+        for ws in page:
             workspaces.append({
                 'id': ws.id,
                 'name': ws.name,
                 'description': ws.description or '',
                 'slug': ws.slug,
                 'state': ws.state,
-                'role': access.role,
+                'role': roles.get(ws.id),
                 'member_count': ws.member_count,
                 'is_owner': ws.owner_id.id == user.id,
                 'created_date': ws.create_date.isoformat() if ws.create_date else None,
@@ -173,6 +250,8 @@ class PaasController(Controller):
             'success': True,
             'data': workspaces,
             'count': len(workspaces),
+            'next_cursor': next_cursor,
+            'list_version': version_token,
         }
 
     def _create_workspace(self, name: str | None, description: str | None) -> dict[str, Any]:
@@ -227,6 +306,81 @@ class PaasController(Controller):
             _logger.error("Error creating workspace: %s\n%s", str(e), traceback.format_exc())
             return {'success': False, 'error': 'An error occurred while creating the workspace. Please try again.'}
 
+    def _bulk_create_workspaces(self, items: list[Any], create_namespaces: bool) -> dict[str, Any]:
+        """
+        Provision many workspaces in one transaction.
+
+        All items are validated first; nothing is created if any item is
+        invalid. Namespace failures do not roll back the workspaces, the
+        namespace is created again on the first deploy.
+
+        Args:
+            items (list): Dicts with name, optional description and owner_id
+                (defaults to the current user)
+            create_namespaces (bool): Pre-create K8s namespaces concurrently
+
+        Returns:
+            dict: Batch envelope with per-item ``workspace_id``, ``slug``
+                and ``namespace_error`` (if namespace creation failed)
+        """
+        user = request.env.user
+        vals_list = []
+        errors = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors[index] = 'Item must be an object'
+                continue
+            item_name = (item.get('name') or '').strip()
+            if not item_name:
+                errors[index] = 'Workspace name is required'
+                continue
+            try:
+                owner_id = int(item.get('owner_id') or user.id)
+            except (TypeError, ValueError):
+                errors[index] = 'Invalid owner_id'
+                continue
+            vals_list.append((index, {
+                'name': item_name,
+                'description': (item.get('description') or '').strip(),
+                'owner_id': owner_id,
+            }))
+
+        owner_ids = {vals['owner_id'] for _index, vals in vals_list}
+        existing_owners = set(request.env['res.users'].sudo().browse(owner_ids).exists().ids)
+        for index, vals in vals_list:
+            if vals['owner_id'] not in existing_owners:
+                errors[index] = 'Owner not found'
+
+        if errors:
+            return {
+                'success': False,
+                'error': f'Batch validation failed for {len(errors)} item(s); nothing was created',
+                'data': [
+                    {'index': index, 'success': False, 'error': error}
+                    for index, error in sorted(errors.items())
+                ],
+            }
+
+        workspaces, namespace_errors = request.env['woow_paas_platform.workspace'].sudo().provision_workspaces(
+            [vals for _index, vals in vals_list],
+            create_namespaces=create_namespaces,
+            max_workers=self._get_batch_max_workers(),
+        )
+
+        results = []
+        for (index, _vals), workspace in zip(vals_list, workspaces):
+            result = {
+                'index': index,
+                'success': True,
+                'workspace_id': workspace.id,
+                'name': workspace.name,
+                'slug': workspace.slug,
+            }
+            if workspace.id in namespace_errors:
+                result['namespace_error'] = namespace_errors[workspace.id]
+            results.append(result)
+        return self._batch_response(results)
+
     def _get_workspace(self, workspace_id: int) -> dict[str, Any]:
         """
         Get detailed information for a specific workspace.
@@ -272,24 +426,141 @@ class PaasController(Controller):
         if not access:
             return {'success': False, 'error': 'Workspace not found or access denied'}
 
+        return {
+            'success': True,
+            'data': self._format_workspace_detail(workspace, access.role, user),
+        }
+
+    def _format_workspace_detail(self, workspace: Any, role: str, user: Any) -> dict[str, Any]:
+        """Serialize a workspace for the detail views."""
+        return {
+            'id': workspace.id,
+            'name': workspace.name,
+            'description': workspace.description or '',
+            'slug': workspace.slug,
+            'state': workspace.state,
+            'role': role,
+            'member_count': workspace.member_count,
+            'is_owner': workspace.owner_id.id == user.id,
+            'owner': {
+                'id': workspace.owner_id.id,
+                'name': workspace.owner_id.name,
+                'email': workspace.owner_id.email,
+            },
+            'created_date': workspace.create_date.isoformat() if workspace.create_date else None,
+        }
+
+    def _get_workspace_dashboard(self, workspace_id: int, limit: int | None = None) -> dict[str, Any]:
+        """
+        Aggregate everything the workspace detail page shows on first paint.
+
+        Replaces the separate workspace / services / smart homes / support
+        stats round trips with one call. Counts and resource totals come
+        from grouped reads, and the lists are bounded (first page of
+        services and of smart homes, a handful of recent tasks), so neither
+        the number of queries nor the payload grows with the size of the
+        workspace.
+
+        Args:
+            workspace_id (int): Target workspace ID
+            limit (int, optional): Page size for the embedded service and
+                smart home lists
+
+        Returns:
+            dict: Response containing:
+                - success (bool): True on success
+                - data (dict):
+                    - workspace: Same payload as action 'get'
+                    - services: items, next_cursor, list_version, total,
+                      by_state, resources (vcpu, ram_gb, storage_gb)
+                    - smart_homes: items, next_cursor, total, by_tunnel_status
+                    - support: total, active, completion, recent_tasks
+                - error (str): Error message (on failure)
+        """
+        try:
+            workspace_id = int(workspace_id)
+        except (TypeError, ValueError):
+            return {'success': False, 'error': 'Workspace not found or access denied'}
+
+        user = request.env.user
+        workspace = request.env['woow_paas_platform.workspace'].browse(workspace_id)
+        role = workspace.get_user_role(user)
+        if not role or not workspace.exists():
+            return {'success': False, 'error': 'Workspace not found or access denied'}
+
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        service_domain = [('workspace_id', '=', workspace.id)]
+        by_state = {}
+        resources = {'vcpu': 0, 'ram_gb': 0.0, 'storage_gb': 0}
+        for state, count, vcpu, ram_gb, storage_gb in CloudService._read_group(
+            service_domain, ['state'],
+            ['__count', 'allocated_vcpu:sum', 'allocated_ram_gb:sum', 'allocated_storage_gb:sum'],
+        ):
+            by_state[state] = count
+            resources['vcpu'] += vcpu or 0
+            resources['ram_gb'] += ram_gb or 0.0
+            resources['storage_gb'] += storage_gb or 0
+        # Transitional states are advanced by the status refresh cron and
+        # pushed over the bus, so the first page is served as stored.
+        services, services_cursor = paginate(CloudService, service_domain, SERVICE_PAGE_ORDER, limit)
+
+        SmartHome = request.env['woow_paas_platform.smart_home']
+        home_domain = [('workspace_id', '=', workspace.id)]
+        homes, homes_cursor = paginate(SmartHome, home_domain, SMART_HOME_PAGE_ORDER, limit)
+        by_tunnel_status = {
+            status or 'unknown': count
+            for status, count in SmartHome._read_group(home_domain, ['tunnel_status'], ['__count'])
+        }
+
+        Task = request.env['project.task'].sudo()
+        task_domain = [('project_id.cloud_service_id.workspace_id', '=', workspace.id)]
+        total_tasks = done_tasks = 0
+        for stage, count in Task._read_group(task_domain, ['stage_id'], ['__count']):
+            total_tasks += count
+            if stage.name in DONE_STAGE_NAMES:
+                done_tasks += count
+        recent_tasks = Task.search_read(
+            task_domain,
+            ['name', 'project_id', 'stage_id', 'priority', 'date_deadline', 'create_date'],
+            order='create_date desc, id desc',
+            limit=DASHBOARD_RECENT_TASKS,
+        )
+
         return {
             'success': True,
             'data': {
-                'id': workspace.id,
-                'name': workspace.name,
-                'description': workspace.description or '',
-                'slug': workspace.slug,
-                'state': workspace.state,
-                'role': access.role,
-                'member_count': workspace.member_count,
-                'is_owner': workspace.owner_id.id == user.id,
-                'owner': {
-                    'id': workspace.owner_id.id,
-                    'name': workspace.owner_id.name,
-                    'email': workspace.owner_id.email,
+                'workspace': self._format_workspace_detail(workspace, role, user),
+                'services': {
+                    'items': [self._format_service(svc) for svc in services],
+                    'next_cursor': services_cursor,
+                    'list_version': self._services_version_token(workspace),
+                    'total': sum(by_state.values()),
+                    'by_state': by_state,
+                    'resources': resources,
                 },
-                'created_date': workspace.create_date.isoformat() if workspace.create_date else None,
-            }
+                'smart_homes': {
+                    'items': [home.to_dict() for home in homes],
+                    'next_cursor': homes_cursor,
+                    'total': sum(by_tunnel_status.values()),
+                    'by_tunnel_status': by_tunnel_status,
+                },
+                'support': {
+                    'total': total_tasks,
+                    'active': total_tasks - done_tasks,
+                    'completion': round((done_tasks / total_tasks) * 100) if total_tasks else 0,
+                    'recent_tasks': [{
+                        'id': task['id'],
+                        'name': task['name'],
+                        'project_id': task['project_id'][0] if task['project_id'] else None,
+                        'project_name': task['project_id'][1] if task['project_id'] else None,
+                        'stage_id': task['stage_id'][0] if task['stage_id'] else None,
+                        'stage_name': task['stage_id'][1] if task['stage_id'] else None,
+                        'priority': task['priority'] or '0',
+                        'date_deadline': task['date_deadline'].isoformat() if task['date_deadline'] else None,
+                        'created_date': task['create_date'].isoformat() if task['create_date'] else None,
+                    } for task in recent_tasks],
+                },
+            },
         }
 
     def _update_workspace(self, workspace_id: int, name: str | None, description: str | None) -> dict[str, Any]:
@@ -401,7 +672,7 @@ class PaasController(Controller):
     # ==================== Workspace Members API ====================
 
     @route("/api/workspaces/<int:workspace_id>/members", auth="user", methods=["POST"], type="json")
-    def api_workspace_members(self, workspace_id: int, action: str = 'list', email: str | None = None, role: str | None = None, **kwargs: Any) -> dict[str, Any]:
+    def api_workspace_members(self, workspace_id: int, action: str = 'list', email: str | None = None, role: str | None = None, limit: int | None = None, cursor: str | None = None, **kwargs: Any) -> dict[str, Any]:
         """
         Handle workspace member collection operations via JSON-RPC.
 
@@ -410,12 +681,14 @@ class PaasController(Controller):
             action (str): Operation type - 'list' or 'invite'
             email (str, optional): User email to invite (for invite)
             role (str, optional): Role to assign ('admin', 'user', 'guest')
+            limit (int, optional): Page size (for list)
+            cursor (str, optional): ``next_cursor`` of the previous page (for list)
 
         Returns:
             dict: JSON response with success/error structure
         """
         if action == 'list':
-            return self._list_members(workspace_id)
+            return self._list_members(workspace_id, limit, cursor)
         elif action == 'invite':
             return self._invite_member(workspace_id, email, role)
         else:
@@ -442,14 +715,16 @@ class PaasController(Controller):
         else:
             return {'success': False, 'error': f'Unknown action: {action}'}
 
-    def _list_members(self, workspace_id: int) -> dict[str, Any]:
+    def _list_members(self, workspace_id: int, limit: int | None = None, cursor: str | None = None) -> dict[str, Any]:
         """
-        Get all members of a workspace.
+        Get the members of a workspace, one page at a time.
 
         Any user with access to the workspace can list its members.
 
         Args:
             workspace_id (int): Target workspace ID
+            limit (int, optional): Page size
+            cursor (str, optional): ``next_cursor`` of the previous page
 
         Returns:
             dict: Response containing:
@@ -462,10 +737,12 @@ class PaasController(Controller):
                     - role: Member's role (owner/admin/user/guest)
                     - invited_by: Name of user who invited this member
                     - invited_date: ISO timestamp of invitation
-                - count (int): Number of members
+                - count (int): Number of members in this page
+                - next_cursor (str|None): Cursor of the next page
 
         Errors:
             - 'Workspace not found or access denied' if ID doesn't exist or no access
+            - 'Invalid cursor' if cursor cannot be decoded
         """
         user = request.env.user
         Workspace = request.env['woow_paas_platform.workspace']
@@ -477,8 +754,17 @@ class PaasController(Controller):
         if not access:
             return {'success': False, 'error': 'Workspace not found or access denied'}
 
+        try:
+            page, next_cursor = paginate(
+                request.env['woow_paas_platform.workspace_access'],
+                [('workspace_id', '=', workspace.id)],
+                MEMBER_PAGE_ORDER, limit, cursor,
+            )
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
+
         members = []
-        for member_access in workspace.access_ids:
+        for member_access in page:
             members.append({
                 'id': member_access.id,
                 'user_id': member_access.user_id.id,
@@ -493,6 +779,7 @@ class PaasController(Controller):
             'success': True,
             'data': members,
             'count': len(members),
+            'next_cursor': next_cursor,
         }
 
     def _invite_member(self, workspace_id: int, email: str | None, role: str | None) -> dict[str, Any]:
@@ -689,43 +976,45 @@ class PaasController(Controller):
     # ==================== Cloud Templates API ====================
 
     @route("/api/cloud/templates", auth="user", methods=["POST"], type="json")
-    def api_cloud_templates(self, category: str | None = None, search: str | None = None, **kw: Any) -> dict[str, Any]:
+    def api_cloud_templates(self, category: str | None = None, search: str | None = None, limit: int | None = None, cursor: str | None = None, **kw: Any) -> dict[str, Any]:
         """
-        List available cloud application templates.
+        List available cloud application templates, one page at a time.
+
+        Served from the cached, pre-serialized catalog of the model (see
+        ``cloud_app_template._get_catalog``), so repeated marketplace visits
+        do not hit the database.
 
         Args:
             category (str, optional): Filter by category
             search (str, optional): Search in name/description
+            limit (int, optional): Page size
+            cursor (str, optional): ``next_cursor`` of the previous page
 
         Returns:
             dict: Response containing:
                 - success (bool): True on success
                 - data (list): List of template objects
-                - count (int): Number of templates
+                - count (int): Number of templates in this page
+                - next_cursor (str|None): Cursor of the next page
+                - facets (dict): Number of templates per category for
+                  ``search``, regardless of ``category``
         """
         CloudAppTemplate = request.env['woow_paas_platform.cloud_app_template']
+        category = category or None
+        search = (search or '').strip() or None
 
-        domain = [('is_active', '=', True)]
-
-        if category:
-            domain.append(('category', '=', category))
-
-        if search:
-            search = search.strip()
-            domain.append('|')
-            domain.append(('name', 'ilike', search))
-            domain.append(('description', 'ilike', search))
-
-        templates = CloudAppTemplate.search(domain)
-
-        data = []
-        for tmpl in templates:
-            data.append(self._format_template(tmpl))
+        catalog = CloudAppTemplate._search_catalog(category, search)
+        try:
+            data, next_cursor = paginate_entries(CloudAppTemplate, catalog, TEMPLATE_PAGE_ORDER, limit, cursor)
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
 
         return {
             'success': True,
-            'data': data,
+            'data': list(data),
             'count': len(data),
+            'next_cursor': next_cursor,
+            'facets': CloudAppTemplate._get_catalog_facets(search),
         }
 
     @route("/api/cloud/templates/<int:template_id>", auth="user", methods=["POST"], type="json")
@@ -755,25 +1044,11 @@ class PaasController(Controller):
 
     def _format_template(self, template: Any, include_values: bool = False) -> dict[str, Any]:
         """Format a template record for API response."""
-        data = {
-            'id': template.id,
-            'name': template.name,
-            'slug': template.slug or '',
-            'description': template.description or '',
-            'category': template.category,
-            'tags': json.loads(template.tags) if template.tags else [],
-            'monthly_price': template.monthly_price,
-            'documentation_url': template.documentation_url or '',
-            'default_port': template.default_port,
-            'ingress_enabled': template.ingress_enabled,
-            'min_vcpu': template.min_vcpu,
-            'min_ram_gb': template.min_ram_gb,
-            'min_storage_gb': template.min_storage_gb,
-        }
+        data = template._catalog_entry()
         if include_values:
             data['helm_chart_name'] = template.helm_chart_name
             data['helm_chart_version'] = template.helm_chart_version
-            data['helm_default_values'] = json.loads(template.helm_default_values) if template.helm_default_values else {}
+            data['helm_default_values'] = template._get_json_field('helm_default_values', {})
             data['helm_value_specs'] = self._parse_helm_value_specs(template)
             data['full_description'] = template.full_description or ''
         return data
@@ -781,21 +1056,40 @@ class PaasController(Controller):
     # ==================== Cloud Services API ====================
 
     @route("/api/workspaces/<int:workspace_id>/services", auth="user", methods=["POST"], type="json")
-    def api_workspace_services(self, workspace_id: int, action: str = 'list', template_id: int | None = None, name: str | None = None, values: dict[str, Any] | None = None, **kw: Any) -> dict[str, Any]:
+    def api_workspace_services(self, workspace_id: int, action: str = 'list', template_id: int | None = None, name: str | None = None, values: dict[str, Any] | None = None, items: list[Any] | None = None, version: str | None = None, list_version: str | None = None, limit: int | None = None, cursor: str | None = None, **kw: Any) -> dict[str, Any]:
         """
         Handle cloud service operations for a workspace.
 
+        Batch actions validate every item before touching the database or
+        the operator; if any item is invalid nothing is executed and the
+        per-item errors are returned in ``data``.
+
         Args:
             workspace_id (int): Workspace ID
-            action (str): 'list' or 'create'
+            action (str): 'list', 'create', 'batch_create', 'batch_upgrade',
+                'batch_delete' or 'batch_rollback'
             template_id (int, optional): Template ID (for create)
             name (str, optional): Service name (for create)
-            values (dict, optional): Helm values override (for create)
+            values (dict, optional): Helm values override (for create, or
+                default for batch_upgrade items)
+            version (str, optional): Default chart version for batch_upgrade
+            list_version (str, optional): Version token from a previous list
+                response; if unchanged, no data is returned (for list)
+            limit (int, optional): Page size (for list)
+            cursor (str, optional): ``next_cursor`` of the previous page (for list)
+            items (list, optional): Batch items. batch_create items are
+                ``{template_id, name, values}``; other batch actions accept
+                service IDs or ``{service_id, values, version, revision}``
 
         Returns:
             dict: Response containing:
                 - success (bool): True on success
-                - data (dict|list): Service(s) data
+                - data (dict|list): Service(s) data, or per-item results
+                  ``{index, service_id, success, data|error}`` for batches
+                - count/succeeded/failed (int): Batch totals
+                - next_cursor (str|None): Cursor of the next page (for list)
+                - list_version (str): List version token (for list)
+                - not_modified (bool): True when the list is unchanged
                 - error (str): Error message (on failure)
         """
         # Validate workspace access
@@ -811,12 +1105,26 @@ class PaasController(Controller):
             return {'success': False, 'error': 'Workspace not found or access denied'}
 
         if action == 'list':
-            return self._list_services(workspace)
+            return self._list_services(workspace, list_version, limit, cursor)
         elif action == 'create':
             # Only admin/owner can create services
             if access.role not in [ROLE_OWNER, ROLE_ADMIN]:
                 return {'success': False, 'error': 'Permission denied'}
             return self._create_service(workspace, template_id, name, values)
+        elif action in BATCH_ACTIONS:
+            if access.role not in [ROLE_OWNER, ROLE_ADMIN]:
+                return {'success': False, 'error': 'Permission denied'}
+            if not items or not isinstance(items, list):
+                return {'success': False, 'error': 'Items are required'}
+            if len(items) > BATCH_MAX_ITEMS:
+                return {'success': False, 'error': f'Too many items (maximum {BATCH_MAX_ITEMS})'}
+            if action == 'batch_create':
+                return self._batch_create_services(workspace, items)
+            if action == 'batch_upgrade':
+                return self._batch_upgrade_services(workspace, items, values, version)
+            if action == 'batch_delete':
+                return self._batch_delete_services(workspace, items)
+            return self._batch_rollback_services(workspace, items)
         else:
             return {'success': False, 'error': f'Unknown action: {action}'}
 
@@ -947,6 +1255,51 @@ class PaasController(Controller):
 
         return self._get_service_revisions(service)
 
+    @route("/api/workspaces/<int:workspace_id>/services/<int:service_id>/usage", auth="user", methods=["POST"], type="json")
+    def api_service_usage(self, workspace_id: int, service_id: int, period: str = '7d', **kw: Any) -> dict[str, Any]:
+        """
+        Get CPU/memory usage percentiles of a service for capacity planning.
+
+        Args:
+            workspace_id (int): Workspace ID
+            service_id (int): Service ID
+            period (str): '24h', '7d', '30d' or '90d'
+
+        Returns:
+            dict: Response containing:
+                - success (bool): True on success
+                - data (dict): Percentiles (p50/p90/p95/p99/max) of
+                  cpu_millicores and memory_mb, plus the allocation
+                - error (str): Error message (on failure)
+        """
+        if period not in USAGE_PERIODS:
+            return {'success': False, 'error': f'Invalid period: {period}'}
+
+        # Validate workspace and service access
+        user = request.env.user
+        Workspace = request.env['woow_paas_platform.workspace']
+        CloudService = request.env['woow_paas_platform.cloud_service']
+
+        workspace = Workspace.browse(workspace_id)
+        if not workspace.exists():
+            return {'success': False, 'error': 'Workspace not found or access denied'}
+
+        access = workspace.check_user_access(user)
+        if not access:
+            return {'success': False, 'error': 'Workspace not found or access denied'}
+
+        service = CloudService.browse(service_id)
+        if not service.exists() or service.workspace_id.id != workspace_id:
+            return {'success': False, 'error': 'Service not found'}
+
+        usage = request.env['woow_paas_platform.service_usage_series'].sudo()._usage_summary(service, period)
+        usage['allocated'] = {
+            'vcpu': service.allocated_vcpu,
+            'ram_gb': service.allocated_ram_gb,
+            'storage_gb': service.allocated_storage_gb,
+        }
+        return {'success': True, 'data': usage}
+
     # ==================== MCP Server API (per-service) ====================
 
     @route(
@@ -1122,54 +1475,20 @@ class PaasController(Controller):
 
     # ==================== Cloud Service Helpers ====================
 
-    @staticmethod
-    def _unflatten_dotpath_keys(flat_dict: dict[str, Any]) -> dict[str, Any]:
-        """Convert flat dot-path keys to nested dict structure.
-
-        Example: {"a.b.c": 1, "a.b.d": 2} → {"a": {"b": {"c": 1, "d": 2}}}
-        Keys without dots are kept as-is.
-        """
-        result = {}
-        for key, value in flat_dict.items():
-            parts = key.split('.')
-            if len(parts) == 1:
-                result[key] = value
-                continue
-            d = result
-            for part in parts[:-1]:
-                if part not in d or not isinstance(d[part], dict):
-                    d[part] = {}
-                d = d[part]
-            d[parts[-1]] = value
-        return result
-
-    @staticmethod
-    def _deep_merge(base: dict, override: dict) -> dict:
-        """Deep merge override into base. Override values win on conflict."""
-        result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = PaasController._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        return result
-
     def _parse_helm_value_specs(self, template: Any) -> dict[str, list]:
         """Parse helm_value_specs JSON from a template record.
 
+        Uses the per-process parsed-JSON cache; treat the result as read-only.
+
         Args:
             template: CloudAppTemplate record
 
         Returns:
             dict with 'required' and 'optional' lists, or empty dict if no specs
         """
-        if not template or not template.helm_value_specs:
-            return {}
-        try:
-            return json.loads(template.helm_value_specs)
-        except (json.JSONDecodeError, TypeError):
-            _logger.warning("Invalid helm_value_specs for template %s", template.name)
+        if not template:
             return {}
+        return template._get_json_field('helm_value_specs', {})
 
     @staticmethod
     def _sanitize_helm_values(values: dict, template: Any) -> dict:
@@ -1354,53 +1673,109 @@ class PaasController(Controller):
 
         return filtered, rejected
 
-    def _list_services(self, workspace: Any) -> dict[str, Any]:
-        """List all services in a workspace."""
+    def _list_services(self, workspace: Any, list_version: str | None = None, limit: int | None = None, cursor: str | None = None) -> dict[str, Any]:
+        """List the services in a workspace, one page at a time (newest first).
+
+        Answers ``not_modified`` without loading records when
+        ``list_version`` matches; transitional states are advanced by the status refresh
+        cron, so skipping the refresh below does not stall them. The version token
+        covers the whole list, so it is only checked on the first page.
+        """
         CloudService = request.env['woow_paas_platform.cloud_service']
+        domain = [('workspace_id', '=', workspace.id)]
 
-        services = CloudService.search([
-            ('workspace_id', '=', workspace.id),
-        ])
+        version_token = self._services_version_token(workspace)
+        if list_version and not cursor and list_version == version_token:
+            return {'success': True, 'not_modified': True, 'list_version': version_token}
 
-        # Update status for services in transitional states
-        transitional_states = ('deploying', 'initializing', 'upgrading', 'deleting')
-        for svc in services:
-            if svc.state in transitional_states:
-                try:
-                    self._update_service_status(svc)
-                except Exception as e:
-                    _logger.warning("Failed to update status for service %s: %s", svc.name, e)
+        try:
+            services, next_cursor = paginate(CloudService, domain, SERVICE_PAGE_ORDER, limit, cursor)
+        except InvalidCursor:
+            return {'success': False, 'error': 'Invalid cursor'}
 
-        # Re-read after status updates
-        services = CloudService.search([
-            ('workspace_id', '=', workspace.id),
-        ])
+        # Update status for services in transitional states
+        transitional = services.filtered(lambda svc: svc.state in SERVICE_TRANSITIONAL_STATES)
+        if transitional:
+            transitional._refresh_operator_status()
+            # Re-read after status updates
+            services.invalidate_recordset()
+            version_token = self._services_version_token(workspace)
 
-        data = [self._format_service(svc) for svc in services]
+        data = [self._format_service(svc) for svc in services.exists()]
 
         return {
             'success': True,
             'data': data,
             'count': len(data),
+            'next_cursor': next_cursor,
+            # Recomputed: the status refresh above may have written
+            'list_version': version_token,
         }
 
+    def _services_version_token(self, workspace: Any) -> str:
+        """Version token for the service list of a workspace."""
+        return combine_version_tokens(
+            get_version_token(request.env['woow_paas_platform.cloud_service'], [
+                ('workspace_id', '=', workspace.id),
+            ]),
+            # Template details and has_project are part of each item
+            get_version_token(request.env['woow_paas_platform.cloud_app_template'], []),
+            get_version_token(request.env['project.project'], [
+                ('cloud_service_id.workspace_id', '=', workspace.id),
+            ]),
+        )
+
     def _create_service(self, workspace: Any, template_id: int | None, name: str | None, values: dict[str, Any] | None) -> dict[str, Any]:
         """Create a new cloud service."""
+        prepared, error = self._prepare_service(workspace, template_id, name, values)
+        if error:
+            return {'success': False, 'error': error}
+
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        try:
+            # Create service record in pending state
+            service = CloudService.create(prepared['vals'])
+
+            # Return immediately with pending state; deploy in background
+            service_data = self._format_service(service)
+
+            deploy_args = dict(prepared['deploy_args'], service_id=service.id)
+            self._start_background_after_commit(self._deploy_services_background, [deploy_args], 1)
+
+            return {
+                'success': True,
+                'data': service_data,
+            }
+
+        except Exception as e:
+            _logger.error("Error creating service: %s\n%s", str(e), traceback.format_exc())
+            return {'success': False, 'error': 'An error occurred while creating the service.'}
+
+    def _prepare_service(self, workspace: Any, template_id: int | None, name: str | None, values: dict[str, Any] | None) -> tuple[dict[str, Any] | None, str | None]:
+        """Validate a create request and build the record values and deploy args.
+
+        Nothing is written to the database here, so callers can validate a
+        whole batch before creating any record.
+
+        Returns:
+            tuple: (prepared, error) where prepared holds ``vals`` for
+                ``create()`` and ``deploy_args`` (without ``service_id``)
+                for the background deploy, or error is a message.
+        """
         if not template_id:
-            return {'success': False, 'error': 'Template ID is required'}
+            return None, 'Template ID is required'
         if not name:
-            return {'success': False, 'error': 'Service name is required'}
+            return None, 'Service name is required'
 
         name = name.strip()
         if not name:
-            return {'success': False, 'error': 'Service name is required'}
+            return None, 'Service name is required'
 
         CloudAppTemplate = request.env['woow_paas_platform.cloud_app_template']
-        CloudService = request.env['woow_paas_platform.cloud_service']
 
         template = CloudAppTemplate.browse(template_id)
         if not template.exists() or not template.is_active:
-            return {'success': False, 'error': 'Template not found'}
+            return None, 'Template not found'
 
         # Always generate reference_id server-side (never accept from frontend)
         reference_id = str(uuid.uuid4())
@@ -1412,7 +1787,7 @@ class PaasController(Controller):
 
         # Filter user values to only allowed keys, then merge with defaults
         # Note: silently filter on create (frontend may send defaults alongside user values)
-        default_values = json.loads(template.helm_default_values) if template.helm_default_values else {}
+        default_values = template._get_json_field('helm_default_values', {})
         filtered_user_values, _rejected = self._filter_allowed_helm_values(values, template)
 
         # Extract _init.* keys (not Helm values, used for post-deploy init)
@@ -1428,91 +1803,69 @@ class PaasController(Controller):
         if template.post_deploy_init_type == 'n8n':
             pwd = init_params.get('owner_password', '')
             if len(pwd) < 8:
-                return {'success': False, 'error': 'Password must be at least 8 characters'}
+                return None, 'Password must be at least 8 characters'
             if not any(c.isupper() for c in pwd):
-                return {'success': False, 'error': 'Password must contain at least one uppercase letter'}
+                return None, 'Password must contain at least one uppercase letter'
             if not any(c.islower() for c in pwd):
-                return {'success': False, 'error': 'Password must contain at least one lowercase letter'}
+                return None, 'Password must contain at least one lowercase letter'
             if not any(c.isdigit() for c in pwd):
-                return {'success': False, 'error': 'Password must contain at least one number'}
+                return None, 'Password must contain at least one number'
 
-        nested_user_values = self._unflatten_dotpath_keys(helm_only_values)
-        merged_values = self._deep_merge(default_values, nested_user_values)
+        nested_user_values = unflatten_dotpath_keys(helm_only_values)
+        merged_values = deep_merge(default_values, nested_user_values)
 
         # Generate per-service API key for MCP sidecar ↔ main container communication
         mcp_api_key = None
         if template.mcp_enabled and template.mcp_api_key_helm_path:
             mcp_api_key = str(uuid.uuid4())
             # Inject into Helm values at the configured dot-path
-            api_key_nested = self._unflatten_dotpath_keys(
+            api_key_nested = unflatten_dotpath_keys(
                 {template.mcp_api_key_helm_path: mcp_api_key}
             )
-            merged_values = self._deep_merge(merged_values, api_key_nested)
+            merged_values = deep_merge(merged_values, api_key_nested)
 
-        try:
-            # Create service record in pending state
-            service_vals = {
-                'workspace_id': workspace.id,
-                'template_id': template.id,
-                'name': name,
-                'reference_id': reference_id,
-                'state': 'pending',
+        service_vals = {
+            'workspace_id': workspace.id,
+            'template_id': template.id,
+            'name': name,
+            'reference_id': reference_id,
+            'state': 'pending',
+            'subdomain': subdomain,
+            'internal_port': template.default_port,
+            'helm_release_name': helm_release_name,
+            'helm_namespace': helm_namespace,
+            'helm_values': json.dumps(merged_values),
+            'helm_chart_version': template.helm_chart_version,
+            'allocated_vcpu': template.min_vcpu,
+            'allocated_ram_gb': template.min_ram_gb,
+            'allocated_storage_gb': template.min_storage_gb,
+        }
+        # Store init params for post-deploy initialization
+        if init_params.get('owner_email'):
+            service_vals['n8n_owner_email'] = init_params['owner_email']
+        if init_params.get('owner_password'):
+            service_vals['n8n_owner_password'] = init_params['owner_password']
+
+        # Build expose configuration before spawning background thread
+        expose_config = None
+        if template.ingress_enabled:
+            expose_config = {
+                'enabled': True,
                 'subdomain': subdomain,
-                'internal_port': template.default_port,
-                'helm_release_name': helm_release_name,
-                'helm_namespace': helm_namespace,
-                'helm_values': json.dumps(merged_values),
-                'helm_chart_version': template.helm_chart_version,
-                'allocated_vcpu': template.min_vcpu,
-                'allocated_ram_gb': template.min_ram_gb,
-                'allocated_storage_gb': template.min_storage_gb,
-            }
-            # Store init params for post-deploy initialization
-            if init_params.get('owner_email'):
-                service_vals['n8n_owner_email'] = init_params['owner_email']
-            if init_params.get('owner_password'):
-                service_vals['n8n_owner_password'] = init_params['owner_password']
-
-            service = CloudService.create(service_vals)
-
-            # Build expose configuration before spawning background thread
-            expose_config = None
-            if template.ingress_enabled:
-                expose_config = {
-                    'enabled': True,
-                    'subdomain': subdomain,
-                }
-
-            # Return immediately with pending state; deploy in background
-            service_data = self._format_service(service)
-
-            deploy_args = {
-                'db_name': request.env.cr.dbname,
-                'uid': request.env.uid,
-                'service_id': service.id,
-                'workspace_id': workspace.id,
-                'helm_namespace': helm_namespace,
-                'helm_release_name': helm_release_name,
-                'template_id': template.id,
-                'merged_values': merged_values,
-                'expose_config': expose_config,
-                'mcp_api_key': mcp_api_key,
-            }
-            thread = threading.Thread(
-                target=self._deploy_service_background,
-                args=(deploy_args,),
-                daemon=True,
-            )
-            thread.start()
-
-            return {
-                'success': True,
-                'data': service_data,
             }
 
-        except Exception as e:
-            _logger.error("Error creating service: %s\n%s", str(e), traceback.format_exc())
-            return {'success': False, 'error': 'An error occurred while creating the service.'}
+        deploy_args = {
+            'db_name': request.env.cr.dbname,
+            'uid': request.env.uid,
+            'workspace_id': workspace.id,
+            'helm_namespace': helm_namespace,
+            'helm_release_name': helm_release_name,
+            'template_id': template.id,
+            'merged_values': merged_values,
+            'expose_config': expose_config,
+            'mcp_api_key': mcp_api_key,
+        }
+        return {'vals': service_vals, 'deploy_args': deploy_args}, None
 
     def _deploy_service_background(self, args: dict) -> None:
         """Background thread: namespace creation + helm install + sidecar patch.
@@ -1550,27 +1903,15 @@ class PaasController(Controller):
             mcp_api_key = args['mcp_api_key']
 
             try:
-                # Create namespace if needed
-                all_services = CloudService.search([
-                    ('workspace_id', '=', args['workspace_id']),
-                    ('state', '!=', 'deleting'),
-                ])
-                total_vcpu = sum(s.allocated_vcpu for s in all_services)
-                total_ram = sum(s.allocated_ram_gb for s in all_services)
-                total_storage = sum(s.allocated_storage_gb for s in all_services)
-                try:
-                    client.create_namespace(
-                        namespace=helm_namespace,
-                        cpu_limit=str(max(total_vcpu * 3, 8)),
-                        memory_limit=f"{max(int(total_ram * 3), 8)}Gi",
-                        storage_limit=f"{max(total_storage * 3, 100)}Gi",
+                # Create namespace if needed (batch deploys create it once up front)
+                if not args.get('namespace_ready'):
+                    ns_error = self._ensure_service_namespace(
+                        client, CloudService, args['workspace_id'], helm_namespace,
                     )
-                except PaaSOperatorError as e:
-                    if e.status_code != 409:
-                        _logger.error("Namespace creation failed: %s", str(e))
+                    if ns_error:
                         service.write({
                             'state': 'error',
-                            'error_message': f'Failed to create namespace: {e.detail or e.message}',
+                            'error_message': ns_error,
                         })
                         cr.commit()
                         return
@@ -1646,11 +1987,37 @@ class PaasController(Controller):
         finally:
             cr.close()
 
+    def _ensure_service_namespace(self, client: Any, CloudService: Any, workspace_id: int, helm_namespace: str) -> str | None:
+        """Create the workspace namespace with quotas sized for its services.
+
+        Returns:
+            str | None: Error message if the namespace could not be created
+        """
+        all_services = CloudService.search([
+            ('workspace_id', '=', workspace_id),
+            ('state', '!=', 'deleting'),
+        ])
+        total_vcpu = sum(s.allocated_vcpu for s in all_services)
+        total_ram = sum(s.allocated_ram_gb for s in all_services)
+        total_storage = sum(s.allocated_storage_gb for s in all_services)
+        try:
+            client.create_namespace(
+                namespace=helm_namespace,
+                cpu_limit=str(max(total_vcpu * 3, 8)),
+                memory_limit=f"{max(int(total_ram * 3), 8)}Gi",
+                storage_limit=f"{max(total_storage * 3, 100)}Gi",
+            )
+        except PaaSOperatorError as e:
+            if e.status_code != 409:
+                _logger.error("Namespace creation failed: %s", str(e))
+                return f'Failed to create namespace: {e.detail or e.message}'
+        return None
+
     def _get_service(self, service: Any) -> dict[str, Any]:
         """Get service details, updating status from operator if needed."""
         # Check if we need to poll operator for status
         if service.state in ['deploying', 'upgrading', 'initializing']:
-            self._update_service_status(service)
+            service._refresh_operator_status()
 
         return {
             'success': True,
@@ -1668,12 +2035,12 @@ class PaasController(Controller):
 
         try:
             # Filter user values to only allowed keys, reject unauthorized
-            existing_values = json.loads(service.helm_values) if service.helm_values else {}
+            existing_values = service._get_json_field('helm_values', {})
             filtered_user_values, rejected_keys = self._filter_allowed_helm_values(values, service.template_id)
             if rejected_keys:
                 return {'success': False, 'error': f'Unauthorized configuration keys: {", ".join(rejected_keys)}'}
-            nested_user_values = self._unflatten_dotpath_keys(filtered_user_values)
-            merged_values = self._deep_merge(existing_values, nested_user_values)
+            nested_user_values = unflatten_dotpath_keys(filtered_user_values)
+            merged_values = deep_merge(existing_values, nested_user_values)
 
             # Upgrade release
             release_info = client.upgrade_release(
@@ -1692,6 +2059,7 @@ class PaasController(Controller):
                 'last_upgraded_at': datetime.now(),
                 'error_message': False,
             })
+            service._trigger_status_refresh()
 
             return {
                 'success': True,
@@ -1777,6 +2145,7 @@ class PaasController(Controller):
                 'state': 'upgrading',
                 'error_message': False,
             })
+            service._trigger_status_refresh()
 
             return {'success': True, 'message': f'Rollback to revision {revision} initiated'}
 
@@ -1812,314 +2181,370 @@ class PaasController(Controller):
                 return {'success': True, 'data': []}
             return {'success': False, 'error': f'Failed to get revisions: {e.detail or e.message}'}
 
-    def _update_service_status(self, service: Any) -> None:
-        """Poll operator for service status and update record.
-
-        Uses optimistic locking to prevent race conditions:
-        - Re-fetches service before updating to get latest state
-        - Only updates if service is still in expected state
-        - Skips update if state changed (another process already updated)
-        """
-        client = get_paas_operator_client(request.env)
-        if not client:
-            return
-
-        original_state = service.state
-        service_id = service.id
+    # ==================== Cloud Service Batch Operations ====================
 
+    def _get_batch_max_workers(self) -> int:
+        """Bounded operator fan-out for batch requests (configurable)."""
+        ICP = request.env['ir.config_parameter'].sudo()
         try:
-            status = client.get_status(
-                namespace=service.helm_namespace,
-                release_name=service.helm_release_name,
-            )
-
-            release = status.get('release', {})
-            pods = status.get('pods', [])
-
-            release_status = release.get('status', '')
-            helm_revision = release.get('revision', service.helm_revision)
-
-            # Re-fetch service to get latest state (optimistic locking)
-            CloudService = request.env['woow_paas_platform.cloud_service']
-            service = CloudService.browse(service_id)
-
-            if not service.exists():
-                _logger.debug("Service %s no longer exists, skipping status update", service_id)
-                return
+            workers = int(ICP.get_param('woow_paas_platform.batch_max_workers', BATCH_MAX_WORKERS))
+        except (TypeError, ValueError):
+            workers = BATCH_MAX_WORKERS
+        return max(1, workers)
 
-            # Only proceed if state hasn't changed since we started
-            if service.state != original_state:
-                _logger.debug(
-                    "Service %s state changed from %s to %s, skipping update",
-                    service_id, original_state, service.state
-                )
-                return
+    def _batch_response(self, results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build the per-item batch response envelope."""
+        succeeded = sum(1 for r in results if r['success'])
+        return {
+            'success': True,
+            'data': results,
+            'count': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+        }
 
-            # Determine new state based on release status and pod status
-            if release_status == 'deployed':
-                # Check if all pods are ready
-                all_ready = all(
-                    pod.get('phase') == 'Running' and '/' in pod.get('ready', '0/0')
-                    and pod.get('ready', '0/0').split('/')[0] == pod.get('ready', '0/0').split('/')[1]
-                    for pod in pods
-                ) if pods else True
-
-                if all_ready:
-                    template = service.template_id
-                    needs_init = (
-                        template.post_deploy_init_type
-                        and template.post_deploy_init_type != 'none'
-                    )
+    def _batch_validation_failed(self, errors: dict[int, str], service_ids: dict[int, int | None] | None = None) -> dict[str, Any]:
+        """Reject a whole batch, reporting which items failed validation."""
+        service_ids = service_ids or {}
+        return {
+            'success': False,
+            'error': f'Batch validation failed for {len(errors)} item(s); nothing was executed',
+            'data': [
+                {'index': index, 'service_id': service_ids.get(index), 'success': False, 'error': error}
+                for index, error in sorted(errors.items())
+            ],
+        }
 
-                    if needs_init and original_state == 'deploying':
-                        # Pods ready but need post-deploy init → transition to initializing
-                        service.write({
-                            'state': 'initializing',
-                            'helm_revision': helm_revision,
-                            'error_message': False,
-                        })
-                        self._run_post_deploy_init(service)
+    def _resolve_batch_services(self, workspace: Any, items: list[Any]) -> tuple[list[tuple[int, dict[str, Any], Any]], dict[int, str], dict[int, int | None]]:
+        """Normalize batch items and load their services in one query.
 
-                    elif needs_init and original_state == 'initializing':
-                        # Already initializing, retry if needed
-                        self._run_post_deploy_init(service)
+        Returns:
+            tuple: (entries, errors, service_ids) where entries are
+                ``(index, item, service)`` for items that resolved
+        """
+        CloudService = request.env['woow_paas_platform.cloud_service']
 
-                    else:
-                        # No init needed or already done → running
-                        service.write({
-                            'state': 'running',
-                            'helm_revision': helm_revision,
-                            'error_message': False,
-                        })
+        normalized = []
+        errors = {}
+        service_ids = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                item = {'service_id': item}
+            service_id = item.get('service_id')
+            if isinstance(service_id, bool) or not isinstance(service_id, int):
+                errors[index] = 'Service ID is required'
+                service_ids[index] = None
+                continue
+            service_ids[index] = service_id
+            normalized.append((index, item, service_id))
+
+        requested_ids = [service_id for _index, _item, service_id in normalized]
+        services_by_id = {
+            service.id: service
+            for service in CloudService.search([
+                ('id', 'in', requested_ids),
+                ('workspace_id', '=', workspace.id),
+            ])
+        }
 
-                        # Auto-create MCP Server when transitioning to running
-                        if original_state != 'running':
-                            try:
-                                self._auto_create_mcp_server(service)
-                            except Exception as e:
-                                _logger.warning(
-                                    "Auto-create MCP server failed for service %s: %s",
-                                    service.name, e,
-                                )
-                # else: still deploying/waiting for pods
-
-            elif release_status == 'failed':
-                service.write({
-                    'state': 'error',
-                    'helm_revision': helm_revision,
-                    'error_message': release.get('description', 'Deployment failed'),
-                })
+        entries = []
+        seen = set()
+        for index, item, service_id in normalized:
+            service = services_by_id.get(service_id)
+            if not service:
+                errors[index] = 'Service not found'
+            elif service_id in seen:
+                errors[index] = 'Duplicate service in batch'
+            else:
+                seen.add(service_id)
+                entries.append((index, item, service))
+        return entries, errors, service_ids
+
+    def _batch_create_services(self, workspace: Any, items: list[Any]) -> dict[str, Any]:
+        """Create many services with one ``create()`` and a shared deploy thread."""
+        prepared_list = []
+        errors = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors[index] = 'Invalid item'
+                continue
+            prepared, error = self._prepare_service(
+                workspace, item.get('template_id'), item.get('name'), item.get('values'),
+            )
+            if error:
+                errors[index] = error
+            else:
+                prepared_list.append(prepared)
+        if errors:
+            return self._batch_validation_failed(errors)
 
-            elif release_status in ['pending-install', 'pending-upgrade', 'pending-rollback']:
-                # Still in progress
-                pass
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        try:
+            services = CloudService.create([prepared['vals'] for prepared in prepared_list])
+
+            deploy_args_list = [
+                dict(prepared['deploy_args'], service_id=service.id)
+                for prepared, service in zip(prepared_list, services)
+            ]
+            results = [
+                {'index': index, 'service_id': service.id, 'success': True, 'data': self._format_service(service)}
+                for index, service in enumerate(services)
+            ]
+
+            self._start_background_after_commit(
+                self._deploy_services_background, deploy_args_list, self._get_batch_max_workers(),
+            )
 
-        except PaaSOperatorError as e:
-            if e.status_code == 404:
-                # Release not found - might have been deleted
-                # Re-fetch to check current state
-                CloudService = request.env['woow_paas_platform.cloud_service']
-                service = CloudService.browse(service_id)
-                if service.exists() and service.state == 'deleting':
-                    service.unlink()
-            else:
-                _logger.warning("Error polling service status: %s", str(e))
+            return self._batch_response(results)
 
         except Exception as e:
-            _logger.warning("Error polling service status: %s", str(e))
-
-    def _run_post_deploy_init(self, service: Any) -> None:
-        """Execute post-deploy initialization for a service.
+            _logger.error("Error creating services in batch: %s\n%s", str(e), traceback.format_exc())
+            return {'success': False, 'error': 'An error occurred while creating the services.'}
 
-        Called when pods are ready but the application needs initialization
-        (e.g., n8n owner setup + API key generation).
+    def _deploy_services_background(self, deploy_args_list: list[dict], max_workers: int) -> None:
+        """Background thread: create the namespace once, then deploy concurrently.
 
-        On success: transitions to 'running' and auto-creates MCP server.
-        On failure: increments retry counter; after 5 retries → 'error' state.
+        Each deploy runs ``_deploy_service_background`` on its own worker
+        thread and cursor, so the number of open cursors is bounded by
+        ``max_workers``. Afterwards the status refresh cron is triggered to
+        follow the releases until they settle.
         """
-        template = service.template_id
-
-        if template.post_deploy_init_type == 'n8n':
-            client = get_paas_operator_client(request.env)
-            if not client:
-                _logger.warning("PaaS Operator not configured, cannot initialize n8n")
-                return
-
-            owner_email = service.n8n_owner_email or template.post_deploy_init_email or 'admin@woowtech.io'
-            owner_password = service.n8n_owner_password
-            if not owner_password:
-                # Fallback for services created before this feature
-                owner_password = 'W' + str(uuid.uuid4()).upper()
-
-            try:
-                result = client.init_n8n(
-                    namespace=service.helm_namespace,
-                    release_name=service.helm_release_name,
-                    owner_email=owner_email,
-                    owner_password=owner_password,
-                )
-
-                if result.get('success'):
-                    real_api_key = result['api_key']
-
-                    # Check if sidecar was properly restarted
-                    if not result.get('pod_restarted'):
-                        _logger.warning(
-                            "n8n init for service %s: API key updated in Secret but pod was NOT restarted. "
-                            "MCP sidecar may still use the old placeholder key until next pod restart.",
-                            service.name,
-                        )
+        import odoo
+        from concurrent.futures import ThreadPoolExecutor
 
-                    # Update helm_values to replace the UUID placeholder with the real API key
-                    update_vals = {
-                        'n8n_api_key': real_api_key,
-                        'state': 'running',
-                        'init_retries': 0,
-                        'init_error': False,
-                    }
-                    if template.mcp_api_key_helm_path and service.helm_values:
-                        try:
-                            current_values = json.loads(service.helm_values)
-                            api_key_nested = self._unflatten_dotpath_keys(
-                                {template.mcp_api_key_helm_path: real_api_key}
-                            )
-                            updated_values = self._deep_merge(current_values, api_key_nested)
-                            update_vals['helm_values'] = json.dumps(updated_values)
-                        except (json.JSONDecodeError, TypeError):
-                            _logger.warning("Failed to update helm_values with real API key for service %s", service.name)
-                    service.write(update_vals)
-                    _logger.info(
-                        "n8n init succeeded for service %s, API key and helm_values updated",
-                        service.name,
+        first = deploy_args_list[0]
+        try:
+            registry = odoo.registry(first['db_name'])
+            with registry.cursor() as cr:
+                env = odoo.api.Environment(cr, first['uid'], {})
+                CloudService = env['woow_paas_platform.cloud_service']
+                client = get_paas_operator_client(env)
+                if client:
+                    # All items share the workspace namespace
+                    ns_error = self._ensure_service_namespace(
+                        client, CloudService, first['workspace_id'], first['helm_namespace'],
                     )
-                    try:
-                        self._auto_create_mcp_server(service)
-                    except Exception as e:
-                        _logger.warning(
-                            "Auto-create MCP server failed for service %s: %s",
-                            service.name, e,
-                        )
-                else:
-                    retries = (service.init_retries or 0) + 1
-                    error_msg = result.get('error', 'Unknown error')
-                    vals = {
-                        'init_retries': retries,
-                        'init_error': error_msg,
-                    }
-                    if retries >= 5:
-                        vals.update({
+                    if ns_error:
+                        CloudService.browse([args['service_id'] for args in deploy_args_list]).write({
                             'state': 'error',
-                            'error_message': f'n8n initialization failed after {retries} retries: {error_msg}',
+                            'error_message': ns_error,
                         })
-                    service.write(vals)
-                    _logger.warning(
-                        "n8n init attempt %d failed for service %s: %s",
-                        retries, service.name, error_msg,
-                    )
+                        return
+                    for args in deploy_args_list:
+                        args['namespace_ready'] = True
+        except Exception as e:
+            _logger.exception("Batch deploy namespace setup failed: %s", e)
+            return
 
-            except Exception as e:
-                retries = (service.init_retries or 0) + 1
-                vals = {
-                    'init_retries': retries,
-                    'init_error': str(e),
-                }
-                if retries >= 5:
-                    vals.update({
-                        'state': 'error',
-                        'error_message': f'n8n initialization failed: {str(e)}',
-                    })
-                service.write(vals)
-                _logger.warning(
-                    "n8n init exception (attempt %d) for service %s: %s",
-                    retries, service.name, e,
-                )
+        workers = max(1, min(max_workers, len(deploy_args_list)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='paas-deploy') as executor:
+            list(executor.map(self._deploy_service_background, deploy_args_list))
 
-    def _auto_create_mcp_server(self, service: Any) -> None:
-        """Auto-create MCP Server record for a cloud service with MCP enabled.
+        try:
+            with registry.cursor() as cr:
+                env = odoo.api.Environment(cr, first['uid'], {})
+                env['woow_paas_platform.cloud_service'].browse(
+                    [args['service_id'] for args in deploy_args_list]
+                ).exists()._trigger_status_refresh()
+        except Exception as e:
+            _logger.warning("Could not trigger the status refresh after deploy: %s", e)
 
-        Called when a service transitions to 'running' state. Creates a
-        user-scope MCP Server record linked to the cloud service and
-        triggers tool discovery.
+    def _start_background_after_commit(self, target: Any, *args: Any) -> None:
+        """Start a daemon thread once the current transaction has committed.
 
-        Idempotent: skips creation if an auto-created record already exists.
+        Background threads use their own cursor and must see the records
+        written by this request.
         """
-        template = service.template_id
-        if not template.mcp_enabled or not template.mcp_sidecar_image:
-            return
+        def _start():
+            threading.Thread(target=target, args=args, daemon=True).start()
 
-        McpServer = request.env['woow_paas_platform.mcp_server'].sudo()
+        request.env.cr.postcommit.add(_start)
 
-        # Check if already exists (avoid duplicates on re-deploy/upgrade)
-        existing = McpServer.search([
-            ('cloud_service_id', '=', service.id),
-            ('auto_created', '=', True),
-        ], limit=1)
-        if existing:
-            _logger.debug(
-                "MCP Server already exists for service %s (id=%s), skipping auto-create",
-                service.name, existing.id,
-            )
-            return
+    def _batch_upgrade_services(self, workspace: Any, items: list[Any], default_values: dict[str, Any] | None, default_version: str | None) -> dict[str, Any]:
+        """Upgrade many releases concurrently (e.g. roll a chart version bump)."""
+        entries, errors, service_ids = self._resolve_batch_services(workspace, items)
 
-        # Build MCP endpoint URL
-        mcp_url = self._build_mcp_endpoint_url(service, template)
+        jobs = []
+        for index, item, service in entries:
+            if service.state in ['pending', 'deleting', 'error']:
+                errors[index] = f'Cannot update service in {service.state} state'
+                continue
+            values = item.get('values', default_values)
+            existing_values = service._get_json_field('helm_values', {})
+            filtered_user_values, rejected_keys = self._filter_allowed_helm_values(values, service.template_id)
+            if rejected_keys:
+                errors[index] = f'Unauthorized configuration keys: {", ".join(rejected_keys)}'
+                continue
+            nested_user_values = unflatten_dotpath_keys(filtered_user_values)
+            jobs.append({
+                'index': index,
+                'service': service,
+                'namespace': service.helm_namespace,
+                'release_name': service.helm_release_name,
+                'chart': service.template_id.helm_chart_name,
+                'values': deep_merge(existing_values, nested_user_values),
+                'version': item.get('version', default_version),
+            })
+        if errors:
+            return self._batch_validation_failed(errors, service_ids)
 
-        # Create MCP Server record
-        server = McpServer.create({
-            'name': f"{service.name} MCP",
-            'url': mcp_url,
-            'transport': template.mcp_transport or 'streamable_http',
-            'scope': 'user',
-            'cloud_service_id': service.id,
-            'auto_created': True,
-            'api_key': service.mcp_auth_token,
-            'description': f"Auto-created MCP server for {service.name}",
-        })
+        client = get_paas_operator_client(request.env)
+        if not client:
+            return {'success': False, 'error': 'PaaS Operator not configured'}
 
-        _logger.info(
-            "Auto-created MCP Server '%s' (id=%s) for cloud service '%s'",
-            server.name, server.id, service.name,
-        )
+        def _upgrade(worker_client, job):
+            return worker_client.upgrade_release(
+                namespace=job['namespace'],
+                release_name=job['release_name'],
+                chart=job['chart'],
+                values=job['values'],
+                version=job['version'],
+            )
 
-        # Try to sync tools using safe method (keeps state as 'draft' on
-        # failure so the cron retry mechanism can pick it up later).
-        server.action_sync_tools_safe()
+        outcomes = run_operator_batch(client, _upgrade, jobs, self._get_batch_max_workers())
 
-    def _build_mcp_endpoint_url(self, service: Any, template: Any) -> str:
-        """Build the MCP endpoint URL for a cloud service sidecar.
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        results = []
+        upgraded = CloudService
+        now = datetime.now()
+        for job, (release_info, error) in zip(jobs, outcomes):
+            service = job['service']
+            if error:
+                results.append(self._batch_error_result(job['index'], service, error, 'Upgrade failed'))
+                continue
+            service.write({
+                'state': 'upgrading',
+                'helm_values': json.dumps(job['values']),
+                'helm_revision': release_info.get('revision', service.helm_revision + 1),
+                'helm_chart_version': job['version'] or service.helm_chart_version,
+                'last_upgraded_at': now,
+                'error_message': False,
+            })
+            upgraded |= service
+            results.append({'index': job['index'], 'service_id': service.id, 'success': True, 'data': self._format_service(service)})
+        upgraded._trigger_status_refresh()
+        return self._batch_response(results)
+
+    def _batch_delete_services(self, workspace: Any, items: list[Any]) -> dict[str, Any]:
+        """Uninstall many releases concurrently and remove their records."""
+        entries, errors, service_ids = self._resolve_batch_services(workspace, items)
+        for index, _item, service in entries:
+            if service.state == 'deleting':
+                errors[index] = 'Service is already being deleted'
+        if errors:
+            return self._batch_validation_failed(errors, service_ids)
 
-        Constructs the URL using the service's subdomain and the PaaS
-        domain from system configuration. Falls back to a Kubernetes
-        internal service URL when no subdomain is available.
+        client = get_paas_operator_client(request.env)
+        if not client:
+            # Block deletion - we cannot clean up K8s resources without operator
+            return {
+                'success': False,
+                'error': 'PaaS Operator not configured. Cannot safely delete service without cleaning up Kubernetes resources. Contact administrator.',
+            }
 
-        Returns:
-            str: The full MCP endpoint URL.
-        """
-        endpoint_path = template.mcp_endpoint_path or '/mcp'
-        sidecar_port = template.mcp_sidecar_port or 3001
-
-        # Prefer Kubernetes internal service URL (most reliable).
-        # The Cloudflare tunnel only routes to the main application port,
-        # not the sidecar port, so external URL via subdomain won't work
-        # for the MCP sidecar without additional Ingress configuration.
-        # Pattern: http://{release}-mcp.{namespace}.svc.cluster.local:{port}{path}
-        if service.helm_release_name and service.helm_namespace:
-            return (
-                f"http://{service.helm_release_name}-mcp"
-                f".{service.helm_namespace}.svc.cluster.local"
-                f":{sidecar_port}{endpoint_path}"
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        jobs = [
+            {
+                'index': index,
+                'service': service,
+                'namespace': service.helm_namespace,
+                'release_name': service.helm_release_name,
+                'subdomain': service.subdomain,
+            }
+            for index, _item, service in entries
+        ]
+        CloudService.browse([job['service'].id for job in jobs]).write({'state': 'deleting'})
+
+        def _uninstall(worker_client, job):
+            return worker_client.uninstall_release(
+                namespace=job['namespace'],
+                release_name=job['release_name'],
+                subdomain=job['subdomain'],
             )
 
-        # Fallback: construct from subdomain (user can update later)
-        if service.subdomain:
-            IrConfigParameter = request.env['ir.config_parameter'].sudo()
-            paas_domain = IrConfigParameter.get_param(
-                'woow_paas_platform.paas_domain', 'woowtech.io',
+        outcomes = run_operator_batch(client, _uninstall, jobs, self._get_batch_max_workers())
+
+        results = []
+        to_unlink = CloudService
+        for job, (_response, error) in zip(jobs, outcomes):
+            service = job['service']
+            # If release not found, still delete the record
+            if not error or (isinstance(error, PaaSOperatorError) and error.status_code == 404):
+                to_unlink |= service
+                results.append({'index': job['index'], 'service_id': service.id, 'success': True})
+                continue
+            result = self._batch_error_result(job['index'], service, error, 'Deletion failed')
+            service.write({'state': 'error', 'error_message': result['error']})
+            results.append(result)
+        to_unlink.unlink()
+        return self._batch_response(results)
+
+    def _batch_rollback_services(self, workspace: Any, items: list[Any]) -> dict[str, Any]:
+        """Roll many releases back concurrently."""
+        entries, errors, service_ids = self._resolve_batch_services(workspace, items)
+
+        jobs = []
+        for index, item, service in entries:
+            if service.state in ['pending', 'deleting']:
+                errors[index] = f'Cannot rollback service in {service.state} state'
+                continue
+            revision = item.get('revision')
+            if revision is not None:
+                try:
+                    revision = int(revision)
+                except (TypeError, ValueError):
+                    revision = -1
+                if revision < 0:
+                    errors[index] = 'Invalid revision number'
+                    continue
+            jobs.append({
+                'index': index,
+                'service': service,
+                'namespace': service.helm_namespace,
+                'release_name': service.helm_release_name,
+                'revision': revision,
+            })
+        if errors:
+            return self._batch_validation_failed(errors, service_ids)
+
+        client = get_paas_operator_client(request.env)
+        if not client:
+            return {'success': False, 'error': 'PaaS Operator not configured'}
+
+        def _rollback(worker_client, job):
+            return worker_client.rollback_release(
+                namespace=job['namespace'],
+                release_name=job['release_name'],
+                revision=job['revision'] or 0,
             )
-            return f"https://{service.subdomain}.{paas_domain}{endpoint_path}"
 
-        # Last resort: placeholder that the user must update
-        return f"http://localhost:{sidecar_port}{endpoint_path}"
+        outcomes = run_operator_batch(client, _rollback, jobs, self._get_batch_max_workers())
+
+        CloudService = request.env['woow_paas_platform.cloud_service']
+        results = []
+        rolled_back = CloudService
+        for job, (_response, error) in zip(jobs, outcomes):
+            service = job['service']
+            if error:
+                results.append(self._batch_error_result(job['index'], service, error, 'Rollback failed'))
+                continue
+            rolled_back |= service
+            results.append({'index': job['index'], 'service_id': service.id, 'success': True})
+        rolled_back.write({'state': 'upgrading', 'error_message': False})
+        rolled_back._trigger_status_refresh()
+        return self._batch_response(results)
+
+    def _batch_error_result(self, index: int, service: Any, error: Exception, prefix: str) -> dict[str, Any]:
+        """Translate an operator exception into a per-item batch result."""
+        if isinstance(error, PaaSOperatorConnectionError):
+            message = 'Unable to connect to deployment service'
+        elif isinstance(error, PaaSOperatorError):
+            _logger.error("Operator error for service %s: %s", service.id, str(error))
+            message = f'{prefix}: {error.detail or error.message}'
+        else:
+            _logger.error("Unexpected batch error for service %s: %s", service.id, error)
+            message = f'{prefix}: unexpected error'
+        return {'index': index, 'service_id': service.id, 'success': False, 'error': message}
 
     def _format_service(self, service: Any, include_details: bool = False) -> dict[str, Any]:
         """Format a service record for API response."""
@@ -2148,7 +2573,7 @@ class PaasController(Controller):
                 'helm_release_name': service.helm_release_name,
                 'helm_chart_version': service.helm_chart_version,
                 'helm_values': self._sanitize_helm_values(
-                    json.loads(service.helm_values) if service.helm_values else {},
+                    service._get_json_field('helm_values', {}),
                     service.template_id,
                 ),
                 'internal_port': service.internal_port,
@@ -89,18 +89,14 @@ class SmartHomeController(Controller):
 
     def _get_workspace_or_error(self, workspace_id: int):
         """Verify user has access to workspace and return it."""
-        user = request.env.user
-        WorkspaceAccess = request.env["woow_paas_platform.workspace_access"]
-
-        access = WorkspaceAccess.search([
-            ("user_id", "=", user.id),
-            ("workspace_id", "=", workspace_id),
-            ("workspace_id.state", "=", "active"),
-        ], limit=1)
+        workspace = request.env["woow_paas_platform.workspace"].browse(workspace_id)
+        if not workspace.get_user_roles():
+            return None
 
-        if not access:
+        workspace = workspace.exists()
+        if not workspace or workspace.state != "active":
             return None
-        return access.workspace_id
+        return workspace
 
     def _get_smarthome_or_error(self, smarthome_id: int, workspace):
         """Get smart home belonging to workspace."""
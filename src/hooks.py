@@ -111,9 +111,32 @@ def _check_python_dependencies():
             )
 
 
+def ensure_trigram_extension(cr):
+    """
+    Enable pg_trgm so ``index='trigram'`` fields get GIN trigram indexes.
+
+    pg_trgm is a trusted extension (PostgreSQL 13+), so the database owner
+    can create it. When that fails, Odoo falls back to regular indexes and
+    ``ilike`` searches still work, only slower.
+
+    Returns:
+        bool: Whether the extension is available
+    """
+    try:
+        with cr.savepoint():
+            cr.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except Exception as e:
+        _logger.warning("Could not enable pg_trgm, template search will not use trigram indexes: %s", e)
+        return False
+    return True
+
+
 def pre_init_hook(env):
     """
     Pre-init hook: auto-install Python dependencies from requirements.txt
-    before module installation.
+    and enable pg_trgm before module installation.
     """
     _check_python_dependencies()
+    if ensure_trigram_extension(env.cr):
+        # The registry probed for pg_trgm before this hook ran
+        env.registry.has_trigram = True
@@ -0,0 +1,32 @@
+"""Backfill plain_body / is_ai on existing discuss channel messages."""
+import logging
+
+from odoo import SUPERUSER_ID, api
+
+_logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    Message = env['mail.message'].with_context(active_test=False)
+    cr.execute("""
+        SELECT id FROM mail_message
+         WHERE model = 'discuss.channel' AND plain_body IS NULL
+         ORDER BY id
+    """)
+    ids = [row[0] for row in cr.fetchall()]
+    for start in range(0, len(ids), BATCH_SIZE):
+        batch = ids[start:start + BATCH_SIZE]
+        for message in Message.browse(batch):
+            vals = Message._prepare_chat_vals(message.body, message.author_id.id)
+            cr.execute(
+                "UPDATE mail_message SET plain_body = %s, is_ai = %s WHERE id = %s",
+                (vals['plain_body'], vals['is_ai'], message.id),
+            )
+        env.invalidate_all()
+    _logger.info("Backfilled plain text of %d channel messages", len(ids))
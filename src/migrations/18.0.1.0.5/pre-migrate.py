@@ -0,0 +1,20 @@
+"""Enable pg_trgm for the cloud app template trigram indexes."""
+import logging
+
+from odoo.addons.woow_paas_platform.hooks import ensure_trigram_extension
+from odoo.modules.registry import Registry
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    if ensure_trigram_extension(cr):
+        # The registry being loaded probed for pg_trgm before this ran;
+        # without this the indexes would only switch on the next update
+        registry = Registry.registries.get(cr.dbname)
+        if registry is not None:
+            registry.has_trigram = True
+        _logger.info("pg_trgm enabled for cloud app template search")
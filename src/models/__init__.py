@@ -1,16 +1,24 @@
 from . import res_config_settings
+from . import json_field_mixin
 from . import workspace
 from . import workspace_access
 from . import cloud_app_template
 from . import cloud_service
+from . import service_usage_series
 from . import ai_config
+from . import ai_endpoint
 from . import project_project
 from . import project_task
 from . import discuss_channel
+from . import mail_message
+from . import chat_upload
 from . import oauth_client
 from . import oauth_token
 from . import oauth_code
 from . import smart_home
 from . import ai_assistant
+from . import ai_response_cache
+from . import llm_rate_bucket
 from . import mcp_server
 from . import mcp_tool
+from . import ir_websocket
@@ -1,4 +1,4 @@
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class AiAssistant(models.Model):
@@ -14,6 +14,40 @@ class AiAssistant(models.Model):
         string='Disabled MCP Tools',
         help='Tools in this list will not be available to the AI assistant',
     )
+    context_token_budget = fields.Integer(
+        string='Context Token Budget',
+        default=8000,
+        help='Maximum prompt size in tokens for chat replies. Older turns that '
+             'do not fit are replaced by a rolling summary of the conversation.',
+    )
+    response_cache_enabled = fields.Boolean(
+        string='Cache Responses',
+        help='Reuse earlier answers to the same question asked in the same '
+             'context (system prompt and cloud service) instead of calling the model',
+    )
+    response_cache_ttl = fields.Integer(
+        string='Cache TTL (hours)',
+        default=24,
+    )
+    response_cache_similarity = fields.Float(
+        string='Near-Duplicate Threshold',
+        default=0.0,
+        help='Cosine similarity from which a differently worded question reuses '
+             'a cached answer (e.g. 0.92). 0 only reuses exact matches. '
+             'Requires the fastembed embedding model.',
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        # mail.message._get_ai_partner_ids
+        self.env.registry.clear_cache()
+        return records
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
 
     def get_enabled_mcp_tools(self):
         """Return mcp_tool records that are enabled for this assistant.
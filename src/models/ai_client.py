@@ -4,17 +4,35 @@ This module wraps ``langchain-openai``'s :class:`ChatOpenAI` to provide a
 simple interface for chat completions (both synchronous and streaming)
 against any OpenAI-compatible API endpoint.
 
-Supports optional MCP tool calling via ``langchain-mcp-adapters`` and
-LangGraph's ``StateGraph`` with ``ToolNode``.
+Supports optional MCP tool calling via LangGraph's ``StateGraph`` with
+``ToolNode``; tools are built from the synced ``mcp_tool`` records and call
+the servers through the per-worker session pool (``services/mcp_pool.py``).
+
+Every model call first waits for the provider limits of its ``ai.config``
+and retries 429 responses (``services/llm_scheduler.py``).
+
+An ``ai.config`` may list fallback endpoints: requests fail over to them on
+connection errors, and a text stream that has no first token after the
+hedge delay is raced against the next endpoint (first to answer wins).
 """
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Generator, List, Optional
-
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Generator, List, Optional, Tuple
+
+from langchain_core.messages import (
+    AIMessage, AIMessageChunk, HumanMessage, SystemMessage, message_chunk_to_message,
+)
 from langchain_openai import ChatOpenAI
 
+from ..services import async_loop, llm_scheduler
+from ..services.context_window import count_message_tokens
+from ..services.mcp_pool import build_mcp_tools
+
 _logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -84,17 +102,35 @@ class AIClient:
         model_name: str,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        rate_limit: Optional[llm_scheduler.RateLimit] = None,
+        priority: int = llm_scheduler.PRIORITY_INTERACTIVE,
+        fallbacks: Optional[List[dict]] = None,
+        hedge_delay: float = 0.0,
     ):
-        self.llm = ChatOpenAI(
-            base_url=api_base_url.rstrip("/"),
-            api_key=api_key,
-            model=model_name,
-            max_tokens=max_tokens,
-            temperature=temperature,
-        )
+        """Create a client for one endpoint, with optional fallback endpoints.
+
+        Args:
+            fallbacks: Further endpoints, in order, as dicts with
+                ``api_base_url``, ``api_key`` and ``model_name``.
+            hedge_delay: Seconds without a first streamed token before the
+                next endpoint is tried in parallel (0 = fail over only).
+        """
+        self.model_name = model_name
+        self.max_tokens = max_tokens
+        self.rate_limit = rate_limit
+        self.priority = priority
+        self.hedge_delay = hedge_delay
+        self._llm_key, self.llm = _get_llm(api_base_url, api_key, model_name, max_tokens, temperature)
+        self.fallback_llms = [
+            _get_llm(
+                endpoint["api_base_url"], endpoint["api_key"], endpoint["model_name"],
+                max_tokens, temperature,
+            )[1]
+            for endpoint in fallbacks or []
+        ]
 
     @classmethod
-    def from_assistant(cls, assistant):
+    def from_assistant(cls, assistant, priority: int = llm_scheduler.PRIORITY_INTERACTIVE):
         """Create an AIClient from an ``ai.assistant`` record.
 
         Reads configuration from ``assistant.config_id`` (an ``ai.config``
@@ -103,6 +139,9 @@ class AIClient:
 
         Args:
             assistant: An ``ai.assistant`` Odoo recordset (single record).
+            priority: Scheduling priority of the calls
+                (``llm_scheduler.PRIORITY_*``); background work yields to
+                interactive replies.
 
         Returns:
             A configured :class:`AIClient` instance.
@@ -123,6 +162,19 @@ class AIClient:
             model_name=config.model or 'gpt-4o-mini',
             max_tokens=config.max_tokens or 4096,
             temperature=config.temperature if config.temperature is not None else 0.7,
+            rate_limit=llm_scheduler.RateLimit(
+                assistant.env.cr.dbname,
+                config.id,
+                config.rate_limit_rpm or 0,
+                config.rate_limit_tpm or 0,
+            ) if config.rate_limit_rpm or config.rate_limit_tpm else None,
+            priority=priority,
+            fallbacks=[{
+                'api_base_url': endpoint.api_base_url,
+                'api_key': endpoint.api_key or api_key,
+                'model_name': endpoint.model or config.model or 'gpt-4o-mini',
+            } for endpoint in config.endpoint_ids],
+            hedge_delay=(config.hedge_delay_ms or 0) / 1000.0,
         )
 
     # -------------------- message helpers --------------------
@@ -153,6 +205,41 @@ class AIClient:
         messages.append(HumanMessage(content=user_message))
         return messages
 
+    def summarize_conversation(
+        self,
+        previous_summary: str,
+        transcript: str,
+        max_words: int = 250,
+    ) -> str:
+        """Fold a transcript of older turns into a running summary.
+
+        Args:
+            previous_summary: The summary so far (may be empty).
+            transcript: The turns to add, as ``User:`` / ``Assistant:`` lines.
+            max_words: Upper bound on the length of the new summary.
+
+        Returns:
+            The updated summary text.
+
+        Raises:
+            AIClientError: The completion request failed.
+        """
+        instructions = (
+            "You maintain the running summary of a support conversation. "
+            "Merge the new turns into the existing summary. Keep facts, "
+            "decisions, names, configuration values and open questions; drop "
+            "greetings and repetition. Reply with the summary only, in the "
+            f"language of the conversation, in at most {max_words} words."
+        )
+        content = (
+            f"Existing summary:\n{previous_summary or '(none)'}\n\n"
+            f"New turns:\n{transcript}"
+        )
+        return self.chat_completion([
+            SystemMessage(content=instructions),
+            HumanMessage(content=content),
+        ]).strip()
+
     # -------------------- completions --------------------
 
     # -------------------- tool calling --------------------
@@ -174,17 +261,28 @@ class AIClient:
         Returns:
             The final assistant response text.
         """
+        return self.chat_completion_with_tools_status(messages, mcp_tools)[0]
+
+    def chat_completion_with_tools_status(
+        self,
+        messages: list,
+        mcp_tools=None,
+    ) -> Tuple[str, bool]:
+        """Same as :meth:`chat_completion_with_tools`, reporting tool failures.
+
+        Returns:
+            ``(text, tool_failed)``: ``tool_failed`` is set when a tool call
+            returned an error or the agent failed and the answer was
+            generated without tools.
+        """
         if not mcp_tools:
-            return self.chat_completion(messages)
-        server_config = _build_mcp_server_config(mcp_tools)
-        enabled_names = _build_prefixed_enabled_names(mcp_tools)
+            return self.chat_completion(messages), False
+        tools = build_mcp_tools(mcp_tools)
         try:
-            return asyncio.run(
-                self._async_agent_invoke(messages, server_config, enabled_names)
-            )
+            return async_loop.run(self._async_agent_invoke(messages, tools))
         except Exception as exc:
             _logger.warning("Tool calling failed, falling back to text-only: %s", exc)
-            return self.chat_completion(messages)
+            return self.chat_completion(messages), True
 
     def chat_completion_stream_with_tools(
         self,
@@ -210,14 +308,35 @@ class AIClient:
                 yield {"type": "text_chunk", "content": chunk}
             return
 
-        server_config = _build_mcp_server_config(mcp_tools)
-        enabled_names = _build_prefixed_enabled_names(mcp_tools)
+        yield from self.stream_agent_events(messages, build_mcp_tools(mcp_tools))
+
+    def stream_agent_events(
+        self,
+        messages: list,
+        tools: list,
+    ) -> Generator[dict, None, None]:
+        """Stream tool-calling agent events as they happen.
+
+        Same events as :meth:`chat_completion_stream_with_tools`, for callers
+        that built the tools up front with ``build_mcp_tools`` (e.g. before
+        leaving the ORM cursor). The agent runs on the worker event loop
+        and each event is yielded as soon as LangGraph emits it.
+
+        Falls back to text-only streaming when the agent fails before any
+        text was sent; once answer text went out, the error is raised
+        instead so the reply is not duplicated.
+
+        Raises:
+            AIClientError: The agent failed after streaming answer text.
+        """
+        text_sent = False
         try:
-            events = asyncio.run(
-                self._async_agent_stream(messages, server_config, enabled_names)
-            )
-            yield from events
+            for event in async_loop.iterate(self._async_agent_stream(messages, tools)):
+                text_sent = text_sent or event.get("type") == "text_chunk"
+                yield event
         except Exception as exc:
+            if text_sent:
+                raise _translate_exception(exc) from exc
             _logger.warning(
                 "Tool calling stream failed, falling back to text-only: %s", exc
             )
@@ -228,32 +347,26 @@ class AIClient:
     _MCP_TIMEOUT = 60
     _RECURSION_LIMIT = 20
 
-    async def _async_agent_invoke(self, messages, server_config, enabled_names):
-        """Build LangGraph agent, invoke, and return final text.
+    async def _async_agent_invoke(self, messages, tools):
+        """Build LangGraph agent, invoke, and return ``(final text, tool_failed)``.
 
         Handles connection failures, timeouts, and recursion limits gracefully
         by falling back to plain chat completion.
         """
-        from langchain_mcp_adapters.client import MultiServerMCPClient
-
         try:
-            client = MultiServerMCPClient(server_config, tool_name_prefix=True)
-            tools = await asyncio.wait_for(
-                client.get_tools(), timeout=self._MCP_TIMEOUT,
-            )
-            tools = [t for t in tools if t.name in enabled_names]
             if not tools:
-                result = self.llm.invoke(messages)
-                return result.content
+                result = await self._acall_scheduled(messages, lambda: self.llm.ainvoke(messages))
+                return result.content, False
             graph = self._build_agent_graph(tools)
             result = await asyncio.wait_for(
                 graph.ainvoke(
                     {"messages": messages},
-                    {"recursion_limit": self._RECURSION_LIMIT},
+                    self._graph_config(),
                 ),
                 timeout=self._MCP_TIMEOUT,
             )
-            return result["messages"][-1].content
+            tool_failed = any(getattr(msg, "status", None) == "error" for msg in result["messages"])
+            return result["messages"][-1].content, tool_failed
         except asyncio.TimeoutError:
             _logger.warning("MCP tool calling timed out after %ss", self._MCP_TIMEOUT)
             raise
@@ -268,40 +381,41 @@ class AIClient:
                 _logger.warning("MCP agent invoke failed (%s): %s", exc_type, exc)
             raise
 
-    async def _async_agent_stream(self, messages, server_config, enabled_names):
-        """Build LangGraph agent, stream updates, return event list.
+    async def _async_agent_stream(self, messages, tools):
+        """Build LangGraph agent and yield events as LangGraph emits them.
+
+        Tools come from ``build_mcp_tools`` and call the servers through the
+        pooled sessions, so no MCP connection is opened up front.
 
         Handles connection failures, timeouts, and recursion limits gracefully.
         On tool execution errors, emits ``tool_error`` events so the frontend
         can display error states.
         """
-        from langchain_mcp_adapters.client import MultiServerMCPClient
-
-        events = []
         try:
-            client = MultiServerMCPClient(server_config, tool_name_prefix=True)
-            tools = await asyncio.wait_for(
-                client.get_tools(), timeout=self._MCP_TIMEOUT,
-            )
-            _logger.info(
-                "MCP tools from server: %s",
-                [t.name for t in tools],
-            )
-            tools = [t for t in tools if t.name in enabled_names]
-            _logger.info(
-                "MCP tools after filter (enabled_names=%s): %s",
-                enabled_names, [t.name for t in tools],
-            )
+            _logger.info("MCP tools: %s", [t.name for t in tools])
             if not tools:
-                result = self.llm.invoke(messages)
-                events.append({"type": "text_chunk", "content": result.content})
-                return events
+                result = await self._acall_scheduled(messages, lambda: self.llm.ainvoke(messages))
+                yield {"type": "text_chunk", "content": result.content}
+                return
             graph = self._build_agent_graph(tools)
-            async for chunk in graph.astream(
+            # Ids of model messages whose tokens were already streamed
+            streamed_ids = set()
+            async for mode, chunk in graph.astream(
                 {"messages": messages},
-                {"recursion_limit": self._RECURSION_LIMIT},
-                stream_mode="updates",
+                self._graph_config(),
+                stream_mode=["messages", "updates"],
             ):
+                if mode == "messages":
+                    msg, metadata = chunk
+                    if (
+                        metadata.get("langgraph_node") == "call_model"
+                        and isinstance(msg, AIMessageChunk)
+                        and isinstance(msg.content, str)
+                        and msg.content
+                    ):
+                        streamed_ids.add(msg.id)
+                        yield {"type": "text_chunk", "content": msg.content}
+                    continue
                 for node_name, node_output in chunk.items():
                     for msg in node_output.get("messages", []):
                         if (
@@ -313,42 +427,44 @@ class AIClient:
                                     "LLM tool_call: name=%s, args=%s",
                                     tc["name"], tc.get("args", {}),
                                 )
-                                events.append({
+                                yield {
                                     "type": "tool_call",
                                     "tool": tc["name"],
                                     "args": tc.get("args", {}),
-                                })
+                                }
                         elif node_name == "tools" and hasattr(msg, "content"):
                             content = str(msg.content)
                             tool_name = getattr(msg, "name", "unknown")
                             # Detect tool execution errors
                             is_error = getattr(msg, "status", None) == "error"
                             if is_error:
-                                events.append({
+                                yield {
                                     "type": "tool_error",
                                     "tool": tool_name,
                                     "error": content,
-                                })
+                                }
                                 _logger.warning(
                                     "MCP tool '%s' execution error: %s",
                                     tool_name, content[:200],
                                 )
                             else:
-                                events.append({
+                                yield {
                                     "type": "tool_result",
                                     "tool": tool_name,
                                     "result": content,
-                                })
+                                }
                         elif (
                             node_name == "call_model"
                             and hasattr(msg, "content")
                             and msg.content
                             and not getattr(msg, "tool_calls", None)
+                            and msg.id not in streamed_ids
                         ):
-                            events.append({
+                            # Provider did not stream tokens: send it whole
+                            yield {
                                 "type": "text_chunk",
                                 "content": msg.content,
-                            })
+                            }
         except asyncio.TimeoutError:
             _logger.warning("MCP tool stream timed out after %ss", self._MCP_TIMEOUT)
             raise
@@ -360,17 +476,32 @@ class AIClient:
                     self._RECURSION_LIMIT,
                 )
                 # Emit a system notification so the frontend knows
-                events.append({
+                yield {
                     "type": "text_chunk",
                     "content": "\n\n⚠️ Tool calling reached the maximum iteration limit. "
                                "Providing the best answer based on results gathered so far.\n",
-                })
-                return events
+                }
+                return
             _logger.warning("MCP agent stream failed (%s): %s", exc_type, exc)
             raise
-        return events
+
+    def _graph_config(self) -> dict:
+        """Run config of the agent graph; the graph is shared, the client is not."""
+        return {
+            "recursion_limit": self._RECURSION_LIMIT,
+            "configurable": {"ai_client": self},
+        }
 
     def _build_agent_graph(self, tools):
+        """Return the compiled LangGraph agent for this model and tool set.
+
+        Compiled graphs hold no per-run state, so they are cached and shared
+        (see ``_graph_cache``).
+        """
+        key = (self._llm_key, _tools_fingerprint(tools))
+        return _graph_cache.get_or_create(key, lambda: self._compile_agent_graph(tools))
+
+    def _compile_agent_graph(self, tools):
         """Build a LangGraph StateGraph with ToolNode for tool calling."""
         from langgraph.graph import START, MessagesState, StateGraph
         from langgraph.prebuilt import ToolNode, tools_condition
@@ -378,8 +509,21 @@ class AIClient:
         llm_with_tools = self.llm.bind_tools(tools)
         valid_tool_names = {t.name for t in tools}
 
-        def call_model(state):
-            result = llm_with_tools.invoke(state["messages"])
+        async def call_model(state, config):
+            # Stream so the graph's "messages" stream mode sees each token;
+            # tool call argument deltas are merged into the final message
+            async def run():
+                merged = None
+                async for chunk in llm_with_tools.astream(state["messages"]):
+                    merged = chunk if merged is None else merged + chunk
+                return merged
+
+            client = (config or {}).get("configurable", {}).get("ai_client")
+            if client is not None:
+                result = await client._acall_scheduled(state["messages"], run)
+            else:
+                result = await run()
+            result = message_chunk_to_message(result) if result is not None else AIMessage(content="")
             # Normalize tool call names: vibeproxy
             # (https://github.com/automazeio/vibeproxy) adds a "proxy_"
             # prefix to tool call names in its response.  Strip it so
@@ -421,11 +565,25 @@ class AIClient:
             AIClientTimeoutError: The request timed out.
             AIClientAPIError: The provider returned an error.
         """
-        try:
-            result = self.llm.invoke(messages)
-            return result.content
-        except Exception as exc:
-            raise _translate_exception(exc) from exc
+        llms = self._llms
+        index = attempt = 0
+        while True:
+            if index == 0:
+                self._schedule(messages)
+            try:
+                return llms[index].invoke(messages).content
+            except Exception as exc:
+                if index + 1 < len(llms) and _is_failover_error(exc):
+                    _logger.warning("AI endpoint %s failed, failing over: %s", index, exc)
+                    index += 1
+                    continue
+                # Only the primary endpoint draws from the shared bucket
+                primary = index == 0
+                delay = self._rate_limit_retry_delay(exc, attempt, shared=primary)
+                if delay is None:
+                    raise _translate_exception(exc) from exc
+            attempt += 1
+            self._wait_before_retry(delay, shared=primary)
 
     def chat_completion_stream(
         self,
@@ -441,58 +599,277 @@ class AIClient:
             AIClientTimeoutError: The request timed out.
             AIClientAPIError: The provider returned an error.
         """
+        if self.fallback_llms:
+            self._schedule(messages)
+            try:
+                yield from async_loop.iterate(self._ahedged_stream(messages))
+            except Exception as exc:
+                raise _translate_exception(exc) from exc
+            return
+
+        attempt = 0
+        while True:
+            self._schedule(messages)
+            sent = False
+            try:
+                for chunk in self.llm.stream(messages):
+                    if chunk.content:
+                        sent = True
+                        yield chunk.content
+                return
+            except Exception as exc:
+                # Once text went out a retry would repeat it
+                delay = None if sent else self._rate_limit_retry_delay(exc, attempt)
+                if delay is None:
+                    raise _translate_exception(exc) from exc
+            attempt += 1
+            self._wait_before_retry(delay)
+
+    # -------------------- endpoints --------------------
+
+    @property
+    def _llms(self) -> list:
+        """Primary client followed by the fallback endpoints."""
+        return [self.llm, *self.fallback_llms]
+
+    async def _ahedged_stream(self, messages: list) -> AsyncIterator[str]:
+        """Stream from the first endpoint to produce a token.
+
+        The primary starts alone. The next endpoint is started when no token
+        arrived within ``hedge_delay`` (hedging), or at once when every
+        running endpoint failed with a connection, timeout, 429 or 5xx error
+        (failover). The first endpoint to produce text is kept and the
+        others are cancelled; after that, its errors are raised as is.
+        """
+        loop = asyncio.get_running_loop()
+        llms = self._llms
+        events = asyncio.Queue()
+        tasks = []
+        failed = set()
+
+        async def pump(index, llm):
+            try:
+                async for chunk in llm.astream(messages):
+                    if chunk.content:
+                        await events.put((index, chunk.content, None))
+                await events.put((index, None, None))
+            except Exception as exc:
+                await events.put((index, None, exc))
+
+        def launch():
+            tasks.append(asyncio.ensure_future(pump(len(tasks), llms[len(tasks)])))
+            return loop.time() + self.hedge_delay
+
+        hedge_at = launch()
+        winner = None
         try:
-            for chunk in self.llm.stream(messages):
-                if chunk.content:
-                    yield chunk.content
-        except Exception as exc:
-            raise _translate_exception(exc) from exc
+            while True:
+                timeout = None
+                if winner is None and self.hedge_delay and len(tasks) < len(llms):
+                    timeout = max(hedge_at - loop.time(), 0)
+                try:
+                    index, content, error = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    _logger.info(
+                        "No first token from AI endpoint %s after %.1fs, hedging to endpoint %s",
+                        len(tasks) - 1, self.hedge_delay, len(tasks),
+                    )
+                    hedge_at = launch()
+                    continue
+
+                if winner is None:
+                    if error is not None:
+                        failed.add(index)
+                        if not _is_failover_error(error):
+                            raise error
+                        _logger.warning("AI endpoint %s failed before answering: %s", index, error)
+                        if len(failed) == len(tasks):
+                            if len(tasks) == len(llms):
+                                raise error
+                            hedge_at = launch()
+                        continue
+                    winner = index
+                    for other, task in enumerate(tasks):
+                        if other != winner:
+                            task.cancel()
+                    if index:
+                        _logger.info("AI endpoint %s answered first", index)
+                elif index != winner:
+                    continue
+
+                if error is not None:
+                    raise error
+                if content is None:
+                    return
+                yield content
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # -------------------- rate limits --------------------
+
+    def _estimate_tokens(self, messages: list) -> int:
+        """Tokens a call counts against the provider limit: prompt plus max output."""
+        prompt = sum(
+            count_message_tokens(str(message.content or ""), self.model_name)
+            for message in messages
+        )
+        return prompt + self.max_tokens
+
+    def _schedule(self, messages: list):
+        """Wait until the provider limits allow one more call.
+
+        Raises:
+            AIClientAPIError: No slot within the scheduler bounds (status 429).
+        """
+        if self.rate_limit is None:
+            return
+        try:
+            llm_scheduler.acquire(self.rate_limit, self._estimate_tokens(messages), self.priority)
+        except llm_scheduler.SchedulerBusy as exc:
+            raise AIClientAPIError(
+                "AI provider is busy, please try again shortly",
+                status_code=429,
+                detail=str(exc),
+            ) from exc
+
+    def _rate_limit_retry_delay(self, exc: Exception, attempt: int, shared: bool = True) -> Optional[float]:
+        """Delay before retrying a call that failed with ``exc``, or None to give up.
+
+        A 429 of the primary endpoint (``shared``) also blocks the shared
+        bucket until the provider's reset, so other workers hold back as
+        well. Fallback endpoints have limits of their own and leave the
+        bucket alone.
+        """
+        if attempt >= llm_scheduler.RATE_LIMIT_MAX_RETRIES or not llm_scheduler.is_rate_limit_error(exc):
+            return None
+        delay = llm_scheduler.retry_delay(exc, attempt)
+        _logger.info("AI provider rate limit hit, retrying in %.1fs (attempt %s)", delay, attempt + 1)
+        if shared and self.rate_limit is not None:
+            llm_scheduler.block(self.rate_limit, delay)
+        return delay
+
+    def _wait_before_retry(self, delay: float, shared: bool = True):
+        # With a shared bucket the next _schedule() waits for the block
+        if not shared or self.rate_limit is None:
+            time.sleep(delay)
+
+    async def _acall_scheduled(self, messages: list, call):
+        """Async variant of the schedule / 429 retry loop around ``call()``.
+
+        The blocking scheduler runs in an executor thread so the shared
+        worker event loop keeps serving other generations.
+        """
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            await loop.run_in_executor(None, self._schedule, messages)
+            try:
+                return await call()
+            except Exception as exc:
+                delay = await loop.run_in_executor(None, self._rate_limit_retry_delay, exc, attempt)
+                if delay is None:
+                    raise
+            attempt += 1
+            if self.rate_limit is None:
+                await asyncio.sleep(delay)
 
 
 # ---------------------------------------------------------------------------
-# Internal helpers
+# Internal: per-process caches of LLM clients and compiled agent graphs
 # ---------------------------------------------------------------------------
 
-def _make_server_key(server):
-    """Build a clean, unique key for MultiServerMCPClient config dict.
+LLM_CACHE_MAX_ENTRIES = 32
+GRAPH_CACHE_MAX_ENTRIES = 64
 
-    Uses ``s{id}`` format (e.g. ``s42``) to guarantee uniqueness even when
-    multiple MCP servers share the same display name.
-    """
-    return f"s{server.id}"
 
+class _LRUCache:
+    """Small thread-safe LRU mapping, shared by all request threads."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        # Built outside the lock; a concurrent miss builds a spare copy
+        value = factory()
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
 
-def _build_prefixed_enabled_names(mcp_tools):
-    """Build set of prefixed tool names matching ``tool_name_prefix=True`` output.
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
-    When ``MultiServerMCPClient`` is created with ``tool_name_prefix=True``,
-    each tool name is prefixed with ``{server_key}_``.  This function
-    pre-computes the same prefixed names so we can filter tools correctly.
+
+_llm_cache = _LRUCache(LLM_CACHE_MAX_ENTRIES)
+_graph_cache = _LRUCache(GRAPH_CACHE_MAX_ENTRIES)
+
+
+def _get_llm(api_base_url, api_key, model_name, max_tokens, temperature):
+    """Cache key and shared ``ChatOpenAI`` client of one endpoint.
+
+    Clients are shared between requests: same settings, same client.
     """
-    return {f"{_make_server_key(t.server_id)}_{t.name}" for t in mcp_tools}
+    base_url = api_base_url.rstrip("/")
+    key = (
+        base_url,
+        hashlib.sha256(api_key.encode()).hexdigest(),
+        model_name,
+        max_tokens,
+        temperature,
+    )
+    return key, _llm_cache.get_or_create(key, lambda: ChatOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        model=model_name,
+        max_tokens=max_tokens,
+        temperature=temperature,
+    ))
 
 
-def _build_mcp_server_config(mcp_tools):
-    """Build MultiServerMCPClient config from an Odoo mcp_tool recordset.
+def clear_ai_client_caches():
+    """Drop cached LLM clients and graphs (e.g. after an ``ai.config`` change).
 
-    Groups tools by their server and returns a dict keyed by a unique
-    server key (``s{id}``), with each value being the server's connection
-    config.  Using the record ID as key avoids collisions when two servers
-    share the same display name.
+    Keys already change with the settings; this releases the stale entries
+    right away instead of waiting for LRU eviction.
     """
-    servers = {}
-    for tool in mcp_tools:
-        server = tool.server_id
-        key = _make_server_key(server)
-        if key not in servers:
-            servers[key] = server._get_mcp_client_config()
-    return servers
+    _llm_cache.clear()
+    _graph_cache.clear()
+
+
+def _tools_fingerprint(tools) -> tuple:
+    """Stable identity of a tool set: names plus what each tool binds."""
+    return tuple(sorted(
+        (tool.name, (tool.metadata or {}).get('mcp_fingerprint') or str(id(tool)))
+        for tool in tools
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Internal: translate LangChain / openai exceptions into AIClient* errors
 # ---------------------------------------------------------------------------
 
+def _is_failover_error(exc: Exception) -> bool:
+    """Whether another endpoint may succeed where this one failed."""
+    if isinstance(exc, (AIClientConnectionError, AIClientTimeoutError)):
+        return True
+    if llm_scheduler.is_rate_limit_error(exc):
+        return True
+    translated = _translate_exception(exc)
+    if isinstance(translated, (AIClientConnectionError, AIClientTimeoutError)):
+        return True
+    return (translated.status_code or 0) >= 500
+
+
 def _translate_exception(exc: Exception) -> AIClientError:
     """Map upstream exceptions to the AIClient* hierarchy."""
     exc_type = type(exc).__name__
@@ -13,8 +13,45 @@ class AIConfig(models.Model):
         help='Custom API base URL for OpenAI-compatible endpoints '
              '(e.g. https://api.openai.com/v1).',
     )
+    rate_limit_rpm = fields.Integer(
+        string='Requests per Minute',
+        default=0,
+        help='Provider request limit shared by all workers; requests wait '
+             'for a slot instead of failing with 429. 0 = no limit.',
+    )
+    rate_limit_tpm = fields.Integer(
+        string='Tokens per Minute',
+        default=0,
+        help='Provider token limit (prompt plus max tokens) shared by all '
+             'workers. 0 = no limit.',
+    )
+    endpoint_ids = fields.One2many(
+        comodel_name='woow_paas_platform.ai_endpoint',
+        inverse_name='config_id',
+        string='Fallback Endpoints',
+        help='Tried in order when the main endpoint fails or is slow.',
+    )
+    hedge_delay_ms = fields.Integer(
+        string='Hedge Delay (ms)',
+        default=3000,
+        help='When a streamed reply has no first token after this delay, the '
+             'next fallback endpoint is started in parallel and the first to '
+             'answer is kept. 0 = only fail over on errors.',
+    )
 
     def _get_default_model(self):
         if self.type == 'openai_compatible':
             return 'gpt-4o-mini'
         return super()._get_default_model()
+
+    def write(self, vals):
+        result = super().write(vals)
+        from .ai_client import clear_ai_client_caches
+        clear_ai_client_caches()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        from .ai_client import clear_ai_client_caches
+        clear_ai_client_caches()
+        return result
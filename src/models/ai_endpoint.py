@@ -0,0 +1,49 @@
+from odoo import fields, models
+
+
+class AIEndpoint(models.Model):
+    """Fallback OpenAI-compatible endpoint of an ``ai.config``.
+
+    Tried in sequence after the configuration's own endpoint: on connection
+    errors, and for streamed replies when no first token arrived within
+    the configuration's hedge delay (see ``AIClient``).
+    """
+    _name = 'woow_paas_platform.ai_endpoint'
+    _description = 'AI Fallback Endpoint'
+    _order = 'sequence, id'
+
+    config_id = fields.Many2one(
+        comodel_name='ai.config',
+        string='AI Configuration',
+        required=True,
+        ondelete='cascade',
+        index=True,
+    )
+    sequence = fields.Integer(string='Sequence', default=10)
+    active = fields.Boolean(string='Active', default=True)
+    name = fields.Char(string='Name', required=True)
+    api_base_url = fields.Char(
+        string='API Base URL',
+        required=True,
+        help='OpenAI-compatible endpoint (e.g. http://ollama:11434/v1).',
+    )
+    api_key = fields.Char(
+        string='API Key',
+        help='Leave empty to use the API key of the configuration.',
+    )
+    model = fields.Char(
+        string='Model',
+        help='Leave empty to use the model of the configuration.',
+    )
+
+    def write(self, vals):
+        result = super().write(vals)
+        from .ai_client import clear_ai_client_caches
+        clear_ai_client_caches()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        from .ai_client import clear_ai_client_caches
+        clear_ai_client_caches()
+        return result
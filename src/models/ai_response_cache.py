@@ -0,0 +1,208 @@
+import base64
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from datetime import timedelta
+
+from odoo import api, fields, models, tools
+
+from ..services import async_loop
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_logger = logging.getLogger(__name__)
+
+# Shorter questions ("yes", "thanks") depend on the conversation; never cached
+RESPONSE_CACHE_MIN_CHARS = 15
+# Most recent entries compared by embedding for a near-duplicate lookup
+NEAR_DUPLICATE_CANDIDATES = 200
+
+_TRAILING_PUNCTUATION = ' \t\n.,;:!?。，；：！？…'
+
+
+def normalize_question(text):
+    """Canonical form of a user question: NFKC, case-folded, single spaces."""
+    text = unicodedata.normalize('NFKC', text or '').casefold()
+    return re.sub(r'\s+', ' ', text).strip(_TRAILING_PUNCTUATION)
+
+
+class AiResponseCache(models.Model):
+    _name = 'woow_paas_platform.ai_response_cache'
+    _description = 'AI Response Cache Entry'
+    _order = 'id desc'
+
+    assistant_id = fields.Many2one(
+        comodel_name='ai.assistant',
+        string='Assistant',
+        required=True,
+        ondelete='cascade',
+    )
+    key = fields.Char(
+        string='Key',
+        required=True,
+        index=True,
+        help='Hash of (model settings, system prompt, normalized question)',
+    )
+    context_hash = fields.Char(
+        string='Context Hash',
+        required=True,
+        help='Hash of the model settings and system prompt; near-duplicate '
+             'matches only reuse answers given in the same context',
+    )
+    question = fields.Text(string='Question', required=True)
+    answer = fields.Text(string='Answer', required=True)
+    embedding = fields.Binary(
+        string='Question Embedding',
+        attachment=False,
+        help='Normalized float32 embedding of the question (base64)',
+    )
+    hit_count = fields.Integer(string='Hits', default=0)
+    expires_at = fields.Datetime(string='Expires At', required=True, index=True)
+
+    def init(self):
+        super().init()
+        # Near-duplicate candidates of one assistant and context
+        tools.create_index(
+            self._cr, 'woow_paas_platform_ai_response_cache_lookup_idx', self._table,
+            ['assistant_id', 'context_hash', 'expires_at'],
+        )
+
+    # -------------------- lookup / store --------------------
+
+    @api.model
+    def _make_probe(self, assistant, client, system_prompt, question, history=()):
+        """Describe a cache lookup for one AI reply, or None if not cacheable.
+
+        The probe is a plain dict so it can be carried into a streaming
+        generator and used with another cursor by :meth:`_store_answer`.
+
+        Args:
+            assistant: The ``ai.assistant`` answering.
+            client: Its :class:`AIClient` (model settings are part of the key).
+            system_prompt: The full system prompt, cloud service block included.
+            question: The user message.
+            history: Prompt messages sent before the question (conversation
+                summary and kept turns). Part of the context, so a follow-up
+                is only answered from the same conversation; a first question
+                has no turns and is shared across channels.
+        """
+        assistant = assistant.sudo()
+        if not assistant.response_cache_enabled:
+            return None
+        normalized = normalize_question(question)
+        if len(normalized) < RESPONSE_CACHE_MIN_CHARS:
+            return None
+        turns = [[getattr(msg, 'type', ''), str(getattr(msg, 'content', ''))] for msg in history]
+        context_hash = hashlib.sha256(json.dumps([
+            list(client._llm_key),
+            hashlib.sha256((system_prompt or '').encode()).hexdigest(),
+            hashlib.sha256(json.dumps(turns).encode()).hexdigest(),
+        ]).encode()).hexdigest()
+        return {
+            'assistant_id': assistant.id,
+            'key': hashlib.sha256(f'{context_hash}\n{normalized}'.encode()).hexdigest(),
+            'context_hash': context_hash,
+            'question': normalized,
+            'ttl_hours': assistant.response_cache_ttl or 24,
+            'similarity': assistant.response_cache_similarity or 0.0,
+        }
+
+    @api.model
+    def _find_answer(self, probe):
+        """Cached answer for a probe: exact match first, then near duplicate.
+
+        Returns:
+            The answer text, or None on a miss.
+        """
+        if not probe:
+            return None
+        Cache = self.sudo()
+        now = fields.Datetime.now()
+        entry = Cache.search([
+            ('assistant_id', '=', probe['assistant_id']),
+            ('key', '=', probe['key']),
+            ('expires_at', '>', now),
+        ], limit=1)
+        if not entry and probe['similarity'] > 0:
+            entry = Cache._find_near_duplicate(probe, now)
+        if not entry:
+            return None
+        # Plain increment: no ORM write, so concurrent hits do not conflict
+        self.env.cr.execute(
+            f"UPDATE {self._table} SET hit_count = hit_count + 1 WHERE id = %s", [entry.id],
+        )
+        entry.invalidate_recordset(['hit_count'])
+        return entry.answer
+
+    @api.model
+    def _find_near_duplicate(self, probe, now):
+        vector = self._embed(probe['question'])
+        if vector is None:
+            return self.browse()
+        candidates = self.search_fetch([
+            ('assistant_id', '=', probe['assistant_id']),
+            ('context_hash', '=', probe['context_hash']),
+            ('expires_at', '>', now),
+            ('embedding', '!=', False),
+        ], ['embedding'], limit=NEAR_DUPLICATE_CANDIDATES)
+        best, best_score = self.browse(), probe['similarity']
+        for candidate in candidates:
+            other = np.frombuffer(base64.b64decode(candidate.embedding), dtype=np.float32)
+            if other.shape != vector.shape:
+                # Written with another embedding model
+                continue
+            score = float(np.dot(vector, other))
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    @api.model
+    def _store_answer(self, probe, answer):
+        """Cache the answer of a probe (replacing an entry with the same key)."""
+        if not probe or not answer:
+            return
+        Cache = self.sudo()
+        vector = self._embed(probe['question']) if probe['similarity'] > 0 else None
+        Cache.search([
+            ('assistant_id', '=', probe['assistant_id']),
+            ('key', '=', probe['key']),
+        ]).unlink()
+        Cache.create({
+            'assistant_id': probe['assistant_id'],
+            'key': probe['key'],
+            'context_hash': probe['context_hash'],
+            'question': probe['question'],
+            'answer': answer,
+            'embedding': base64.b64encode(vector.tobytes()) if vector is not None else False,
+            'expires_at': fields.Datetime.now() + timedelta(hours=probe['ttl_hours']),
+        })
+
+    @api.model
+    def _embed(self, text):
+        """Unit-length embedding of ``text``, or None when embeddings are unavailable.
+
+        Uses the FastEmbed model of ``ai_base_gt`` (optional dependency).
+        """
+        if np is None:
+            return None
+        try:
+            model = self.env['ai.data.item']._get_embedding_model()
+            # Model inference is CPU-bound: keep it off the gevent hub
+            vector = async_loop.run_blocking(
+                lambda: np.asarray(next(iter(model.embed([text]))), dtype=np.float32),
+            )
+        except Exception as exc:
+            _logger.debug("Embeddings unavailable for the AI response cache: %s", exc)
+            return None
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    @api.autovacuum
+    def _gc_expired_entries(self):
+        """Remove expired entries (daily autovacuum)."""
+        self.sudo().search([('expires_at', '<=', fields.Datetime.now())]).unlink()
@@ -0,0 +1,218 @@
+import hashlib
+import logging
+import os
+import secrets
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Largest accepted chunk; the client uses the chunk_size returned by init
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_MAX_CHUNK_SIZE = 4 * 1024 * 1024
+# Block size when copying to and hashing the part file
+UPLOAD_COPY_BLOCK = 64 * 1024
+# Unfinished uploads are discarded after this long without a chunk
+UPLOAD_SESSION_TTL = timedelta(hours=24)
+
+
+class ChatUploadError(Exception):
+    """A chunk or finalize request that does not match the upload state."""
+
+    def __init__(self, message, status=400, received=None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.received = received
+
+
+class ChatUpload(models.Model):
+    """Resumable chunked upload of a chat attachment.
+
+    Chunks are appended to a part file in the filestore, so a request never
+    holds more than one chunk. The upload state is the size of that file:
+    after a dropped connection the client asks for it and resumes from
+    there, on any worker. Finalizing moves the file into the filestore under
+    its content checksum and creates the ``ir.attachment`` around it.
+    """
+    _name = 'woow_paas_platform.chat_upload'
+    _description = 'Chat Attachment Upload'
+
+    token = fields.Char(
+        string='Token',
+        required=True,
+        index=True,
+        readonly=True,
+        copy=False,
+        default=lambda self: secrets.token_urlsafe(24),
+    )
+    channel_id = fields.Many2one(
+        comodel_name='discuss.channel',
+        string='Channel',
+        required=True,
+        ondelete='cascade',
+    )
+    user_id = fields.Many2one(
+        comodel_name='res.users',
+        string='User',
+        required=True,
+        ondelete='cascade',
+        default=lambda self: self.env.user,
+    )
+    file_name = fields.Char(string='File Name', required=True)
+    file_size = fields.Integer(string='File Size', required=True)
+
+    _sql_constraints = [
+        ('unique_token', 'UNIQUE(token)', 'Upload token must be unique.'),
+    ]
+
+    def unlink(self):
+        paths = [upload._part_path() for upload in self]
+        res = super().unlink()
+        for path in paths:
+            self._remove_file(path)
+        return res
+
+    # -------------------- part file --------------------
+
+    def _part_path(self):
+        self.ensure_one()
+        return os.path.join(self.env['ir.attachment']._filestore(), 'chat_upload', f'{self.token}.part')
+
+    def _lock(self):
+        """Lock the upload row until the end of the transaction.
+
+        Serializes chunk and finalize requests of one upload across workers
+        (e.g. a retried chunk while the first attempt is still writing), so
+        the size read and the append happen as one step.
+        """
+        self.ensure_one()
+        self.env.cr.execute(f"SELECT id FROM {self._table} WHERE id = %s FOR UPDATE", [self.id])
+
+    def _get_received(self):
+        """Bytes received so far (the offset of the next chunk)."""
+        try:
+            return os.path.getsize(self._part_path())
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            _logger.warning("Cannot remove upload part file %s: %s", path, exc)
+
+    def _append_chunk(self, offset, stream, checksum=None):
+        """Append one chunk read from ``stream`` at ``offset``.
+
+        Args:
+            offset: Where the chunk starts; must equal the bytes received.
+            stream: File-like object with the chunk data.
+            checksum: Optional SHA-256 hex digest of the chunk.
+
+        Returns:
+            int: Bytes received after this chunk.
+
+        Raises:
+            ChatUploadError: Offset mismatch (409, with the current offset),
+                chunk too large or beyond the declared size, or checksum
+                mismatch. The part file is left as it was.
+        """
+        self._lock()
+        received = self._get_received()
+        if offset != received:
+            raise ChatUploadError('Offset does not match the bytes received', 409, received)
+
+        path = self._part_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        limit = min(UPLOAD_MAX_CHUNK_SIZE, self.file_size - received)
+        digest = hashlib.sha256()
+        written = 0
+        with open(path, 'ab') as part:
+            try:
+                while True:
+                    block = stream.read(UPLOAD_COPY_BLOCK)
+                    if not block:
+                        break
+                    written += len(block)
+                    if written > limit:
+                        raise ChatUploadError('Chunk exceeds the chunk size or the declared file size', 413)
+                    digest.update(block)
+                    part.write(block)
+                if checksum and digest.hexdigest() != checksum.lower():
+                    raise ChatUploadError('Chunk checksum mismatch')
+            except BaseException:
+                part.truncate(received)
+                raise
+        # Marks the session as active for the cleanup
+        self.write({'file_size': self.file_size})
+        return received + written
+
+    def _finalize(self):
+        """Turn the completed part file into an attachment of the channel.
+
+        The SHA-1 the filestore names files by is computed in one streaming
+        pass over the part file, which is then moved (not copied) into place.
+
+        Returns:
+            The created ``ir.attachment`` record.
+
+        Raises:
+            ChatUploadError: The upload is incomplete.
+        """
+        self._lock()
+        received = self._get_received()
+        if received != self.file_size:
+            raise ChatUploadError('Upload is incomplete', 409, received)
+
+        path = self._part_path()
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as part:
+            for block in iter(lambda: part.read(UPLOAD_COPY_BLOCK), b''):
+                sha1.update(block)
+        checksum = sha1.hexdigest()
+
+        Attachment = self.env['ir.attachment'].sudo()
+        vals = {
+            'name': self.file_name,
+            'res_model': 'discuss.channel',
+            'res_id': self.channel_id.id,
+            'mimetype': Attachment._compute_mimetype({'name': self.file_name}),
+        }
+        if Attachment._storage() == 'file':
+            fname = f'{checksum[:2]}/{checksum}'
+            full_path = Attachment._full_path(fname)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if os.path.exists(full_path):
+                # Same content already stored
+                self._remove_file(path)
+            else:
+                os.replace(path, full_path)
+            # Collected by the filestore GC if this transaction rolls back
+            Attachment._mark_for_gc(fname)
+            # create() drops store_fname / checksum / file_size from the
+            # values: create the record without data, then point it at the file
+            attachment = Attachment.create(vals)
+            self.env.cr.execute(f"""
+                UPDATE {attachment._table}
+                   SET store_fname = %s, checksum = %s, file_size = %s
+                 WHERE id = %s
+            """, [fname, checksum, received, attachment.id])
+            attachment.invalidate_recordset(['store_fname', 'checksum', 'file_size', 'raw', 'datas'])
+        else:
+            with open(path, 'rb') as part:
+                vals['raw'] = part.read()
+            attachment = Attachment.create(vals)
+        self.unlink()
+        return attachment
+
+    @api.autovacuum
+    def _gc_stale_uploads(self):
+        """Discard uploads without a chunk for ``UPLOAD_SESSION_TTL``."""
+        self.sudo().search([
+            ('write_date', '<', fields.Datetime.now() - UPLOAD_SESSION_TTL),
+        ]).unlink()
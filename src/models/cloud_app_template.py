@@ -1,8 +1,18 @@
-from odoo import fields, models
+from collections import Counter
+
+from odoo import api, fields, models, tools
+
+# Fields serialized in the marketplace catalog (see ``_catalog_entry``)
+CATALOG_FIELDS = {
+    'name', 'slug', 'description', 'category', 'tags', 'monthly_price',
+    'documentation_url', 'default_port', 'ingress_enabled', 'min_vcpu',
+    'min_ram_gb', 'min_storage_gb', 'is_active',
+}
 
 
 class CloudAppTemplate(models.Model):
     _name = 'woow_paas_platform.cloud_app_template'
+    _inherit = ['woow_paas_platform.json_field.mixin']
     _description = 'Cloud Application Template'
     _order = 'name'
 
@@ -10,6 +20,7 @@ class CloudAppTemplate(models.Model):
     name = fields.Char(
         string='Name',
         required=True,
+        index='trigram',
         help='Application name (e.g., PostgreSQL, n8n)',
     )
     slug = fields.Char(
@@ -23,6 +34,7 @@ class CloudAppTemplate(models.Model):
     )
     description = fields.Char(
         string='Description',
+        index='trigram',
         help='Short description (~100 characters)',
     )
     full_description = fields.Text(
@@ -170,3 +182,90 @@ class CloudAppTemplate(models.Model):
         default=True,
         help='Whether this template is available for deployment',
     )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        if CATALOG_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
+    def _catalog_entry(self):
+        """Serialize a template for the marketplace listing."""
+        self.ensure_one()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'slug': self.slug or '',
+            'description': self.description or '',
+            'category': self.category,
+            'tags': self._get_json_field('tags', []),
+            'monthly_price': self.monthly_price,
+            'documentation_url': self.documentation_url or '',
+            'default_port': self.default_port,
+            'ingress_enabled': self.ingress_enabled,
+            'min_vcpu': self.min_vcpu,
+            'min_ram_gb': self.min_ram_gb,
+            'min_storage_gb': self.min_storage_gb,
+        }
+
+    @api.model
+    @tools.ormcache()
+    def _get_catalog(self):
+        """Pre-serialized catalog of all active templates, ordered by (name, id).
+
+        Cached once and cleared when a template is created, deleted or has
+        one of its ``CATALOG_FIELDS`` changed. The catalog is the same for
+        every user, so it is built as superuser. The returned entries are
+        shared and must be treated as read-only.
+
+        Returns:
+            tuple: Catalog entries (see ``_catalog_entry``)
+        """
+        templates = self.sudo().search([('is_active', '=', True)], order='name, id')
+        return tuple(template._catalog_entry() for template in templates)
+
+    @api.model
+    def _search_catalog(self, category=None, search=None):
+        """Catalog entries matching a marketplace filter, in catalog order.
+
+        Filters the cached catalog in memory, so client supplied filters
+        never become cache keys. ``search`` matches the name or description,
+        case-insensitively.
+
+        Returns:
+            tuple: Catalog entries (see ``_catalog_entry``)
+        """
+        catalog = self._get_catalog()
+        if not category and not search:
+            return catalog
+        needle = (search or '').casefold()
+        return tuple(
+            entry for entry in catalog
+            if (not category or entry['category'] == category)
+            and (needle in entry['name'].casefold() or needle in entry['description'].casefold())
+        )
+
+    @api.model
+    def _get_catalog_facets(self, search=None):
+        """Number of active templates per category matching ``search``.
+
+        Ignores the category filter so the marketplace can show the count
+        of every tab.
+
+        Returns:
+            dict: category -> template count
+        """
+        return dict(Counter(
+            entry['category'] for entry in self._search_catalog(search=search) if entry['category']
+        ))
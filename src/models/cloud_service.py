@@ -1,10 +1,84 @@
+import json
+import logging
+import re
 import uuid
 
-from odoo import fields, models
+from odoo import api, fields, models, tools
+
+from ..services.paas_operator import get_paas_operator_client, PaaSOperatorError
+
+_logger = logging.getLogger(__name__)
+
+# States in which the operator is still converging on the release
+SERVICE_TRANSITIONAL_STATES = ('deploying', 'initializing', 'upgrading', 'deleting')
+# Post-deploy init attempts before the service is put in error
+POST_DEPLOY_INIT_MAX_RETRIES = 5
+
+# Fields whose changes are pushed to the workspace bus channel
+BUS_NOTIFY_FIELDS = {
+    'name', 'state', 'subdomain', 'custom_domain', 'error_message',
+    'helm_revision', 'deployed_at',
+}
+
+
+# Helm value keys whose values are never shown to the AI assistant
+SECRET_KEY_PATTERN = re.compile(
+    r'pass(word|wd)?|secret|token|api[_-]?key|credential|private[_-]?key|cert|salt',
+    re.IGNORECASE,
+)
+MASKED_VALUE = '********'
+# Size limits of the configuration listed in the AI context block
+AI_CONTEXT_MAX_VALUES = 40
+AI_CONTEXT_MAX_VALUE_CHARS = 200
+
+
+def _flatten_values(values, prefix=''):
+    """Flatten nested Helm values into ``{'a.b.c': leaf}`` pairs."""
+    flat = {}
+    for key, value in values.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_values(value, f'{path}.'))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten_dotpath_keys(flat_dict):
+    """Convert flat dot-path keys to nested dict structure.
+
+    Example: {"a.b.c": 1, "a.b.d": 2} → {"a": {"b": {"c": 1, "d": 2}}}
+    Keys without dots are kept as-is.
+    """
+    result = {}
+    for key, value in flat_dict.items():
+        parts = key.split('.')
+        if len(parts) == 1:
+            result[key] = value
+            continue
+        d = result
+        for part in parts[:-1]:
+            if part not in d or not isinstance(d[part], dict):
+                d[part] = {}
+            d = d[part]
+        d[parts[-1]] = value
+    return result
+
+
+def deep_merge(base, override):
+    """Deep merge override into base. Override values win on conflict."""
+    result = base.copy()
+    for key, value in override.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
 
 
 class CloudService(models.Model):
     _name = 'woow_paas_platform.cloud_service'
+    _inherit = ['woow_paas_platform.json_field.mixin']
     _description = 'Cloud Service Instance'
     _order = 'create_date desc'
 
@@ -185,3 +259,469 @@ class CloudService(models.Model):
         string='Last Upgraded At',
         help='Timestamp of the most recent upgrade',
     )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        services = super().create(vals_list)
+        services._notify_workspace_bus()
+        return services
+
+    def write(self, vals):
+        res = super().write(vals)
+        if BUS_NOTIFY_FIELDS.intersection(vals):
+            self._notify_workspace_bus()
+        return res
+
+    def unlink(self):
+        deleted = [(service.workspace_id, service.id) for service in self if service.workspace_id]
+        res = super().unlink()
+        for workspace, service_id in deleted:
+            workspace._notify_bus('woow_paas_platform/service_deleted', {
+                'id': service_id,
+                'workspace_id': workspace.id,
+            })
+        return res
+
+    def _notify_workspace_bus(self):
+        """Push the current state of each service to its workspace channel."""
+        for service in self:
+            if not service.workspace_id:
+                continue
+            service.workspace_id._notify_bus('woow_paas_platform/service_updated', {
+                'id': service.id,
+                'workspace_id': service.workspace_id.id,
+                'name': service.name,
+                'state': service.state,
+                'subdomain': service.subdomain or '',
+                'custom_domain': service.custom_domain or '',
+                'error_message': service.error_message or '',
+                'helm_revision': service.helm_revision,
+                'deployed_at': service.deployed_at.isoformat() if service.deployed_at else None,
+            })
+
+    # -------------------- Operator status --------------------
+
+    def _refresh_operator_status(self):
+        """Poll the operator for each service and apply its release status.
+
+        Uses optimistic locking to prevent race conditions:
+        - Re-reads each service before updating to get latest state
+        - Only updates if service is still in expected state
+        - Skips update if state changed (another process already updated)
+        """
+        client = get_paas_operator_client(self.env)
+        if not client:
+            return
+        for service in self:
+            service._apply_operator_status(client)
+
+    def _apply_operator_status(self, client):
+        """Move this service to the state matching its Helm release."""
+        self.ensure_one()
+        original_state = self.state
+        service_id = self.id
+
+        try:
+            status = client.get_status(
+                namespace=self.helm_namespace,
+                release_name=self.helm_release_name,
+            )
+
+            release = status.get('release', {})
+            pods = status.get('pods', [])
+
+            release_status = release.get('status', '')
+            helm_revision = release.get('revision', self.helm_revision)
+
+            # Re-read service to get latest state (optimistic locking)
+            self.invalidate_recordset()
+            if not self.exists():
+                _logger.debug("Service %s no longer exists, skipping status update", service_id)
+                return
+
+            # Only proceed if state hasn't changed since we started
+            if self.state != original_state:
+                _logger.debug(
+                    "Service %s state changed from %s to %s, skipping update",
+                    service_id, original_state, self.state
+                )
+                return
+
+            # Determine new state based on release status and pod status
+            if release_status == 'deployed':
+                # Check if all pods are ready
+                all_ready = all(
+                    pod.get('phase') == 'Running' and '/' in pod.get('ready', '0/0')
+                    and pod.get('ready', '0/0').split('/')[0] == pod.get('ready', '0/0').split('/')[1]
+                    for pod in pods
+                ) if pods else True
+
+                if all_ready:
+                    template = self.template_id
+                    needs_init = (
+                        template.post_deploy_init_type
+                        and template.post_deploy_init_type != 'none'
+                    )
+
+                    if needs_init and original_state == 'deploying':
+                        # Pods ready but need post-deploy init → transition to initializing
+                        self.write({
+                            'state': 'initializing',
+                            'helm_revision': helm_revision,
+                            'error_message': False,
+                        })
+                        self._run_post_deploy_init()
+
+                    elif needs_init and original_state == 'initializing':
+                        # Already initializing, retry if needed
+                        self._run_post_deploy_init()
+
+                    else:
+                        # No init needed or already done → running
+                        self.write({
+                            'state': 'running',
+                            'helm_revision': helm_revision,
+                            'error_message': False,
+                        })
+
+                        # Auto-create MCP Server when transitioning to running
+                        if original_state != 'running':
+                            try:
+                                self._auto_create_mcp_server()
+                            except Exception as e:
+                                _logger.warning(
+                                    "Auto-create MCP server failed for service %s: %s",
+                                    self.name, e,
+                                )
+                # else: still deploying/waiting for pods
+
+            elif release_status == 'failed':
+                self.write({
+                    'state': 'error',
+                    'helm_revision': helm_revision,
+                    'error_message': release.get('description', 'Deployment failed'),
+                })
+
+            elif release_status in ['pending-install', 'pending-upgrade', 'pending-rollback']:
+                # Still in progress
+                pass
+
+        except PaaSOperatorError as e:
+            if e.status_code == 404:
+                # Release not found - might have been deleted
+                # Re-read to check current state
+                self.invalidate_recordset()
+                if self.exists() and self.state == 'deleting':
+                    self.unlink()
+            else:
+                _logger.warning("Error polling service status: %s", str(e))
+
+        except Exception as e:
+            _logger.warning("Error polling service status: %s", str(e))
+
+    def _run_post_deploy_init(self):
+        """Execute post-deploy initialization for this service.
+
+        Called when pods are ready but the application needs initialization
+        (e.g., n8n owner setup + API key generation).
+
+        On success: transitions to 'running' and auto-creates MCP server.
+        On failure: increments retry counter; after
+        ``POST_DEPLOY_INIT_MAX_RETRIES`` retries → 'error' state.
+        """
+        self.ensure_one()
+        template = self.template_id
+
+        if template.post_deploy_init_type == 'n8n':
+            client = get_paas_operator_client(self.env)
+            if not client:
+                _logger.warning("PaaS Operator not configured, cannot initialize n8n")
+                return
+
+            owner_email = self.n8n_owner_email or template.post_deploy_init_email or 'admin@woowtech.io'
+            owner_password = self.n8n_owner_password
+            if not owner_password:
+                # Fallback for services created before this feature
+                owner_password = 'W' + str(uuid.uuid4()).upper()
+
+            try:
+                result = client.init_n8n(
+                    namespace=self.helm_namespace,
+                    release_name=self.helm_release_name,
+                    owner_email=owner_email,
+                    owner_password=owner_password,
+                )
+
+                if result.get('success'):
+                    real_api_key = result['api_key']
+
+                    # Check if sidecar was properly restarted
+                    if not result.get('pod_restarted'):
+                        _logger.warning(
+                            "n8n init for service %s: API key updated in Secret but pod was NOT restarted. "
+                            "MCP sidecar may still use the old placeholder key until next pod restart.",
+                            self.name,
+                        )
+
+                    # Update helm_values to replace the UUID placeholder with the real API key
+                    update_vals = {
+                        'n8n_api_key': real_api_key,
+                        'state': 'running',
+                        'init_retries': 0,
+                        'init_error': False,
+                    }
+                    if template.mcp_api_key_helm_path and self.helm_values:
+                        try:
+                            current_values = json.loads(self.helm_values)
+                            api_key_nested = unflatten_dotpath_keys(
+                                {template.mcp_api_key_helm_path: real_api_key}
+                            )
+                            updated_values = deep_merge(current_values, api_key_nested)
+                            update_vals['helm_values'] = json.dumps(updated_values)
+                        except (json.JSONDecodeError, TypeError):
+                            _logger.warning("Failed to update helm_values with real API key for service %s", self.name)
+                    self.write(update_vals)
+                    _logger.info(
+                        "n8n init succeeded for service %s, API key and helm_values updated",
+                        self.name,
+                    )
+                    try:
+                        self._auto_create_mcp_server()
+                    except Exception as e:
+                        _logger.warning(
+                            "Auto-create MCP server failed for service %s: %s",
+                            self.name, e,
+                        )
+                else:
+                    retries = (self.init_retries or 0) + 1
+                    error_msg = result.get('error', 'Unknown error')
+                    vals = {
+                        'init_retries': retries,
+                        'init_error': error_msg,
+                    }
+                    if retries >= POST_DEPLOY_INIT_MAX_RETRIES:
+                        vals.update({
+                            'state': 'error',
+                            'error_message': f'n8n initialization failed after {retries} retries: {error_msg}',
+                        })
+                    self.write(vals)
+                    _logger.warning(
+                        "n8n init attempt %d failed for service %s: %s",
+                        retries, self.name, error_msg,
+                    )
+
+            except Exception as e:
+                retries = (self.init_retries or 0) + 1
+                vals = {
+                    'init_retries': retries,
+                    'init_error': str(e),
+                }
+                if retries >= POST_DEPLOY_INIT_MAX_RETRIES:
+                    vals.update({
+                        'state': 'error',
+                        'error_message': f'n8n initialization failed: {str(e)}',
+                    })
+                self.write(vals)
+                _logger.warning(
+                    "n8n init exception (attempt %d) for service %s: %s",
+                    retries, self.name, e,
+                )
+
+    def _auto_create_mcp_server(self):
+        """Auto-create MCP Server record for a cloud service with MCP enabled.
+
+        Called when a service transitions to 'running' state. Creates a
+        user-scope MCP Server record linked to the cloud service and
+        triggers tool discovery.
+
+        Idempotent: skips creation if an auto-created record already exists.
+        """
+        self.ensure_one()
+        template = self.template_id
+        if not template.mcp_enabled or not template.mcp_sidecar_image:
+            return
+
+        McpServer = self.env['woow_paas_platform.mcp_server'].sudo()
+
+        # Check if already exists (avoid duplicates on re-deploy/upgrade)
+        existing = McpServer.search([
+            ('cloud_service_id', '=', self.id),
+            ('auto_created', '=', True),
+        ], limit=1)
+        if existing:
+            _logger.debug(
+                "MCP Server already exists for service %s (id=%s), skipping auto-create",
+                self.name, existing.id,
+            )
+            return
+
+        # Create MCP Server record
+        server = McpServer.create({
+            'name': f"{self.name} MCP",
+            'url': self._build_mcp_endpoint_url(),
+            'transport': template.mcp_transport or 'streamable_http',
+            'scope': 'user',
+            'cloud_service_id': self.id,
+            'auto_created': True,
+            'api_key': self.mcp_auth_token,
+            'description': f"Auto-created MCP server for {self.name}",
+        })
+
+        _logger.info(
+            "Auto-created MCP Server '%s' (id=%s) for cloud service '%s'",
+            server.name, server.id, self.name,
+        )
+
+        # Try to sync tools using safe method (keeps state as 'draft' on
+        # failure so the cron retry mechanism can pick it up later).
+        server.action_sync_tools_safe()
+
+    def _build_mcp_endpoint_url(self):
+        """Build the MCP endpoint URL for this service's sidecar.
+
+        Constructs the URL using the service's subdomain and the PaaS
+        domain from system configuration. Falls back to a Kubernetes
+        internal service URL when no subdomain is available.
+
+        Returns:
+            str: The full MCP endpoint URL.
+        """
+        template = self.template_id
+        endpoint_path = template.mcp_endpoint_path or '/mcp'
+        sidecar_port = template.mcp_sidecar_port or 3001
+
+        # Prefer Kubernetes internal service URL (most reliable).
+        # The Cloudflare tunnel only routes to the main application port,
+        # not the sidecar port, so external URL via subdomain won't work
+        # for the MCP sidecar without additional Ingress configuration.
+        # Pattern: http://{release}-mcp.{namespace}.svc.cluster.local:{port}{path}
+        if self.helm_release_name and self.helm_namespace:
+            return (
+                f"http://{self.helm_release_name}-mcp"
+                f".{self.helm_namespace}.svc.cluster.local"
+                f":{sidecar_port}{endpoint_path}"
+            )
+
+        # Fallback: construct from subdomain (user can update later)
+        if self.subdomain:
+            IrConfigParameter = self.env['ir.config_parameter'].sudo()
+            paas_domain = IrConfigParameter.get_param(
+                'woow_paas_platform.paas_domain', 'woowtech.io',
+            )
+            return f"https://{self.subdomain}.{paas_domain}{endpoint_path}"
+
+        # Last resort: placeholder that the user must update
+        return f"http://localhost:{sidecar_port}{endpoint_path}"
+
+    def _trigger_status_refresh(self):
+        """Run the status refresh cron once the current transaction commits.
+
+        Called after an operation leaves services in a transitional state, so
+        their next transition does not wait for the cron interval.
+        """
+        if not self:
+            return
+        cron = self.env.ref(
+            'woow_paas_platform.ir_cron_refresh_cloud_service_status', raise_if_not_found=False,
+        )
+        if cron:
+            cron.sudo()._trigger()
+
+    @api.model
+    def _cron_refresh_transitional_services(self):
+        """Refresh services still converging on the operator.
+
+        Runs every minute and right after deploy, upgrade and rollback
+        operations (see :meth:`_trigger_status_refresh`). Transitions are
+        published on the workspace bus.
+        """
+        for service in self.search([('state', 'in', SERVICE_TRANSITIONAL_STATES)]):
+            try:
+                service._refresh_operator_status()
+                self.env.cr.commit()
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.warning("Cron status refresh failed for service %s: %s", service.id, e)
+
+    # -------------------- AI context --------------------
+
+    def _get_ai_context(self):
+        """Markdown block describing this service for AI system prompts.
+
+        Built once per (service, service ``write_date``, template
+        ``write_date``) and cached, so every turn of a conversation gets the
+        identical text.
+        """
+        self.ensure_one()
+        return self._build_ai_context(self.id, self.write_date, self.template_id.write_date)
+
+    @api.model
+    @tools.ormcache('service_id', 'service_write_date', 'template_write_date')
+    def _build_ai_context(self, service_id, service_write_date, template_write_date):
+        service = self.sudo().browse(service_id)
+        template = service.template_id
+
+        parts = ['## Cloud Service Information']
+        if template:
+            parts.append(f'- Application: {template.name}')
+            if template.category:
+                parts.append(f'- Category: {template.category}')
+            if template.description:
+                parts.append(f'- Description: {template.description}')
+
+        parts.append(f'- Service Name: {service.name}')
+        parts.append(f'- Status: {service.state or "unknown"}')
+
+        if service.subdomain:
+            parts.append(f'- URL: https://{service.subdomain}')
+        if service.error_message:
+            parts.append(f'- Error: {service.error_message}')
+
+        values = service._get_ai_context_values()
+        if values:
+            lines = '\n'.join(f'  - {key}: {value}' for key, value in values.items())
+            parts.append(f'- Configuration (Helm Values):\n{lines}')
+
+        return '\n'.join(parts)
+
+    def _get_ai_context_values(self):
+        """Helm values worth showing to the AI, secrets masked.
+
+        Keeps the keys declared in the template's ``helm_value_specs`` when
+        there are any, otherwise every non-empty leaf, up to
+        ``AI_CONTEXT_MAX_VALUES``. Values of password-type specs and of
+        secret-looking keys are masked.
+
+        Returns:
+            dict: Dotted key -> display value, sorted by key.
+        """
+        self.ensure_one()
+        flat = _flatten_values(self._get_json_field('helm_values', {}) or {})
+        specs = self.template_id._get_json_field('helm_value_specs', {}) if self.template_id else {}
+
+        declared, masked = set(), set()
+        for spec in (specs.get('required') or []) + (specs.get('optional') or []):
+            if isinstance(spec, dict) and spec.get('key'):
+                declared.add(spec['key'])
+                if spec.get('type') == 'password':
+                    masked.add(spec['key'])
+            elif isinstance(spec, str):
+                declared.add(spec)
+
+        result = {}
+        for key in sorted(flat):
+            value = flat[key]
+            if declared and key not in declared:
+                continue
+            if value in (None, '', [], {}):
+                continue
+            if key in masked or SECRET_KEY_PATTERN.search(key):
+                value = MASKED_VALUE
+            elif not isinstance(value, str):
+                value = json.dumps(value, sort_keys=True, separators=(',', ':'))
+            if len(value) > AI_CONTEXT_MAX_VALUE_CHARS:
+                value = value[:AI_CONTEXT_MAX_VALUE_CHARS] + '…'
+            result[key] = value
+            if len(result) >= AI_CONTEXT_MAX_VALUES:
+                break
+        return result
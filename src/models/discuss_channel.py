@@ -1,14 +1,45 @@
 import logging
+import threading
 
-from odoo import models
-from odoo.tools import html2plaintext
+from odoo import SUPERUSER_ID, api, fields, models
+
+from ..services import async_loop
+from ..services.context_window import (
+    count_message_tokens, fit_history, format_transcript, take_within_budget,
+)
+from ..services.llm_scheduler import PRIORITY_BACKGROUND
 
 _logger = logging.getLogger(__name__)
 
+# Unsummarized turns read per AI reply (older ones wait for the summary)
+CHAT_HISTORY_FETCH_LIMIT = 100
+# Used when the assistant has no budget set
+DEFAULT_CONTEXT_TOKEN_BUDGET = 8000
+# Turns folded into the rolling summary per summarization call
+SUMMARY_INPUT_TOKENS = 4000
+SUMMARY_MAX_WORDS = 250
+# A single turn is cut to this many characters in the summary prompt
+SUMMARY_TURN_MAX_CHARS = 4000
+
+# (db, channel id) of summaries being updated by this process
+_summaries_running = set()
+_summaries_lock = threading.Lock()
+
 
 class DiscussChannel(models.Model):
     _inherit = 'discuss.channel'
 
+    ai_summary = fields.Text(
+        string='AI Conversation Summary',
+        readonly=True,
+        help='Rolling summary of the turns that no longer fit the AI prompt',
+    )
+    ai_summary_message_id = fields.Integer(
+        string='Summarized Up To',
+        readonly=True,
+        help='ID of the last message folded into the AI conversation summary',
+    )
+
     def message_post(self, **kwargs):
         """Override message_post to detect AI @mentions and trigger AI replies.
 
@@ -38,10 +69,7 @@ class DiscussChannel(models.Model):
 
         # Skip AI-authored messages to prevent infinite recursion
         author_id = kwargs.get('author_id')
-        ai_partner_ids = set(
-            self.env['ai.assistant'].sudo().search([]).mapped('partner_id.id')
-        )
-        if author_id and author_id in ai_partner_ids:
+        if author_id and author_id in self.env['mail.message']._get_ai_partner_ids():
             return message
 
         body = kwargs.get('body', '') or ''
@@ -137,9 +165,6 @@ class DiscussChannel(models.Model):
                 f'Assistant {assistant.name} configuration error: {exc.message}'
             ) from exc
 
-        # Build conversation history from recent channel messages
-        history = self._get_chat_history(limit=20)
-
         system_prompt = ''
         if assistant.context_id:
             system_prompt = assistant.context_id.context or ''
@@ -149,11 +174,7 @@ class DiscussChannel(models.Model):
         if cloud_context:
             system_prompt = (system_prompt + '\n\n' + cloud_context).strip()
 
-        messages = client.build_messages(
-            system_prompt=system_prompt,
-            history=history,
-            user_message=user_message,
-        )
+        messages = self._get_ai_prompt_messages(assistant, client, system_prompt, user_message)
 
         assistant_partner_id = assistant.partner_id.id
 
@@ -164,8 +185,21 @@ class DiscussChannel(models.Model):
         if user_mcp_tools:
             mcp_tools = (mcp_tools | user_mcp_tools) if mcp_tools else user_mcp_tools
 
+        # Opt-in response cache: same question in the same context
+        ResponseCache = self.env['woow_paas_platform.ai_response_cache']
+        cache_probe = ResponseCache._make_probe(
+            assistant, client, system_prompt, user_message, history=messages[:-1],
+        )
+        cached_answer = ResponseCache._find_answer(cache_probe)
+
         try:
-            ai_response = client.chat_completion_with_tools(messages, mcp_tools)
+            if cached_answer:
+                ai_response = cached_answer
+            else:
+                ai_response, tool_failed = client.chat_completion_with_tools_status(messages, mcp_tools)
+                # An answer given without its tool results is not reusable
+                if not tool_failed:
+                    ResponseCache._store_answer(cache_probe, ai_response)
         except AIClientError as exc:
             _logger.error(
                 'AI client error for assistant %s: %s (detail=%s)',
@@ -217,37 +251,16 @@ class DiscussChannel(models.Model):
         """Build cloud service context for AI system prompt.
 
         Looks up the task linked to this channel, then the project's
-        cloud service, and assembles relevant context.
+        cloud service, and returns its cached context block (secrets masked,
+        see ``cloud_service._get_ai_context``).
         """
         task = self.env['project.task'].sudo().search([
             ('channel_id', '=', self.id),
         ], limit=1)
-        if not task or not task.project_id or not task.project_id.cloud_service_id:
-            return ''
-
         service = task.project_id.cloud_service_id
-        template = service.template_id
-
-        parts = ['## Cloud Service Information']
-        if template:
-            parts.append(f'- Application: {template.name}')
-            if template.category:
-                parts.append(f'- Category: {template.category}')
-            if template.description:
-                parts.append(f'- Description: {template.description}')
-
-        parts.append(f'- Service Name: {service.name}')
-        parts.append(f'- Status: {service.state or "unknown"}')
-
-        if service.subdomain:
-            parts.append(f'- URL: https://{service.subdomain}')
-        if service.error_message:
-            parts.append(f'- Error: {service.error_message}')
-
-        if service.helm_values:
-            parts.append(f'- Configuration (Helm Values):\n```json\n{service.helm_values}\n```')
-
-        return '\n'.join(parts)
+        if not service:
+            return ''
+        return service._get_ai_context()
 
     def _get_user_mcp_tools(self):
         """Get user-scope MCP tools from the cloud service linked to this channel.
@@ -273,32 +286,182 @@ class DiscussChannel(models.Model):
             ('active', '=', True),
         ])
 
-    def _get_chat_history(self, limit: int = 20) -> list:
-        """Retrieve recent chat messages from this channel.
+    def _get_chat_history(
+        self,
+        limit: int = 20,
+        after_id: int = 0,
+        until_id: int = 0,
+        oldest_first: bool = False,
+    ) -> list:
+        """Retrieve chat messages with text from this channel.
 
         Args:
             limit: Maximum number of messages to retrieve.
+            after_id: Only messages with a greater ID (e.g. not yet summarized).
+            until_id: Only messages with this ID or a lower one.
+            oldest_first: Retrieve the oldest ``limit`` messages of the range
+                instead of the newest (e.g. to summarize them in order).
 
         Returns:
-            A list of dicts with 'role' and 'content' keys, ordered
+            A list of dicts with 'id', 'role' and 'content' keys, ordered
             from oldest to newest.
         """
-        messages = self.env['mail.message'].sudo().search([
-            ('res_id', '=', self.id),
+        domain = [
             ('model', '=', 'discuss.channel'),
+            ('res_id', '=', self.id),
             ('message_type', '=', 'comment'),
-        ], order='id desc', limit=limit)
-
-        # Identify AI partner IDs for role detection
-        ai_partner_ids = set(
-            self.env['ai.assistant'].sudo().search([]).mapped('partner_id.id')
+            ('plain_body', '!=', False),
+        ]
+        if after_id:
+            domain.append(('id', '>', after_id))
+        if until_id:
+            domain.append(('id', '<=', until_id))
+        # Plain text and role were stored at post time (see mail_message.py)
+        messages = self.env['mail.message'].sudo().search_fetch(
+            domain, ['plain_body', 'is_ai'], order='id asc' if oldest_first else 'id desc', limit=limit,
         )
-        ai_partner_ids.add(self.env.ref('base.partner_root').id)
+        if not oldest_first:
+            messages = messages[::-1]
 
         history = []
-        for msg in reversed(messages):
-            role = 'assistant' if msg.author_id.id in ai_partner_ids else 'user'
-            body_text = html2plaintext(msg.body or '').strip()
-            if body_text:
-                history.append({'role': role, 'content': body_text})
+        for msg in messages:
+            if msg.plain_body:
+                history.append({
+                    'id': msg.id,
+                    'role': 'assistant' if msg.is_ai else 'user',
+                    'content': msg.plain_body,
+                })
         return history
+
+    # -------------------- prompt context window --------------------
+
+    def _get_ai_prompt_messages(self, assistant, client, system_prompt: str, user_message: str) -> list:
+        """Build the prompt of an AI reply within the assistant's token budget.
+
+        The prompt is the system prompt, the rolling summary of older turns,
+        the newest turns that fit what is left of the budget, and the user
+        message. Parts are ordered from most to least stable (assistant
+        context, cloud service block, summary, turns) so the prompt prefix
+        stays identical across turns and provider-side prompt caching hits.
+        When turns had to be left out, the summary is brought up to date in
+        the background, so prompt size stays flat as the conversation grows.
+
+        Args:
+            assistant: The ``ai.assistant`` answering (provides the budget).
+            client: The :class:`AIClient` used for the reply.
+            system_prompt: Assistant context and channel information.
+            user_message: The message being answered.
+
+        Returns:
+            A LangChain message list.
+        """
+        self.ensure_one()
+        channel = self.sudo()
+        model_name = client.model_name
+        budget = assistant.sudo().context_token_budget or DEFAULT_CONTEXT_TOKEN_BUDGET
+
+        history = channel._get_chat_history(
+            limit=CHAT_HISTORY_FETCH_LIMIT, after_id=channel.ai_summary_message_id,
+        )
+        # Older unsummarized turns exist beyond the fetched window
+        window_full = len(history) == CHAT_HISTORY_FETCH_LIMIT
+        # The message being answered is passed on its own
+        if history and history[-1]['role'] == 'user' and history[-1]['content'] == user_message.strip():
+            history = history[:-1]
+
+        if channel.ai_summary:
+            system_prompt = (
+                system_prompt + '\n\n## Earlier Conversation (summary)\n' + channel.ai_summary
+            ).strip()
+
+        def fit():
+            used = (
+                count_message_tokens(system_prompt, model_name)
+                + count_message_tokens(user_message, model_name)
+            )
+            return fit_history(history, max(budget - used, 0), model_name)
+
+        # Tokenizing up to CHAT_HISTORY_FETCH_LIMIT turns is CPU-bound
+        kept, dropped = async_loop.run_blocking(fit)
+        if dropped:
+            channel._schedule_ai_summary(assistant, dropped[-1]['id'])
+        elif window_full:
+            # Everything fetched fits, but the turns before the window are
+            # left out of the prompt: fold them into the summary
+            channel._schedule_ai_summary(assistant, history[0]['id'] - 1)
+
+        return client.build_messages(
+            system_prompt=system_prompt,
+            history=kept,
+            user_message=user_message,
+        )
+
+    def _schedule_ai_summary(self, assistant, until_id: int):
+        """Update the rolling summary up to ``until_id`` after this transaction."""
+        key = (self.env.cr.dbname, self.id)
+        args = (self.env.cr.dbname, self.id, assistant.id, until_id)
+
+        def _start():
+            with _summaries_lock:
+                if key in _summaries_running:
+                    return
+                _summaries_running.add(key)
+            threading.Thread(target=_summarize_in_background, args=args, daemon=True).start()
+
+        self.env.cr.postcommit.add(_start)
+
+    def _update_ai_summary(self, assistant, until_id: int):
+        """Fold unsummarized turns up to ``until_id`` into ``ai_summary``.
+
+        Works through the turns in chunks of ``SUMMARY_INPUT_TOKENS``, each
+        merged into the previous summary with one completion call.
+
+        Raises:
+            AIClientError: The assistant cannot be used or a call failed.
+        """
+        from .ai_client import AIClient
+
+        self.ensure_one()
+        # Summaries wait behind interactive replies for the provider limits
+        client = AIClient.from_assistant(assistant, priority=PRIORITY_BACKGROUND)
+        while (self.ai_summary_message_id or 0) < until_id:
+            # Oldest unsummarized turns first, so none is skipped
+            turns = self._get_chat_history(
+                limit=CHAT_HISTORY_FETCH_LIMIT,
+                after_id=self.ai_summary_message_id,
+                until_id=until_id,
+                oldest_first=True,
+            )
+            turns = take_within_budget(turns, SUMMARY_INPUT_TOKENS, client.model_name)
+            if not turns:
+                # No message with text left in the range
+                self.write({'ai_summary_message_id': until_id})
+                break
+            summary = client.summarize_conversation(
+                self.ai_summary or '',
+                format_transcript(turns, limit_chars=SUMMARY_TURN_MAX_CHARS),
+                max_words=SUMMARY_MAX_WORDS,
+            )
+            self.write({
+                'ai_summary': summary,
+                'ai_summary_message_id': turns[-1]['id'],
+            })
+
+
+def _summarize_in_background(db_name: str, channel_id: int, assistant_id: int, until_id: int):
+    """Background thread: update a channel's rolling summary on its own cursor."""
+    from odoo.modules.registry import Registry
+
+    try:
+        with Registry(db_name).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            channel = env['discuss.channel'].browse(channel_id).exists()
+            assistant = env['ai.assistant'].browse(assistant_id).exists()
+            if channel and assistant:
+                channel._update_ai_summary(assistant, until_id)
+    except Exception as exc:
+        # The turns stay unsummarized; the next reply schedules them again
+        _logger.warning('AI summary update failed for channel %s: %s', channel_id, exc)
+    finally:
+        with _summaries_lock:
+            _summaries_running.discard((db_name, channel_id))
@@ -0,0 +1,28 @@
+from odoo import models
+
+from .workspace import WORKSPACE_BUS_CHANNEL_PREFIX
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        """Resolve workspace channels requested by the /woow frontend.
+
+        The client subscribes with ``woow_paas_platform.workspace_<id>``;
+        only workspaces the user is a member of are turned into record
+        channels, anything else is dropped.
+        """
+        channels = list(channels)  # do not alter original list
+        workspace_ids = []
+        for channel in list(channels):
+            if isinstance(channel, str) and channel.startswith(WORKSPACE_BUS_CHANNEL_PREFIX):
+                channels.remove(channel)
+                suffix = channel[len(WORKSPACE_BUS_CHANNEL_PREFIX):]
+                if suffix.isdigit():
+                    workspace_ids.append(int(suffix))
+        if workspace_ids and self.env.uid:
+            workspaces = self.env['woow_paas_platform.workspace'].sudo().browse(workspace_ids)
+            roles = workspaces.get_user_roles(self.env.user)
+            channels.extend(workspaces.filtered(lambda w: w.id in roles))
+        return super()._build_bus_channel_list(channels)
@@ -0,0 +1,68 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+from odoo import models
+
+_logger = logging.getLogger(__name__)
+
+# Per-process LRU of parsed JSON text fields, shared by all request threads
+JSON_CACHE_MAX_ENTRIES = 4096
+
+_json_cache = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+
+class JsonFieldMixin(models.AbstractModel):
+    _name = 'woow_paas_platform.json_field.mixin'
+    _description = 'Parsed JSON Field Cache'
+
+    def _get_json_field(self, field_name, default=None):
+        """Return the parsed value of a JSON text field, cached per process.
+
+        Entries are keyed by (database, model, id, field, write_date) and
+        also remember the raw text, so a field rewritten within the same
+        transaction (unchanged write_date) is never served stale.
+
+        The returned value is shared between requests and must be treated
+        as read-only; copy it before mutating.
+
+        Args:
+            field_name: Name of a Char/Text field holding JSON
+            default: Returned when the field is empty or not valid JSON
+
+        Returns:
+            Parsed JSON value, or ``default``
+        """
+        self.ensure_one()
+        raw = self[field_name]
+        if not raw:
+            return default
+        if not isinstance(self.id, int):
+            # Unsaved record: nothing stable to key on
+            return self._parse_json_field(field_name, raw, default)
+
+        key = (self.env.cr.dbname, self._name, self.id, field_name, self.write_date)
+        with _json_cache_lock:
+            entry = _json_cache.get(key)
+            if entry is not None and entry[0] == raw:
+                _json_cache.move_to_end(key)
+                return entry[1]
+
+        value = self._parse_json_field(field_name, raw, default)
+        if value is default:
+            return value
+        with _json_cache_lock:
+            _json_cache[key] = (raw, value)
+            _json_cache.move_to_end(key)
+            while len(_json_cache) > JSON_CACHE_MAX_ENTRIES:
+                _json_cache.popitem(last=False)
+        return value
+
+    def _parse_json_field(self, field_name, raw, default):
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            _logger.warning("Invalid JSON in %s.%s (id=%s)", self._name, field_name, self.id)
+            return default
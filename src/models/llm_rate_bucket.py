@@ -0,0 +1,31 @@
+from odoo import fields, models
+
+
+class LlmRateBucket(models.Model):
+    """Shared token buckets of one ``ai.config``.
+
+    Read and updated with raw SQL under a row lock by
+    ``services/llm_scheduler.py``, on a connection of its own, so every
+    worker sees the same allowance.
+    """
+    _name = 'woow_paas_platform.llm_rate_bucket'
+    _description = 'LLM Rate Limit Bucket'
+    _log_access = False
+
+    config_id = fields.Many2one(
+        comodel_name='ai.config',
+        string='AI Configuration',
+        required=True,
+        ondelete='cascade',
+    )
+    request_allowance = fields.Float(string='Requests Available')
+    token_allowance = fields.Float(string='Tokens Available')
+    refilled_at = fields.Datetime(string='Refilled At')
+    blocked_until = fields.Datetime(
+        string='Blocked Until',
+        help='Set after a 429 response: no request is sent before this time',
+    )
+
+    _sql_constraints = [
+        ('config_unique', 'UNIQUE(config_id)', 'One rate limit bucket per AI configuration.'),
+    ]
@@ -0,0 +1,136 @@
+import html
+from collections import defaultdict
+
+from odoo import api, fields, models, tools
+from odoo.tools import html2plaintext
+
+
+class MailMessage(models.Model):
+    _inherit = 'mail.message'
+
+    plain_body = fields.Text(
+        string='Plain Text Body',
+        readonly=True,
+        help='Plain text of the body, stored at post time for discuss channel '
+             'messages (raw Markdown for AI replies)',
+    )
+    is_ai = fields.Boolean(
+        string='AI Message',
+        readonly=True,
+        help='Authored by an AI assistant (set at post time for discuss channel messages)',
+    )
+
+    def init(self):
+        super().init()
+        # Chat history: latest messages of one channel by type
+        tools.create_index(
+            self._cr, 'mail_message_model_res_id_type_id_idx', self._table,
+            ['model', 'res_id', 'message_type', 'id DESC'],
+        )
+
+    @api.model
+    @tools.ormcache()
+    def _get_ai_partner_ids(self):
+        """Partner ids of all AI assistants (cleared when assistants change)."""
+        return frozenset(self.env['ai.assistant'].sudo().search([]).partner_id.ids)
+
+    @api.model
+    def _read_chat_history(self, domain, limit=None):
+        """Serialize chat messages for the web client, oldest first.
+
+        Messages, authors and attachments are loaded with one read each, so
+        the cost does not grow with the number of messages carrying files.
+
+        Args:
+            domain: Search domain of the messages.
+            limit: Maximum number of (latest) messages.
+
+        Returns:
+            list[dict]: Compact message payloads with their attachments.
+        """
+        rows = self.search_read(
+            domain,
+            ['body', 'plain_body', 'is_ai', 'author_id', 'date', 'message_type', 'attachment_ids'],
+            order='id desc',
+            limit=limit,
+            load=None,
+        )
+        author_ids = {row['author_id'] for row in rows if row['author_id']}
+        author_names = {
+            partner['id']: partner['name']
+            for partner in self.env['res.partner'].browse(author_ids).read(['name'])
+        }
+        attachment_ids = {att_id for row in rows for att_id in row['attachment_ids']}
+        attachments_by_id = {}
+        if attachment_ids:
+            for att in self.env['ir.attachment'].search_read(
+                [('id', 'in', list(attachment_ids))],
+                ['name', 'mimetype', 'file_size'],
+            ):
+                attachments_by_id[att['id']] = {
+                    'id': att['id'],
+                    'name': att['name'],
+                    'mimetype': att['mimetype'],
+                    'file_size': att['file_size'],
+                    'url': f"/web/content/{att['id']}?download=true",
+                }
+        attachments_by_message = defaultdict(list)
+        for row in rows:
+            # Same order as attachment_ids (ir.attachment: newest first)
+            for att_id in sorted(row['attachment_ids'], reverse=True):
+                if att_id in attachments_by_id:
+                    attachments_by_message[row['id']].append(attachments_by_id[att_id])
+
+        data = []
+        for row in reversed(rows):
+            # AI replies: plain_body holds the unescaped Markdown
+            is_ai = row['is_ai']
+            author_id = row['author_id'] or None
+            data.append({
+                'id': row['id'],
+                'body': (row['plain_body'] or '') if is_ai else (row['body'] or ''),
+                'author_id': author_id,
+                'author_name': author_names.get(author_id, 'Unknown'),
+                'is_ai': is_ai,
+                'date': row['date'].isoformat() if row['date'] else None,
+                'message_type': row['message_type'],
+                'attachments': attachments_by_message[row['id']],
+            })
+        return data
+
+    def _prepare_chat_vals(self, body, author_id):
+        """Values of ``plain_body`` and ``is_ai`` for a channel message.
+
+        AI replies are posted as escaped Markdown, so their plain text is the
+        unescaped body; other messages are HTML rendered to text. The root
+        partner counts as AI for messages posted before assistants had
+        their own partner.
+        """
+        is_ai = bool(author_id) and (
+            author_id in self._get_ai_partner_ids()
+            or author_id == self.env.ref('base.partner_root').id
+        )
+        if is_ai:
+            plain_body = html.unescape(str(body or ''))
+        else:
+            plain_body = html2plaintext(body or '')
+        return {'plain_body': plain_body.strip(), 'is_ai': is_ai}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get('model') == 'discuss.channel':
+                # Same default as mail.message: the current user's partner
+                author_id = vals['author_id'] if 'author_id' in vals else self.env.user.partner_id.id
+                vals.update(self._prepare_chat_vals(vals.get('body'), author_id))
+        return super().create(vals_list)
+
+    def write(self, vals):
+        result = super().write(vals)
+        if 'body' in vals or 'author_id' in vals:
+            # Edited channel messages keep their stored plain text in sync
+            for message in self.filtered(lambda m: m.model == 'discuss.channel'):
+                super(MailMessage, message).write(
+                    message._prepare_chat_vals(message.body, message.author_id.id)
+                )
+        return result
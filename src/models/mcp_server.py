@@ -1,9 +1,10 @@
-import asyncio
 import json
 import logging
 
 from odoo import api, fields, models
 
+from ..services import async_loop
+
 _logger = logging.getLogger(__name__)
 
 
@@ -130,7 +131,7 @@ class McpServer(models.Model):
         """Sync tools from the MCP server via langchain-mcp-adapters."""
         self.ensure_one()
         try:
-            result = asyncio.run(self._async_sync_tools())
+            result = self._sync_tools()
             self.write({
                 'state': 'connected',
                 'state_message': False,
@@ -157,7 +158,7 @@ class McpServer(models.Model):
         """
         self.ensure_one()
         try:
-            asyncio.run(self._async_sync_tools())
+            self._sync_tools()
             self.write({
                 'state': 'connected',
                 'state_message': False,
@@ -221,15 +222,14 @@ class McpServer(models.Model):
             )
             server.action_sync_tools_safe()
 
-    async def _async_sync_tools(self):
-        """Async: connect to MCP server and discover tools."""
-        from langchain_mcp_adapters.client import MultiServerMCPClient
+    def _sync_tools(self):
+        """Discover tools on the MCP server and store them.
 
-        config = {self.name: self._get_mcp_client_config()}
-        client = MultiServerMCPClient(config)
-        tools = await client.get_tools()
+        The discovery runs on the worker event loop; the records are
+        written here, in the caller's thread and transaction.
+        """
+        tools = async_loop.run(self._async_sync_tools(self._get_mcp_client_config()))
 
-        # Process discovered tools back in sync context
         McpTool = self.env['woow_paas_platform.mcp_tool']
         existing = {t.name: t for t in self.tool_ids}
         discovered_names = set()
@@ -260,11 +260,23 @@ class McpServer(models.Model):
 
         return True
 
+    @staticmethod
+    async def _async_sync_tools(config):
+        """Async: connect to MCP server and discover tools.
+
+        Takes the connection config rather than reading records, since it
+        runs on the worker loop thread.
+        """
+        from langchain_mcp_adapters.client import MultiServerMCPClient
+
+        client = MultiServerMCPClient({'server': config})
+        return await client.get_tools()
+
     def action_test_connection(self):
         """Test if the MCP server URL is reachable."""
         self.ensure_one()
         try:
-            asyncio.run(self._async_test_connection())
+            async_loop.run(self._async_test_connection(self._get_mcp_client_config()))
             self.write({
                 'state': 'connected',
                 'state_message': False,
@@ -276,11 +288,11 @@ class McpServer(models.Model):
                 'state_message': str(e),
             })
 
-    async def _async_test_connection(self):
+    @staticmethod
+    async def _async_test_connection(config):
         """Async: attempt to connect to MCP server."""
         from langchain_mcp_adapters.client import MultiServerMCPClient
 
-        config = {self.name: self._get_mcp_client_config()}
-        client = MultiServerMCPClient(config)
+        client = MultiServerMCPClient({'server': config})
         # If we can connect and get tools, the server is reachable
         await client.get_tools()
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Resolution → (bucket seconds, chunk seconds). One row holds one chunk of
+# points for a service; point timestamps are stored as second offsets from
+# bucket_start so a row stays a handful of compact arrays.
+RESOLUTION_RAW = 'raw'
+RESOLUTION_5M = '5m'
+RESOLUTION_1H = '1h'
+RESOLUTIONS = {
+    RESOLUTION_RAW: (0, 3600),
+    RESOLUTION_5M: (300, 86400),
+    RESOLUTION_1H: (3600, 7 * 86400),
+}
+
+# Source resolution → target resolution for the downsampling cron
+DOWNSAMPLE_CHAIN = [(RESOLUTION_RAW, RESOLUTION_5M), (RESOLUTION_5M, RESOLUTION_1H)]
+
+# Default retention in days, overridable via ir.config_parameter
+# woow_paas_platform.usage_retention_<resolution>_days
+DEFAULT_RETENTION_DAYS = {
+    RESOLUTION_RAW: 2,
+    RESOLUTION_5M: 35,
+    RESOLUTION_1H: 400,
+}
+
+# Usage period → (lookback, resolution read)
+USAGE_PERIODS = {
+    '24h': (timedelta(hours=24), RESOLUTION_RAW),
+    '7d': (timedelta(days=7), RESOLUTION_5M),
+    '30d': (timedelta(days=30), RESOLUTION_5M),
+    '90d': (timedelta(days=90), RESOLUTION_1H),
+}
+
+# Source chunks downsampled per cron run
+DOWNSAMPLE_BATCH = 2000
+
+# Append points newer than the row's last point; duplicates from several
+# operator replicas (same aligned timestamp) and retried pushes are dropped.
+_APPEND_SQL = """
+    ON CONFLICT (service_id, resolution, bucket_start) DO UPDATE SET
+        (ts, cpu, mem, cpu_max, mem_max) = (
+            SELECT s.ts || array_agg(p.ts ORDER BY p.ts),
+                   s.cpu || array_agg(p.cpu ORDER BY p.ts),
+                   s.mem || array_agg(p.mem ORDER BY p.ts),
+                   s.cpu_max || array_agg(p.cpu_max ORDER BY p.ts)
+                       FILTER (WHERE p.cpu_max IS NOT NULL),
+                   s.mem_max || array_agg(p.mem_max ORDER BY p.ts)
+                       FILTER (WHERE p.mem_max IS NOT NULL)
+            FROM unnest(EXCLUDED.ts, EXCLUDED.cpu, EXCLUDED.mem,
+                        EXCLUDED.cpu_max, EXCLUDED.mem_max)
+                 AS p(ts, cpu, mem, cpu_max, mem_max)
+            WHERE p.ts > coalesce(s.ts[array_upper(s.ts, 1)], -1)
+        ),
+        write_date = EXCLUDED.write_date
+"""
+
+
+def _utc(epoch: int) -> datetime:
+    return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
+
+class ServiceUsageSeries(models.Model):
+    """Chunked CPU/memory time series of a cloud service.
+
+    Samples pushed by the PaaS Operator land in hourly ``raw`` chunks and
+    are rolled up by cron into 5-minute (daily chunks) and hourly (weekly
+    chunks) series, each with its own retention. The point arrays are
+    plain PostgreSQL array columns created in ``init`` and only accessed
+    through SQL.
+    """
+    _name = 'woow_paas_platform.service_usage_series'
+    _description = 'Cloud Service Usage Series'
+    _order = 'bucket_start desc'
+
+    _sql_constraints = [
+        (
+            'unique_service_chunk',
+            'UNIQUE(service_id, resolution, bucket_start)',
+            'Only one usage chunk per service, resolution and start time.',
+        ),
+    ]
+
+    service_id = fields.Many2one(
+        comodel_name='woow_paas_platform.cloud_service',
+        string='Service',
+        required=True,
+        ondelete='cascade',
+        index=True,
+    )
+    resolution = fields.Selection(
+        selection=[
+            (RESOLUTION_RAW, 'Raw'),
+            (RESOLUTION_5M, '5 Minutes'),
+            (RESOLUTION_1H, '1 Hour'),
+        ],
+        string='Resolution',
+        required=True,
+    )
+    bucket_start = fields.Datetime(
+        string='Chunk Start',
+        required=True,
+        index=True,
+    )
+    downsampled = fields.Boolean(
+        string='Downsampled',
+        default=False,
+        help='Chunk has been rolled up into the next resolution',
+    )
+
+    def init(self):
+        # ts: seconds since bucket_start; cpu: millicores; mem: MiB.
+        # *_max are only filled for downsampled resolutions.
+        self.env.cr.execute(f"""
+            ALTER TABLE {self._table}
+                ADD COLUMN IF NOT EXISTS ts int4[] NOT NULL DEFAULT '{{}}',
+                ADD COLUMN IF NOT EXISTS cpu float4[] NOT NULL DEFAULT '{{}}',
+                ADD COLUMN IF NOT EXISTS mem float4[] NOT NULL DEFAULT '{{}}',
+                ADD COLUMN IF NOT EXISTS cpu_max float4[] NOT NULL DEFAULT '{{}}',
+                ADD COLUMN IF NOT EXISTS mem_max float4[] NOT NULL DEFAULT '{{}}'
+        """)
+
+    # ==================== Ingest ====================
+
+    @api.model
+    def _ingest_samples(self, samples: list[dict[str, Any]]) -> dict[str, int]:
+        """Store per-release samples pushed by the PaaS Operator.
+
+        Args:
+            samples: Dicts with namespace, release, timestamp (epoch seconds),
+                cpu_millicores and memory_bytes.
+
+        Returns:
+            dict: ``accepted`` and ``unknown`` sample counts
+        """
+        keys = {(s.get('namespace'), s.get('release')) for s in samples}
+        services = self.env['woow_paas_platform.cloud_service'].search([
+            ('helm_namespace', 'in', list({k[0] for k in keys})),
+            ('helm_release_name', 'in', list({k[1] for k in keys})),
+        ])
+        service_by_key = {(s.helm_namespace, s.helm_release_name): s.id for s in services}
+
+        chunk_seconds = RESOLUTIONS[RESOLUTION_RAW][1]
+        chunks: dict[tuple[int, int], dict[int, tuple[float, float]]] = {}
+        unknown = 0
+        for sample in samples:
+            service_id = service_by_key.get((sample.get('namespace'), sample.get('release')))
+            try:
+                ts = int(sample['timestamp'])
+                cpu = float(sample.get('cpu_millicores') or 0)
+                mem = float(sample.get('memory_bytes') or 0) / (1024 * 1024)
+            except (KeyError, TypeError, ValueError):
+                service_id = None
+            if not service_id:
+                unknown += 1
+                continue
+            start = ts - ts % chunk_seconds
+            chunks.setdefault((service_id, start), {})[ts - start] = (cpu, mem)
+
+        if chunks:
+            rows = []
+            for (service_id, start), points in chunks.items():
+                offsets = sorted(points)
+                rows.append({
+                    'service_id': service_id,
+                    'bucket_start': _utc(start).isoformat(),
+                    'ts': offsets,
+                    'cpu': [points[o][0] for o in offsets],
+                    'mem': [points[o][1] for o in offsets],
+                })
+            self._upsert_chunks(RESOLUTION_RAW, rows)
+
+        return {'accepted': len(samples) - unknown, 'unknown': unknown}
+
+    def _upsert_chunks(self, resolution: str, rows: list[dict[str, Any]]) -> None:
+        """Insert chunks or append their points to existing chunks."""
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} AS s
+                (service_id, resolution, bucket_start, ts, cpu, mem, cpu_max, mem_max,
+                 downsampled, create_uid, create_date, write_uid, write_date)
+            SELECT r.service_id, %s, r.bucket_start, r.ts, r.cpu, r.mem,
+                   coalesce(r.cpu_max, '{{}}'), coalesce(r.mem_max, '{{}}'),
+                   false, %s, now() at time zone 'UTC', %s, now() at time zone 'UTC'
+            FROM jsonb_to_recordset(%s::jsonb) AS r(
+                service_id int, bucket_start timestamp, ts int4[], cpu float4[],
+                mem float4[], cpu_max float4[], mem_max float4[])
+            {_APPEND_SQL}
+        """, (resolution, self.env.uid, self.env.uid, json.dumps(rows)))
+
+    # ==================== Downsampling & Retention ====================
+
+    @api.model
+    def _cron_downsample_usage(self) -> None:
+        """Roll closed chunks up the resolution chain and apply retention."""
+        now = fields.Datetime.now()
+        for source, target in DOWNSAMPLE_CHAIN:
+            self._downsample(source, target, now)
+        self._apply_retention(now)
+
+    def _downsample(self, source: str, target: str, now: datetime) -> int:
+        """Aggregate closed ``source`` chunks into ``target`` chunks.
+
+        Returns:
+            int: Number of source chunks processed
+        """
+        source_chunk = RESOLUTIONS[source][1]
+        bucket, target_chunk = RESOLUTIONS[target]
+        cr = self.env.cr
+        cr.execute(f"""
+            SELECT id FROM {self._table}
+            WHERE resolution = %s AND NOT downsampled
+              AND bucket_start + make_interval(secs => %s) <= %s
+            ORDER BY bucket_start
+            LIMIT %s
+        """, (source, source_chunk, now, DOWNSAMPLE_BATCH))
+        ids = [row[0] for row in cr.fetchall()]
+        if not ids:
+            return 0
+
+        cr.execute(f"""
+            WITH points AS (
+                SELECT s.service_id,
+                       s.bucket_start + make_interval(secs => p.ts) AS at,
+                       p.cpu, p.mem,
+                       coalesce(p.cpu_max, p.cpu) AS cpu_max,
+                       coalesce(p.mem_max, p.mem) AS mem_max
+                FROM {self._table} s,
+                     unnest(s.ts, s.cpu, s.mem, s.cpu_max, s.mem_max)
+                     AS p(ts, cpu, mem, cpu_max, mem_max)
+                WHERE s.id = ANY(%(ids)s) AND p.ts IS NOT NULL
+            ), buckets AS (
+                SELECT service_id,
+                       to_timestamp(floor(extract(epoch FROM at) / %(bucket)s) * %(bucket)s)
+                           at time zone 'UTC' AS b,
+                       avg(cpu) AS cpu, avg(mem) AS mem,
+                       max(cpu_max) AS cpu_max, max(mem_max) AS mem_max
+                FROM points
+                GROUP BY 1, 2
+            ), chunks AS (
+                SELECT service_id,
+                       to_timestamp(floor(extract(epoch FROM b) / %(chunk)s) * %(chunk)s)
+                           at time zone 'UTC' AS chunk,
+                       b, cpu, mem, cpu_max, mem_max
+                FROM buckets
+            )
+            INSERT INTO {self._table} AS s
+                (service_id, resolution, bucket_start, ts, cpu, mem, cpu_max, mem_max,
+                 downsampled, create_uid, create_date, write_uid, write_date)
+            SELECT service_id, %(target)s, chunk,
+                   array_agg(extract(epoch FROM b - chunk)::int4 ORDER BY b),
+                   array_agg(cpu::float4 ORDER BY b),
+                   array_agg(mem::float4 ORDER BY b),
+                   array_agg(cpu_max::float4 ORDER BY b),
+                   array_agg(mem_max::float4 ORDER BY b),
+                   false, %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+            FROM chunks
+            GROUP BY service_id, chunk
+            {_APPEND_SQL}
+        """, {
+            'ids': ids, 'bucket': bucket, 'chunk': target_chunk,
+            'target': target, 'uid': self.env.uid,
+        })
+        cr.execute(
+            f"UPDATE {self._table} SET downsampled = true WHERE id = ANY(%s)", (ids,),
+        )
+        _logger.info("Downsampled %d %s usage chunks into %s", len(ids), source, target)
+        return len(ids)
+
+    def _apply_retention(self, now: datetime) -> None:
+        ICP = self.env['ir.config_parameter'].sudo()
+        for resolution, (_bucket, chunk) in RESOLUTIONS.items():
+            try:
+                days = int(ICP.get_param(
+                    f'woow_paas_platform.usage_retention_{resolution}_days',
+                    DEFAULT_RETENTION_DAYS[resolution],
+                ))
+            except (TypeError, ValueError):
+                days = DEFAULT_RETENTION_DAYS[resolution]
+            self.env.cr.execute(f"""
+                DELETE FROM {self._table}
+                WHERE resolution = %s
+                  AND bucket_start + make_interval(secs => %s) < %s
+            """, (resolution, chunk, now - timedelta(days=days)))
+
+    # ==================== Queries ====================
+
+    @api.model
+    def _usage_summary(self, service, period: str = '7d') -> dict[str, Any]:
+        """Usage percentiles of a service over a period.
+
+        Args:
+            service: cloud_service record
+            period: One of USAGE_PERIODS
+
+        Returns:
+            dict: Sample count, CPU (millicores) and memory (MiB)
+            p50/p90/p95/p99/max for the period
+        """
+        lookback, resolution = USAGE_PERIODS[period]
+        chunk = RESOLUTIONS[resolution][1]
+        since = fields.Datetime.now() - lookback
+        self.env.cr.execute(f"""
+            SELECT count(*),
+                   percentile_cont(ARRAY[0.5, 0.9, 0.95, 0.99]) WITHIN GROUP (ORDER BY p.cpu),
+                   max(coalesce(p.cpu_max, p.cpu)),
+                   percentile_cont(ARRAY[0.5, 0.9, 0.95, 0.99]) WITHIN GROUP (ORDER BY p.mem),
+                   max(coalesce(p.mem_max, p.mem))
+            FROM {self._table} s,
+                 unnest(s.ts, s.cpu, s.mem, s.cpu_max, s.mem_max)
+                 AS p(ts, cpu, mem, cpu_max, mem_max)
+            WHERE s.service_id = %(service_id)s
+              AND s.resolution = %(resolution)s
+              AND s.bucket_start >= %(since)s - make_interval(secs => %(chunk)s)
+              AND s.bucket_start + make_interval(secs => p.ts) >= %(since)s
+        """, {'service_id': service.id, 'resolution': resolution, 'since': since, 'chunk': chunk})
+        count, cpu_pct, cpu_max, mem_pct, mem_max = self.env.cr.fetchone()
+
+        def _stats(percentiles, maximum):
+            if not count:
+                return None
+            p50, p90, p95, p99 = (round(v, 2) for v in percentiles)
+            return {'p50': p50, 'p90': p90, 'p95': p95, 'p99': p99, 'max': round(maximum, 2)}
+
+        return {
+            'period': period,
+            'resolution': resolution,
+            'samples': count,
+            'cpu_millicores': _stats(cpu_pct, cpu_max),
+            'memory_mb': _stats(mem_pct, mem_max),
+        }
@@ -1,7 +1,7 @@
 import logging
 import uuid
 
-from odoo import fields, models
+from odoo import api, fields, models
 from odoo.exceptions import UserError
 
 from ..services.naming import make_smarthome_subdomain
@@ -14,6 +14,13 @@ from ..services.paas_operator import (
 
 _logger = logging.getLogger(__name__)
 
+# Fields whose changes are pushed to the workspace bus channel
+BUS_NOTIFY_FIELDS = {
+    'name', 'state', 'error_message', 'subdomain', 'tunnel_id', 'tunnel_name',
+    'tunnel_route', 'tunnel_status', 'tunnel_uptime', 'connector_id',
+    'connector_type', 'deployed_at',
+}
+
 
 class SmartHome(models.Model):
     _name = 'woow_paas_platform.smart_home'
@@ -103,6 +110,34 @@ class SmartHome(models.Model):
     # Timestamps
     deployed_at = fields.Datetime(string='Deployed At')
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        homes = super().create(vals_list)
+        homes._notify_workspace_bus()
+        return homes
+
+    def write(self, vals):
+        res = super().write(vals)
+        if BUS_NOTIFY_FIELDS.intersection(vals):
+            self._notify_workspace_bus()
+        return res
+
+    def unlink(self):
+        deleted = [(home.workspace_id, home.id) for home in self if home.workspace_id]
+        res = super().unlink()
+        for workspace, home_id in deleted:
+            workspace._notify_bus('woow_paas_platform/smart_home_deleted', {
+                'id': home_id,
+                'workspace_id': workspace.id,
+            })
+        return res
+
+    def _notify_workspace_bus(self):
+        """Push the current state of each smart home to its workspace channel."""
+        for home in self:
+            if home.workspace_id:
+                home.workspace_id._notify_bus('woow_paas_platform/smart_home_updated', home.to_dict())
+
     def _get_operator_client(self):
         """Get PaaS Operator client instance."""
         client = get_paas_operator_client(self.env)
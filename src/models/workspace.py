@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import logging
+import re
 from typing import Any, Union
 
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
-import re
+from odoo.osv import expression
 
 from .workspace_access import ROLE_OWNER, ROLE_HIERARCHY
+from ..services.naming import make_namespace
+from ..services.paas_operator import (
+    get_paas_operator_client,
+    run_operator_batch,
+    BATCH_MAX_WORKERS,
+    PaaSOperatorError,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Bus channel the /woow frontend subscribes to for live service/smart home
+# state; access is checked in ir.websocket before subscribing.
+WORKSPACE_BUS_CHANNEL_PREFIX = 'woow_paas_platform.workspace_'
+
+# Quota for namespaces created ahead of any service; matches the floor used
+# when the first service deploys into a fresh workspace.
+NAMESPACE_DEFAULT_QUOTA = {'cpu': '8', 'memory': '8Gi', 'storage': '100Gi'}
 
 
 class Workspace(models.Model):
@@ -72,33 +91,121 @@ class Workspace(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list: list[dict[str, Any]]) -> Workspace:
-        for vals in vals_list:
-            if not vals.get('slug'):
-                vals['slug'] = self._generate_slug(vals.get('name', ''))
+        missing = [vals for vals in vals_list if not vals.get('slug')]
+        if missing:
+            slugs = self._allocate_slugs([vals.get('name', '') for vals in missing])
+            for vals, slug in zip(missing, slugs):
+                vals['slug'] = slug or False
         workspaces = super().create(vals_list)
         # Create owner access for each workspace
-        for workspace in workspaces:
-            self.env['woow_paas_platform.workspace_access'].create({
+        self.env['woow_paas_platform.workspace_access'].create([
+            {
                 'workspace_id': workspace.id,
                 'user_id': workspace.owner_id.id,
                 'role': ROLE_OWNER,
-            })
+            }
+            for workspace in workspaces
+        ])
         return workspaces
 
+    def unlink(self) -> bool:
+        # Access records are removed by the database cascade, not the ORM
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
     def _generate_slug(self, name: str) -> str:
         """Generate a URL-friendly slug from name"""
+        return self._allocate_slugs([name])[0]
+
+    @api.model
+    def _slugify(self, name: str) -> str:
+        """Convert a name to a URL-friendly slug (not uniquified)"""
         if not name:
             return ''
         # Convert to lowercase and replace spaces/special chars with hyphens
         slug = re.sub(r'[^\w\s-]', '', name.lower())
-        slug = re.sub(r'[-\s]+', '-', slug).strip('-')
-        # Ensure uniqueness
-        base_slug = slug
-        counter = 1
-        while self.search_count([('slug', '=', slug)]) > 0:
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        return slug
+        return re.sub(r'[-\s]+', '-', slug).strip('-')
+
+    @api.model
+    def _allocate_slugs(self, names: list[str]) -> list[str]:
+        """Allocate unique slugs for a batch of names.
+
+        Existing slugs sharing a base are fetched in one prefix query;
+        collisions get the first free ``-<n>`` suffix, also across the batch.
+        """
+        bases = [self._slugify(name) for name in names]
+        prefixes = sorted({base for base in bases if base})
+        taken = set()
+        if prefixes:
+            domain = expression.OR([[('slug', '=like', f'{base}%')] for base in prefixes])
+            taken = {row['slug'] for row in self.with_context(active_test=False).sudo().search_read(domain, ['slug'])}
+
+        slugs = []
+        for base in bases:
+            if not base:
+                slugs.append('')
+                continue
+            slug = base
+            counter = 1
+            while slug in taken:
+                slug = f"{base}-{counter}"
+                counter += 1
+            taken.add(slug)
+            slugs.append(slug)
+        return slugs
+
+    @api.model
+    def provision_workspaces(
+        self,
+        vals_list: list[dict[str, Any]],
+        create_namespaces: bool = False,
+        max_workers: int = BATCH_MAX_WORKERS,
+    ) -> tuple[Workspace, dict[int, str]]:
+        """Create many workspaces at once, optionally with their K8s namespaces.
+
+        Slugs are allocated for the whole batch and owner access records
+        are inserted together. Namespaces are pre-created concurrently
+        through the PaaS Operator; an existing namespace is not an error.
+
+        Args:
+            vals_list: Workspace values (name, description, owner_id, ...)
+            create_namespaces: Pre-create each workspace's namespace
+            max_workers: Maximum concurrent operator calls
+
+        Returns:
+            tuple: (created workspaces, {workspace_id: namespace error})
+        """
+        workspaces = self.create(vals_list)
+        if not create_namespaces or not workspaces:
+            return workspaces, {}
+
+        client = get_paas_operator_client(self.env)
+        if not client:
+            return workspaces, {ws.id: 'PaaS Operator not configured' for ws in workspaces}
+
+        namespaces = [make_namespace(ws.slug) for ws in workspaces]
+        results = run_operator_batch(
+            client,
+            lambda worker, namespace: worker.create_namespace(
+                namespace=namespace,
+                cpu_limit=NAMESPACE_DEFAULT_QUOTA['cpu'],
+                memory_limit=NAMESPACE_DEFAULT_QUOTA['memory'],
+                storage_limit=NAMESPACE_DEFAULT_QUOTA['storage'],
+            ),
+            namespaces,
+            max_workers,
+        )
+        errors = {}
+        for workspace, (_result, error) in zip(workspaces, results):
+            if error is None or (isinstance(error, PaaSOperatorError) and error.status_code == 409):
+                continue
+            _logger.error("Namespace creation failed for workspace %s: %s", workspace.id, error)
+            if isinstance(error, PaaSOperatorError):
+                errors[workspace.id] = f'Failed to create namespace: {error.detail or error.message}'
+            else:
+                errors[workspace.id] = 'Failed to create namespace'
+        return workspaces, errors
 
     def action_archive(self) -> None:
         """Archive the workspace"""
@@ -108,6 +215,11 @@ class Workspace(models.Model):
         """Restore archived workspace"""
         self.write({'state': 'active'})
 
+    def _notify_bus(self, notification_type: str, payload: dict[str, Any]) -> None:
+        """Publish a notification on each workspace's bus channel."""
+        for workspace in self:
+            self.env['bus.bus']._sendone(workspace, notification_type, payload)
+
     def check_user_access(self, user: Any = None, required_role: str | None = None) -> Union[Any, bool]:
         """
         Check if user has access to this workspace.
@@ -126,26 +238,37 @@ class Workspace(models.Model):
             return False
         self.ensure_one()
         user = user or self.env.user
-        access = self.env['woow_paas_platform.workspace_access'].search([
-            ('workspace_id', '=', self.id),
-            ('user_id', '=', user.id),
-        ], limit=1)
+        WorkspaceAccess = self.env['woow_paas_platform.workspace_access']
+        membership = WorkspaceAccess._get_user_roles(user.id).get(self.id)
 
-        if not access:
+        if not membership:
             return False
 
+        access_id, role = membership
         if required_role:
-            if ROLE_HIERARCHY.index(access.role) < ROLE_HIERARCHY.index(required_role):
+            if ROLE_HIERARCHY.index(role) < ROLE_HIERARCHY.index(required_role):
                 return False
 
+        # Seed the record cache so callers reading access.role hit no SQL
+        access = WorkspaceAccess.browse(access_id)
+        self.env.cache.update(access, WorkspaceAccess._fields['role'], [role])
         return access
 
     def get_user_role(self, user: Any = None) -> str | None:
         """Get the role of a user in this workspace"""
         self.ensure_one()
+        return self.get_user_roles(user).get(self.id)
+
+    def get_user_roles(self, user: Any = None) -> dict[int, str]:
+        """Get the roles of a user in these workspaces (one cached lookup).
+
+        Returns:
+            dict: workspace_id -> role, for the workspaces the user belongs to
+        """
         user = user or self.env.user
-        access = self.env['woow_paas_platform.workspace_access'].search([
-            ('workspace_id', '=', self.id),
-            ('user_id', '=', user.id),
-        ], limit=1)
-        return access.role if access else None
+        memberships = self.env['woow_paas_platform.workspace_access']._get_user_roles(user.id)
+        return {
+            workspace_id: memberships[workspace_id][1]
+            for workspace_id in self.ids
+            if workspace_id in memberships
+        }
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
+from odoo.tools import frozendict
 
 
 # Role constants
@@ -77,6 +78,35 @@ class WorkspaceAccess(models.Model):
          'A user can only have one access record per workspace.')
     ]
 
+    # Membership changes invalidate the cached role map (see _get_user_roles)
+    @api.model_create_multi
+    def create(self, vals_list: list[dict]) -> 'WorkspaceAccess':
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals: dict) -> bool:
+        res = super().write(vals)
+        if {'workspace_id', 'user_id', 'role'} & set(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self) -> bool:
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache('user_id')
+    def _get_user_roles(self, user_id: int) -> frozendict:
+        """Workspace memberships of a user, cached per process.
+
+        Returns:
+            frozendict: workspace_id -> (access_id, role)
+        """
+        accesses = self.sudo().search_fetch([('user_id', '=', user_id)], ['workspace_id', 'role'])
+        return frozendict({access.workspace_id.id: (access.id, access.role) for access in accesses})
+
     @api.constrains('role', 'workspace_id')
     def _check_owner_count(self) -> None:
         """Ensure each workspace has exactly one owner"""
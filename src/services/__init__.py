@@ -1,2 +1,10 @@
 from . import paas_operator
 from . import naming
+from . import list_version
+from . import pagination
+from . import mcp_pool
+from . import async_loop
+from . import generation_buffer
+from . import context_window
+from . import stream_ticket
+from . import llm_scheduler
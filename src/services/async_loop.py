@@ -0,0 +1,222 @@
+"""Long-lived asyncio event loop shared by the async integrations of a worker.
+
+Odoo serves requests from synchronous threads (threaded server), forked
+processes (prefork) or greenlets (gevent worker). Calling ``asyncio.run()``
+per request creates and destroys an event loop each time, so nothing that
+is bound to a loop (MCP sessions, httpx clients, connection pools) can be
+reused. This module runs one event loop per worker process in a background
+thread and lets synchronous code submit coroutines to it:
+
+- :func:`run` blocks until a coroutine finishes and returns its result
+- :func:`iterate` turns an async generator into a synchronous generator,
+  yielding each item as soon as it is produced
+
+:func:`run_blocking` is the counterpart for CPU-bound work (token counting,
+embeddings) done while serving a request: under gevent it runs on a native
+thread so the hub keeps serving the other connections.
+
+The loop is started lazily. A forked child (prefork workers) starts its own
+on first use, since threads do not survive ``fork()``. Under gevent the loop
+runs on a native thread and callers wait through the hub's thread pool, so
+waiting does not block other greenlets.
+"""
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Time given to shutdown callbacks when the worker exits (seconds)
+SHUTDOWN_TIMEOUT = 5
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread = None
+_pid = None
+_shutdown_callbacks: List[Callable[[], Awaitable[None]]] = []
+
+
+def _is_gevent() -> bool:
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+
+def _native_thread_class():
+    """``threading.Thread`` as it was before gevent monkey patching."""
+    if _is_gevent():
+        from gevent import monkey
+        return monkey.get_original('threading', 'Thread')
+    return threading.Thread
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """The running event loop of this worker process, started on first use."""
+    global _loop, _thread, _pid
+    with _lock:
+        if _loop is None or _pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            _thread = _native_thread_class()(
+                target=_run_loop, args=(loop,), name="odoo-async-loop", daemon=True,
+            )
+            _thread.start()
+            _loop, _pid = loop, os.getpid()
+            _logger.debug("Started async loop thread for worker %s", _pid)
+        return _loop
+
+
+def in_loop_thread() -> bool:
+    """Whether the caller runs on the worker loop (where blocking would deadlock)."""
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def submit(coro: Awaitable[Any]) -> Future:
+    """Schedule a coroutine on the worker loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def _wait(future: Future, timeout: Optional[float] = None) -> Any:
+    if _is_gevent():
+        # Block a native pool thread, not the gevent hub
+        from gevent import get_hub
+        return get_hub().threadpool.spawn(future.result, timeout).get()
+    return future.result(timeout)
+
+
+def run(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the worker loop and wait for its result.
+
+    Drop-in replacement for ``asyncio.run()`` from synchronous code.
+
+    Raises:
+        RuntimeError: When called from the loop thread itself.
+        concurrent.futures.TimeoutError: When ``timeout`` expires (the
+            coroutine is cancelled).
+    """
+    if in_loop_thread():
+        coro.close()
+        raise RuntimeError("async_loop.run() called from the worker loop thread")
+    future = submit(coro)
+    try:
+        return _wait(future, timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Call CPU-bound ``func(*args)`` without stalling the gevent hub.
+
+    Under gevent the call runs on a native thread of the hub's pool while
+    the calling greenlet yields; elsewhere (threaded, prefork) it is a plain
+    call. Exceptions are re-raised in the caller.
+    """
+    if _is_gevent() and not in_loop_thread():
+        from gevent import get_hub
+        return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+def iterate(agen: AsyncIterator[Any]) -> Iterator[Any]:
+    """Iterate an async generator from synchronous code, item by item.
+
+    The generator runs on the worker loop and hands items over through a
+    queue, so a WSGI response generator can flush each one while the next
+    is still being produced. Exceptions are re-raised in the caller;
+    closing the returned generator (e.g. the client disconnected) cancels
+    the async side.
+    """
+    items = queue.Queue()
+
+    async def pump():
+        try:
+            async for item in agen:
+                items.put((_ITEM, item))
+        except Exception as exc:
+            items.put((_ERROR, exc))
+        else:
+            items.put((_DONE, None))
+
+    future = submit(pump())
+    try:
+        while True:
+            kind, value = _wait_item(items)
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        future.cancel()
+
+
+def _wait_item(items: queue.Queue):
+    if _is_gevent():
+        from gevent import get_hub
+        return get_hub().threadpool.spawn(items.get).get()
+    return items.get()
+
+
+def register_shutdown(callback: Callable[[], Awaitable[None]]):
+    """Register a coroutine function run on the loop when the worker exits.
+
+    Used by pools living on the loop to close their connections cleanly.
+    """
+    _shutdown_callbacks.append(callback)
+
+
+def shutdown():
+    """Run the shutdown callbacks and stop the loop of this worker."""
+    global _loop
+    with _lock:
+        loop, _loop = _loop, None
+        owned = loop is not None and _pid == os.getpid()
+    if not owned:
+        return
+
+    async def close_all():
+        for callback in _shutdown_callbacks:
+            try:
+                await callback()
+            except Exception as exc:
+                _logger.warning("Async loop shutdown callback failed: %s", exc)
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(SHUTDOWN_TIMEOUT)
+    except Exception as exc:
+        _logger.warning("Async loop shutdown did not complete: %s", exc)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def _after_fork_in_child():
+    """Forget the parent's loop: its thread does not exist in the child."""
+    global _loop, _thread, _pid, _lock
+    _lock = threading.Lock()
+    _loop = _thread = _pid = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(shutdown)
@@ -0,0 +1,108 @@
+"""Token accounting for chat prompts.
+
+Counts tokens locally with ``tiktoken`` (the tokenizer of the OpenAI model
+family, installed with ``langchain-openai``) and picks the newest chat turns
+that fit a token budget. Models unknown to ``tiktoken`` use its general
+purpose encoding; when no encoding can be loaded (``tiktoken`` missing, or
+its BPE files cannot be downloaded) tokens are estimated from the text
+length, which errs on the high side for English and CJK text alike.
+"""
+import functools
+import logging
+from typing import List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Per-message framing added by the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Used by the estimate when no tokenizer is available
+CHARS_PER_TOKEN = 3
+DEFAULT_ENCODING = 'o200k_base'
+
+
+@functools.lru_cache(maxsize=16)
+def _get_encoding(model_name: str):
+    try:
+        import tiktoken
+    except ImportError:
+        _logger.warning("tiktoken is not installed; estimating prompt tokens from length")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        pass
+    except Exception as exc:
+        _logger.warning("Cannot load tokenizer for %s: %s", model_name, exc)
+        return None
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as exc:
+        _logger.warning("Cannot load tokenizer %s: %s", DEFAULT_ENCODING, exc)
+        return None
+
+
+def count_tokens(text: str, model_name: str = '') -> int:
+    """Number of tokens of ``text`` for ``model_name``."""
+    if not text:
+        return 0
+    encoding = _get_encoding(model_name or '')
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(content: str, model_name: str = '') -> int:
+    """Tokens one chat message takes in a prompt, framing included."""
+    return count_tokens(content, model_name) + MESSAGE_OVERHEAD_TOKENS
+
+
+def fit_history(
+    history: List[dict],
+    budget: int,
+    model_name: str = '',
+) -> Tuple[List[dict], List[dict]]:
+    """Split chat turns into the newest ones fitting ``budget`` and the rest.
+
+    Args:
+        history: Turns (``role`` / ``content`` dicts), oldest first.
+        budget: Tokens available for the kept turns.
+
+    Returns:
+        ``(kept, dropped)``, both oldest first; ``dropped`` is the older part.
+    """
+    used = 0
+    start = len(history)
+    for index in range(len(history) - 1, -1, -1):
+        used += count_message_tokens(history[index].get('content', ''), model_name)
+        if used > budget:
+            break
+        start = index
+    return history[start:], history[:start]
+
+
+def take_within_budget(
+    turns: List[dict],
+    budget: int,
+    model_name: str = '',
+) -> List[dict]:
+    """The oldest turns that fit ``budget`` (at least one, if any)."""
+    used = 0
+    taken = []
+    for turn in turns:
+        used += count_message_tokens(turn.get('content', ''), model_name)
+        if used > budget and taken:
+            break
+        taken.append(turn)
+    return taken
+
+
+def format_transcript(turns: List[dict], limit_chars: Optional[int] = None) -> str:
+    """Render turns as ``User:`` / ``Assistant:`` lines for a summary prompt."""
+    lines = []
+    for turn in turns:
+        speaker = 'Assistant' if turn.get('role') == 'assistant' else 'User'
+        content = turn.get('content', '')
+        if limit_chars and len(content) > limit_chars:
+            content = content[:limit_chars] + '…'
+        lines.append(f"{speaker}: {content}")
+    return '\n\n'.join(lines)
@@ -0,0 +1,136 @@
+"""Replayable event buffers for AI reply generations.
+
+An AI reply used to be generated inside the SSE response: when the browser
+lost the connection the generation was abandoned, and the reconnect started
+a new one (billing the whole prompt again). A generation now runs in its own
+thread and publishes its events here, numbered from 1. SSE responses are
+readers: they send each event with an ``id: <generation>:<seq>`` line, and a
+reconnect carrying ``Last-Event-ID`` replays what it missed and then follows
+the still-running generation.
+
+Buffers are per process and kept ``GENERATION_TTL`` seconds after the
+generation ends.
+"""
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Finished generations stay replayable this long (seconds)
+GENERATION_TTL = 300
+# A reader with nothing to send yields a keep-alive this often (seconds)
+KEEPALIVE_INTERVAL = 15
+
+_lock = threading.Lock()
+_generations: Dict[str, 'Generation'] = {}
+# (db, channel id, user message id) -> generation id
+_by_key: Dict[Tuple, str] = {}
+
+
+class Generation:
+    """Events of one AI reply, appended by its producer thread."""
+
+    def __init__(self, key: Tuple):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.events: List[dict] = []
+        self.finished = False
+        self.finished_at: Optional[float] = None
+        self._cond = threading.Condition()
+
+    def publish(self, payload: dict, final: bool = False):
+        """Append an event; ``final`` marks the last one."""
+        with self._cond:
+            self.events.append(payload)
+            if final:
+                self.finished = True
+                self.finished_at = time.monotonic()
+            self._cond.notify_all()
+
+    def follow(self, after_seq: int = 0) -> Iterator[Tuple[int, Optional[dict]]]:
+        """Yield ``(seq, event)`` after ``after_seq`` until the final event.
+
+        Yields ``(seq, None)`` when nothing arrived for ``KEEPALIVE_INTERVAL``
+        seconds, so the caller can keep the connection alive.
+        """
+        seq = max(after_seq, 0)
+        while True:
+            with self._cond:
+                if seq >= len(self.events) and not self.finished:
+                    self._cond.wait(KEEPALIVE_INTERVAL)
+                pending = self.events[seq:]
+                finished = self.finished
+            if not pending:
+                if finished:
+                    return
+                yield seq, None
+                continue
+            for payload in pending:
+                seq += 1
+                yield seq, payload
+            if finished and seq >= len(self.events):
+                return
+
+
+def _prune():
+    now = time.monotonic()
+    for gen_id, generation in list(_generations.items()):
+        if generation.finished and now - generation.finished_at > GENERATION_TTL:
+            del _generations[gen_id]
+            if _by_key.get(generation.key) == gen_id:
+                del _by_key[generation.key]
+
+
+def get_generation(gen_id: str) -> Optional[Generation]:
+    """A generation of this process by id, if still buffered."""
+    with _lock:
+        _prune()
+        return _generations.get(gen_id)
+
+
+def find_generation(key: Tuple) -> Optional[Generation]:
+    """The buffered generation answering ``key`` (db, channel, user message)."""
+    with _lock:
+        _prune()
+        gen_id = _by_key.get(key)
+        return _generations.get(gen_id) if gen_id else None
+
+
+def start_generation(key: Tuple, producer: Callable[[Generation], Any]) -> Generation:
+    """Run ``producer(generation)`` in a thread, or join the one already running.
+
+    The producer publishes the events and must publish a final one; if it
+    raises, a final error event is published for it.
+    """
+    with _lock:
+        _prune()
+        gen_id = _by_key.get(key)
+        if gen_id and gen_id in _generations:
+            return _generations[gen_id]
+        generation = Generation(key)
+        _generations[generation.id] = generation
+        _by_key[key] = generation.id
+
+    def run():
+        try:
+            producer(generation)
+        except Exception as exc:
+            _logger.exception("AI generation %s failed: %s", generation.id, exc)
+        finally:
+            if not generation.finished:
+                generation.publish({'error': 'Generation failed', 'done': True}, final=True)
+
+    threading.Thread(target=run, name=f'ai-generation-{generation.id[:8]}', daemon=True).start()
+    return generation
+
+
+def parse_event_id(value: str) -> Tuple[Optional[str], int]:
+    """Split an SSE event id ``<generation>:<seq>`` (``(None, 0)`` if invalid)."""
+    gen_id, _, seq = (value or '').partition(':')
+    try:
+        return (gen_id or None), max(int(seq), 0)
+    except ValueError:
+        return None, 0
@@ -0,0 +1,21 @@
+import hashlib
+from typing import Any
+
+
+def get_version_token(model: Any, domain: list) -> str:
+    """Summarize a list query as ``count.max_id.max_write_date``.
+
+    Uses a single aggregate query and never loads the records, so list
+    endpoints can answer "not modified" without formatting anything.
+    Record rules of ``model``'s environment apply as for a search.
+    """
+    count, max_id, max_write_date = model._read_group(
+        domain, aggregates=['__count', 'id:max', 'write_date:max'],
+    )[0]
+    write_date = max_write_date.isoformat() if max_write_date else ''
+    return f"{count}.{max_id or 0}.{write_date}"
+
+
+def combine_version_tokens(*tokens: str) -> str:
+    """Fold several version tokens into one opaque, fixed-length token."""
+    return hashlib.sha1('|'.join(tokens).encode()).hexdigest()[:20]
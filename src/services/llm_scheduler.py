@@ -0,0 +1,255 @@
+"""Rate-limit scheduler in front of the LLM providers.
+
+An ``ai.config`` may declare its provider limits (requests and tokens per
+minute). All workers take from the same token buckets, one row per config
+in ``woow_paas_platform_llm_rate_bucket`` updated under a row lock on a
+short connection of its own, so bursts from every worker together stay
+under the limit instead of turning into 429 errors.
+
+Within a process, callers of one config wait in a bounded priority queue:
+interactive replies (SSE streams) are served before background work
+(conversation summaries), and a full queue or a wait longer than
+``SCHEDULER_MAX_WAIT`` fails fast with :class:`SchedulerBusy`.
+
+A 429 that still gets through (limits set too high, other clients of the
+same key) blocks the bucket for every worker until the reset announced by
+the provider's headers; the caller then retries.
+"""
+import email.utils
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# Callers waiting per config and process; more are refused (backpressure)
+SCHEDULER_MAX_QUEUE = 32
+# Longest wait for a slot before giving up (seconds)
+SCHEDULER_MAX_WAIT = 60
+# Retries of a call rejected with 429
+RATE_LIMIT_MAX_RETRIES = 3
+# Delay of the first retry when the provider sends no reset header (seconds)
+RATE_LIMIT_BACKOFF = 1.0
+# Upper bound of a single retry delay (seconds)
+RATE_LIMIT_MAX_DELAY = 60.0
+
+_TABLE = 'woow_paas_platform_llm_rate_bucket'
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+class SchedulerBusy(Exception):
+    """Raised when no slot can be granted within the queue bounds."""
+
+
+class RateLimit(NamedTuple):
+    """Provider limits of one ``ai.config`` (0 means unlimited)."""
+    db: str
+    config_id: int
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+# -------------------- shared buckets --------------------
+
+def _take(limit: RateLimit, tokens: int) -> float:
+    """Take one request and ``tokens`` tokens from the shared buckets.
+
+    Returns:
+        0 when granted, else the seconds until enough is available.
+    """
+    from odoo.sql_db import db_connect
+
+    rpm, tpm = limit.requests_per_minute, limit.tokens_per_minute
+    with db_connect(limit.db).cursor() as cr:
+        cr.execute(f"""
+            INSERT INTO {_TABLE} (config_id, request_allowance, token_allowance, refilled_at)
+            VALUES (%s, %s, %s, clock_timestamp() AT TIME ZONE 'UTC')
+            ON CONFLICT (config_id) DO NOTHING
+        """, [limit.config_id, rpm, tpm])
+        cr.execute(f"""
+            SELECT request_allowance, token_allowance, refilled_at, blocked_until
+              FROM {_TABLE} WHERE config_id = %s FOR UPDATE
+        """, [limit.config_id])
+        requests, allowance, refilled_at, blocked_until = cr.fetchone()
+        cr.execute("SELECT clock_timestamp() AT TIME ZONE 'UTC'")
+        now = cr.fetchone()[0]
+
+        elapsed = max((now - refilled_at).total_seconds(), 0.0) if refilled_at else 60.0
+        requests = min(rpm, (requests or 0.0) + elapsed * rpm / 60.0)
+        allowance = min(tpm, (allowance or 0.0) + elapsed * tpm / 60.0)
+        # A prompt larger than the whole minute budget waits for a full bucket
+        needed = min(tokens, tpm)
+
+        if blocked_until and blocked_until > now:
+            wait = (blocked_until - now).total_seconds()
+        else:
+            wait = 0.0
+            if rpm and requests < 1:
+                wait = max(wait, (1 - requests) * 60.0 / rpm)
+            if tpm and allowance < needed:
+                wait = max(wait, (needed - allowance) * 60.0 / tpm)
+            if not wait:
+                requests -= 1 if rpm else 0
+                allowance -= needed
+
+        cr.execute(f"""
+            UPDATE {_TABLE}
+               SET request_allowance = %s, token_allowance = %s, refilled_at = %s
+             WHERE config_id = %s
+        """, [requests, allowance, now, limit.config_id])
+    return wait
+
+
+def block(limit: RateLimit, seconds: float):
+    """Hold every worker back for ``seconds`` (after a 429) and empty the buckets."""
+    from odoo.sql_db import db_connect
+
+    with db_connect(limit.db).cursor() as cr:
+        cr.execute(f"""
+            UPDATE {_TABLE}
+               SET blocked_until = GREATEST(
+                       blocked_until,
+                       clock_timestamp() AT TIME ZONE 'UTC' + make_interval(secs => %s)),
+                   request_allowance = 0,
+                   token_allowance = 0,
+                   refilled_at = clock_timestamp() AT TIME ZONE 'UTC' + make_interval(secs => %s)
+             WHERE config_id = %s
+        """, [seconds, seconds, limit.config_id])
+
+
+# -------------------- per-process queue --------------------
+
+class _Queue:
+    """Callers of one config in this process, served by priority then arrival."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._counter = itertools.count()
+
+    def acquire(
+        self,
+        take: Callable[[], float],
+        priority: int,
+        max_wait: float,
+        max_queue: int = SCHEDULER_MAX_QUEUE,
+    ):
+        """Wait until ``take()`` grants a slot to this caller.
+
+        Only the head of the queue calls ``take``; the others wait, so a
+        higher priority arrival goes next even while the head is waiting.
+
+        Raises:
+            SchedulerBusy: The queue is full or the wait exceeds ``max_wait``.
+        """
+        deadline = time.monotonic() + max_wait
+        entry = (priority, next(self._counter))
+        with self._cond:
+            if len(self._waiting) >= max_queue:
+                raise SchedulerBusy("Too many AI requests waiting for this provider")
+            heapq.heappush(self._waiting, entry)
+        try:
+            while True:
+                with self._cond:
+                    while self._waiting[0] != entry:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise SchedulerBusy("Timed out waiting for the AI provider rate limit")
+                        self._cond.wait(remaining)
+                wait = take()
+                if wait <= 0:
+                    return
+                if time.monotonic() + wait > deadline:
+                    raise SchedulerBusy("AI provider rate limit reached, try again shortly")
+                with self._cond:
+                    self._cond.wait(wait)
+        finally:
+            with self._cond:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+
+_queues_lock = threading.Lock()
+_queues: Dict[Tuple[str, int], _Queue] = {}
+
+
+def acquire(
+    limit: RateLimit,
+    tokens: int,
+    priority: int = PRIORITY_INTERACTIVE,
+    max_wait: float = SCHEDULER_MAX_WAIT,
+):
+    """Block until one request of ``tokens`` tokens fits the limits of ``limit``.
+
+    Raises:
+        SchedulerBusy: No slot within the queue bounds.
+    """
+    if not (limit.requests_per_minute or limit.tokens_per_minute):
+        return
+    with _queues_lock:
+        queue = _queues.setdefault((limit.db, limit.config_id), _Queue())
+    queue.acquire(lambda: _take(limit, tokens), priority, max_wait)
+
+
+# -------------------- 429 handling --------------------
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """Whether ``exc`` is a 429 worth retrying (not an exhausted quota)."""
+    if getattr(exc, 'status_code', None) != 429 and type(exc).__name__ != 'RateLimitError':
+        return False
+    return getattr(exc, 'code', None) != 'insufficient_quota'
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds of ``"12"``, ``"1.5"``, ``"250ms"`` or ``"1m30s"`` (None if unknown)."""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_delay(exc: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying a call rejected with ``exc``.
+
+    Uses ``retry-after-ms`` / ``retry-after`` when sent, else the latest
+    ``x-ratelimit-reset-*`` header, else exponential backoff.
+    """
+    headers = getattr(getattr(exc, 'response', None), 'headers', None) or {}
+    delay = None
+    retry_after_ms = _parse_duration(headers.get('retry-after-ms'))
+    if retry_after_ms is not None:
+        delay = retry_after_ms / 1000.0
+    if delay is None:
+        retry_after = headers.get('retry-after')
+        delay = _parse_duration(retry_after)
+        if delay is None and retry_after:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+    if delay is None:
+        resets = [
+            _parse_duration(headers.get(name))
+            for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+        ]
+        resets = [reset for reset in resets if reset is not None]
+        delay = max(resets) if resets else None
+    if delay is None:
+        delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+    return min(max(delay, 0.1), RATE_LIMIT_MAX_DELAY)
@@ -0,0 +1,296 @@
+"""Per-worker pool of live MCP client sessions.
+
+Chat requests used to open a fresh ``MultiServerMCPClient`` (and a new SSE /
+streamable-HTTP connection per server) and call ``get_tools()`` before the
+first LLM call. Tools are already synced into ``woow_paas_platform.mcp_tool``,
+so this module builds the LangChain tool objects from the stored
+``input_schema`` instead, and routes tool calls through sessions that stay
+open between requests.
+
+The sessions live on the worker's event loop (``services/async_loop.py``),
+since MCP sessions are bound to the loop that opened them. Idle sessions
+are closed after ``SESSION_IDLE_TIMEOUT``, and a session that sat unused
+for ``HEALTH_CHECK_INTERVAL`` is pinged before it is reused.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import async_loop
+
+_logger = logging.getLogger(__name__)
+
+# Close sessions unused for this long (seconds)
+SESSION_IDLE_TIMEOUT = 300
+# Ping a session before reuse when it has been idle this long (seconds)
+HEALTH_CHECK_INTERVAL = 30
+# Opening a session (connect + initialize) and pinging it (seconds)
+SESSION_CONNECT_TIMEOUT = 15
+HEALTH_CHECK_TIMEOUT = 5
+# A single tool call (seconds)
+TOOL_CALL_TIMEOUT = 60
+# How often idle sessions are swept (seconds)
+SWEEP_INTERVAL = 60
+# Built tool objects kept per process, keyed by server sync state
+TOOL_CACHE_MAX_ENTRIES = 256
+
+
+def server_key(server_id: int) -> str:
+    """Prefix of the tool names of a server (``s{id}``), unique per server."""
+    return f"s{server_id}"
+
+
+def _config_fingerprint(config: dict) -> str:
+    """Stable digest of a connection config (URL, transport, headers)."""
+    raw = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class _PooledSession:
+    """One live MCP session, owned by a task on the worker loop.
+
+    The transport context managers are entered and exited by the same task
+    (anyio cancel scopes require it); other tasks only send requests.
+    """
+
+    def __init__(self, server_id: int, config: dict):
+        self.server_id = server_id
+        self.fingerprint = _config_fingerprint(config)
+        self.config = config
+        self.session = None
+        self.last_used = time.monotonic()
+        self._ready = asyncio.get_running_loop().create_future()
+        self._closed = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        from langchain_mcp_adapters.sessions import create_session
+
+        connection = dict(self.config)
+        if connection.get('transport') == 'streamable_http':
+            connection.setdefault('timeout', timedelta(seconds=SESSION_CONNECT_TIMEOUT))
+        try:
+            async with create_session(connection) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set_result(session)
+                await self._closed.wait()
+        except Exception as exc:
+            if not self._ready.done():
+                self._ready.set_exception(exc)
+            else:
+                _logger.info("MCP session for server %s ended: %s", self.server_id, exc)
+        finally:
+            self.session = None
+
+    async def wait_ready(self):
+        return await asyncio.wait_for(asyncio.shield(self._ready), SESSION_CONNECT_TIMEOUT)
+
+    @property
+    def alive(self) -> bool:
+        return not self._task.done() and not self._closed.is_set()
+
+    async def close(self):
+        self._closed.set()
+        try:
+            await asyncio.wait_for(self._task, HEALTH_CHECK_TIMEOUT)
+        except Exception:
+            self._task.cancel()
+
+
+class McpSessionPool:
+    """Live MCP sessions keyed by server id, for the current worker process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: Dict[int, _PooledSession] = {}
+        self._opening: Dict[int, asyncio.Lock] = {}
+
+    # -------------------- loop --------------------
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """The worker loop, with the idle sweeper running on it."""
+        loop = async_loop.get_loop()
+        with self._lock:
+            if self._loop is not loop:
+                # First use, or a forked child with a fresh loop
+                self._sessions = {}
+                self._opening = {}
+                self._loop = loop
+                asyncio.run_coroutine_threadsafe(self._sweep(), loop)
+        return loop
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            now = time.monotonic()
+            for server_id, pooled in list(self._sessions.items()):
+                if not pooled.alive or now - pooled.last_used > SESSION_IDLE_TIMEOUT:
+                    self._sessions.pop(server_id, None)
+                    await pooled.close()
+
+    # -------------------- sessions --------------------
+
+    async def _get_session(self, server_id: int, config: dict):
+        """Return a live, healthy session for a server (worker loop only)."""
+        opening = self._opening.setdefault(server_id, asyncio.Lock())
+        async with opening:
+            pooled = self._sessions.get(server_id)
+            if pooled and (not pooled.alive or pooled.fingerprint != _config_fingerprint(config)):
+                # Dead, or the server's URL / credentials changed
+                self._sessions.pop(server_id, None)
+                await pooled.close()
+                pooled = None
+            if pooled and time.monotonic() - pooled.last_used > HEALTH_CHECK_INTERVAL:
+                try:
+                    await asyncio.wait_for(pooled.session.send_ping(), HEALTH_CHECK_TIMEOUT)
+                except Exception as exc:
+                    _logger.info("MCP session for server %s failed health check: %s", server_id, exc)
+                    self._sessions.pop(server_id, None)
+                    await pooled.close()
+                    pooled = None
+            if not pooled:
+                pooled = _PooledSession(server_id, config)
+                try:
+                    await pooled.wait_ready()
+                except BaseException:
+                    await pooled.close()
+                    raise
+                self._sessions[server_id] = pooled
+            pooled.last_used = time.monotonic()
+            return pooled.session
+
+    async def _call_tool(self, server_id: int, config: dict, name: str, arguments: dict):
+        session = await self._get_session(server_id, config)
+        try:
+            return await asyncio.wait_for(session.call_tool(name, arguments), TOOL_CALL_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise
+        except Exception as exc:
+            # The connection may have dropped since the health check:
+            # retry once on a fresh session
+            _logger.info("MCP call %s on server %s failed, reconnecting: %s", name, server_id, exc)
+            pooled = self._sessions.pop(server_id, None)
+            if pooled:
+                await pooled.close()
+            session = await self._get_session(server_id, config)
+            return await asyncio.wait_for(session.call_tool(name, arguments), TOOL_CALL_TIMEOUT)
+
+    async def call_tool(self, server_id: int, config: dict, name: str, arguments: dict):
+        """Call a tool through the pooled session of its server.
+
+        Awaitable from any event loop; the call itself runs on the worker loop.
+
+        Returns:
+            mcp.types.CallToolResult
+        """
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._call_tool(server_id, config, name, arguments)
+        future = asyncio.run_coroutine_threadsafe(
+            self._call_tool(server_id, config, name, arguments), loop,
+        )
+        return await asyncio.wrap_future(future)
+
+    async def close_all(self):
+        """Close every session of this worker (runs on the worker loop)."""
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for pooled in sessions:
+            await pooled.close()
+
+
+_pool = McpSessionPool()
+async_loop.register_shutdown(_pool.close_all)
+# (db, server, last_sync, config fingerprint) -> {mcp_tool id: built tool}
+_tool_cache: Dict[Tuple, Dict[int, Any]] = {}
+_tool_cache_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> McpSessionPool:
+    """The MCP session pool of this worker process."""
+    return _pool
+
+
+def _result_to_text(result) -> str:
+    """Flatten the content of a ``CallToolResult`` into text for the LLM."""
+    parts = []
+    for item in result.content or []:
+        text = getattr(item, 'text', None)
+        parts.append(text if text is not None else str(item))
+    return '\n'.join(parts)
+
+
+def _make_tool(server_id: int, config: dict, name: str, description: str, schema: dict):
+    from langchain_core.tools import StructuredTool, ToolException
+
+    async def call(**arguments):
+        result = await _pool.call_tool(server_id, config, name, arguments)
+        text = _result_to_text(result)
+        if result.isError:
+            raise ToolException(text)
+        return text
+
+    schema = schema or {'type': 'object', 'properties': {}}
+    # Identifies what the tool binds (schema, description, connection) so
+    # compiled agent graphs can be cached per tool set
+    fingerprint = hashlib.sha256(json.dumps(
+        [server_id, _config_fingerprint(config), name, description or '', schema],
+        sort_keys=True, default=str,
+    ).encode()).hexdigest()
+    return StructuredTool(
+        name=f"{server_key(server_id)}_{name}",
+        description=description or '',
+        args_schema=schema,
+        coroutine=call,
+        metadata={'mcp_fingerprint': fingerprint},
+    )
+
+
+def build_mcp_tools(mcp_tools) -> List[Any]:
+    """LangChain tools for an ``mcp_tool`` recordset, without contacting servers.
+
+    Tool names carry the ``s{server_id}_`` prefix. Built tools are cached per
+    (database, server, ``last_sync``, connection config), so schemas are
+    re-read only after a sync or a change to the server's connection. The
+    entry of a server holds every tool built so far; assistants enabling
+    different subsets of its tools share it.
+
+    Must be called with a valid cursor (reads the ORM); the returned tools
+    can then be used anywhere.
+    """
+    tools = []
+    for server in mcp_tools.mapped('server_id'):
+        server_tools = mcp_tools.filtered(lambda t, s=server: t.server_id == s)
+        config = server.sudo()._get_mcp_client_config()
+        key = (
+            server.env.cr.dbname, server.id, str(server.last_sync or ''),
+            _config_fingerprint(config),
+        )
+        with _tool_cache_lock:
+            cached = _tool_cache.get(key)
+            if cached is None:
+                # Entries of older syncs or connection settings are never hit again
+                for stale in [k for k in _tool_cache if k[:2] == key[:2]]:
+                    del _tool_cache[stale]
+                while len(_tool_cache) >= TOOL_CACHE_MAX_ENTRIES:
+                    _tool_cache.pop(next(iter(_tool_cache)))
+                cached = _tool_cache[key] = {}
+        for tool in server_tools:
+            if tool.id in cached:
+                continue
+            try:
+                schema = json.loads(tool.input_schema or '{}')
+            except (json.JSONDecodeError, TypeError):
+                _logger.warning("Invalid input_schema for MCP tool %s", tool.name)
+                schema = {}
+            built = _make_tool(server.id, config, tool.name, tool.description, schema)
+            with _tool_cache_lock:
+                cached.setdefault(tool.id, built)
+        tools.extend(cached[tool.id] for tool in server_tools)
+    return tools
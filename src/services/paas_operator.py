@@ -5,7 +5,9 @@ FastAPI service that manages Helm releases in Kubernetes.
 """
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 from requests.exceptions import ConnectionError, RequestException, Timeout
@@ -16,6 +18,8 @@ _logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 30
 # Longer timeout for helm operations that may take time
 HELM_OPERATION_TIMEOUT = 120
+# Upper bound on concurrent operator calls issued by a single batch request
+BATCH_MAX_WORKERS = 8
 
 
 class PaaSOperatorError(Exception):
@@ -601,6 +605,51 @@ def get_paas_operator_client(env) -> Optional[PaaSOperatorClient]:
     return PaaSOperatorClient(base_url=base_url, api_key=api_key)
 
 
+def run_operator_batch(
+    client: PaaSOperatorClient,
+    func: Callable[[PaaSOperatorClient, Any], Any],
+    items: List[Any],
+    max_workers: int = BATCH_MAX_WORKERS,
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """Run ``func(worker_client, item)`` for every item on a bounded thread pool.
+
+    Used by batch endpoints to fan out operator round trips concurrently.
+    ``requests.Session`` is not guaranteed to be thread-safe, so each worker
+    thread gets its own client built from ``client``'s URL and API key.
+    ``func`` must only talk to the operator; ORM access is not thread-safe
+    and has to stay on the calling thread.
+
+    Args:
+        client: Configured client whose credentials are reused by the workers
+        func: Callable invoked with a per-thread client and one item
+        items: Items to process
+        max_workers: Maximum number of concurrent operator calls
+
+    Returns:
+        List of ``(result, error)`` tuples in the same order as ``items``.
+        ``error`` is the raised exception, or None on success.
+    """
+    if not items:
+        return []
+
+    local = threading.local()
+
+    def _worker_client() -> PaaSOperatorClient:
+        if not hasattr(local, 'client'):
+            local.client = PaaSOperatorClient(base_url=client.base_url, api_key=client.api_key)
+        return local.client
+
+    def _call(item: Any) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return func(_worker_client(), item), None
+        except Exception as e:
+            return None, e
+
+    workers = max(1, min(max_workers, len(items)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='paas-batch') as executor:
+        return list(executor.map(_call, items))
+
+
 def get_mcp_endpoint_url(
     env,
     sidecar_response: Optional[Dict[str, Any]] = None,
@@ -0,0 +1,164 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from odoo.osv import expression
+
+# Page size used when the client does not ask for one, and the hard cap
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 500
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def parse_limit(limit: Any) -> int:
+    """Clamp a client supplied page size to ``1..MAX_PAGE_LIMIT``."""
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_LIMIT
+    return max(1, min(limit, MAX_PAGE_LIMIT))
+
+
+def encode_cursor(record: Any, order: list[tuple[str, bool]]) -> str:
+    """Encode the sort key of ``record`` as an opaque cursor."""
+    values = []
+    for field_name, _descending in order:
+        value = record[field_name]
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        values.append(value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def decode_cursor(model: Any, cursor: str, order: list[tuple[str, bool]]) -> list[Any]:
+    """Decode a cursor back to sort key values typed for ``model``.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or does not match ``order``
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(order):
+            raise InvalidCursor('Invalid cursor')
+        decoded = []
+        for (field_name, _descending), value in zip(order, values):
+            field_type = model._fields[field_name].type
+            if value is None:
+                raise InvalidCursor('Invalid cursor')
+            if field_type == 'datetime':
+                value = datetime.fromisoformat(value)
+            elif field_type == 'date':
+                value = date.fromisoformat(value)
+            elif field_type in ('integer', 'many2one') or field_name == 'id':
+                value = int(value)
+            decoded.append(value)
+        return decoded
+    except InvalidCursor:
+        raise
+    except (TypeError, ValueError, KeyError) as e:
+        raise InvalidCursor('Invalid cursor') from e
+
+
+def keyset_domain(order: list[tuple[str, bool]], values: list[Any]) -> list:
+    """Domain selecting rows strictly after ``values`` in ``order``.
+
+    Expands the row comparison ``(k1, ..., id) > (v1, ..., vid)`` into
+    ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...`` so mixed sort directions
+    work and each branch can use the sort key indexes.
+    """
+    branches = []
+    for i, (field_name, descending) in enumerate(order):
+        branch = [(name, '=', value) for (name, _desc), value in zip(order[:i], values[:i])]
+        branch.append((field_name, '<' if descending else '>', values[i]))
+        branches.append(expression.AND([[leaf] for leaf in branch]))
+    return expression.OR(branches)
+
+
+def paginate(
+    model: Any,
+    domain: list,
+    order: list[tuple[str, bool]],
+    limit: Any = None,
+    cursor: str | None = None,
+) -> tuple[Any, str | None]:
+    """Fetch one keyset page of ``model`` records.
+
+    Args:
+        model: Model (with the caller's environment and record rules)
+        domain: Base search domain
+        order: ``(field, descending)`` sort keys, ending with ``id``; keys
+            must never be NULL
+        limit: Requested page size (clamped, see ``parse_limit``)
+        cursor: ``next_cursor`` of the previous page, if any
+
+    Returns:
+        tuple: (records, next_cursor) - ``next_cursor`` is None on the last page
+
+    Raises:
+        InvalidCursor: If ``cursor`` cannot be decoded
+    """
+    limit = parse_limit(limit) if limit is not None else DEFAULT_PAGE_LIMIT
+    if cursor:
+        domain = expression.AND([domain, keyset_domain(order, decode_cursor(model, cursor, order))])
+    order_spec = ', '.join(f"{name} {'desc' if descending else 'asc'}" for name, descending in order)
+    records = model.search(domain, order=order_spec, limit=limit + 1)
+    if len(records) <= limit:
+        return records, None
+    records = records[:limit]
+    return records, encode_cursor(records[-1], order)
+
+
+def paginate_entries(
+    model: Any,
+    entries: Sequence[dict],
+    order: list[tuple[str, bool]],
+    limit: Any = None,
+    cursor: str | None = None,
+) -> tuple[Sequence[dict], str | None]:
+    """Keyset page over already sorted, serialized rows (e.g. a cached list).
+
+    Produces the same cursors as ``paginate``, so a client can page a list
+    whether it is served from the database or from memory.
+
+    Args:
+        model: Model the entries come from (types the decoded cursor)
+        entries: Dicts holding every ``order`` key, sorted by ``order``
+        order: ``(field, descending)`` sort keys, ending with ``id``
+        limit: Requested page size (clamped, see ``parse_limit``)
+        cursor: ``next_cursor`` of the previous page, if any
+
+    Returns:
+        tuple: (entries, next_cursor) - ``next_cursor`` is None on the last page
+
+    Raises:
+        InvalidCursor: If ``cursor`` cannot be decoded
+    """
+    limit = parse_limit(limit) if limit is not None else DEFAULT_PAGE_LIMIT
+    start = 0
+    if cursor:
+        values = decode_cursor(model, cursor, order)
+        # Resume right after the cursor row; if it is gone, compare keys
+        # (Python ordering may differ from the database collation, so the
+        # row itself is the reliable anchor)
+        start = next((i + 1 for i, entry in enumerate(entries) if entry['id'] == values[-1]), None)
+        if start is None:
+            start = next(
+                (i for i, entry in enumerate(entries) if _entry_after(entry, order, values)),
+                len(entries),
+            )
+    page = entries[start:start + limit]
+    if start + limit >= len(entries):
+        return page, None
+    return page, encode_cursor(page[-1], order)
+
+
+def _entry_after(entry: dict, order: list[tuple[str, bool]], values: list[Any]) -> bool:
+    """Whether ``entry`` sorts strictly after the key ``values``."""
+    for (field_name, descending), value in zip(order, values):
+        if entry[field_name] != value:
+            return entry[field_name] < value if descending else entry[field_name] > value
+    return False
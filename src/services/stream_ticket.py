@@ -0,0 +1,58 @@
+"""Signed, short-lived tickets for the AI reply SSE stream.
+
+The stream is served by the gevent process (port 8072, routed by nginx) so
+a long generation does not hold a prefork HTTP worker. The stream endpoint
+does not use the session: a regular worker validates the chat request and
+issues a ticket binding database, user, channel and message, signed with
+the database secret. Tickets expire after ``STREAM_TICKET_TTL`` seconds.
+"""
+import base64
+import json
+import time
+
+from odoo.tools import consteq
+from odoo.tools.misc import hmac as odoo_hmac
+
+# Lifetime of a ticket; reconnects ask for a new one (seconds)
+STREAM_TICKET_TTL = 120
+
+_SCOPE = 'woow_paas_platform.ai_stream'
+
+
+class InvalidTicket(Exception):
+    """Raised when a stream ticket is malformed, forged or expired."""
+
+
+def make_ticket(env, channel_id: int, message_id: int) -> str:
+    """Ticket allowing ``env.user`` to stream the reply to ``message_id``."""
+    payload = {
+        'db': env.cr.dbname,
+        'uid': env.uid,
+        'channel_id': channel_id,
+        'message_id': message_id,
+        'exp': int(time.time()) + STREAM_TICKET_TTL,
+    }
+    body = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(',', ':')).encode(),
+    ).decode().rstrip('=')
+    return f"{body}.{odoo_hmac(env, _SCOPE, body)}"
+
+
+def verify_ticket(env, ticket: str) -> dict:
+    """Check a ticket against the database of ``env`` and return its payload.
+
+    Raises:
+        InvalidTicket: Bad signature, other database, or expired.
+    """
+    body, _, signature = (ticket or '').partition('.')
+    if not body or not signature or not consteq(signature, odoo_hmac(env, _SCOPE, body)):
+        raise InvalidTicket("Invalid stream ticket")
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(body + '=' * (-len(body) % 4)))
+    except ValueError as exc:
+        raise InvalidTicket("Invalid stream ticket") from exc
+    if payload.get('db') != env.cr.dbname:
+        raise InvalidTicket("Invalid stream ticket")
+    if payload.get('exp', 0) < time.time():
+        raise InvalidTicket("Stream ticket expired")
+    return payload
@@ -21,6 +21,7 @@ const ERROR_MESSAGES = {
   no_message: "找不到訊息，請重新傳送。",
   access_denied: "您無權存取此聊天頻道。",
   csrf_error: "請求驗證失敗，請重新整理頁面。",
+  invalid_ticket: "串流驗證失敗，請重新整理頁面。",
 };
 
 /**
@@ -69,6 +70,7 @@ export class AiChat extends Component {
     this._connectedTimer = null;
     this._consecutiveParseErrors = 0;
     this._toolCallCounter = 0;
+    this._lastEventId = null;
 
     onMounted(async () => {
       await this.loadAssistants();
@@ -183,8 +185,10 @@ export class AiChat extends Component {
 
   /**
    * Start an SSE connection to stream the AI response.
+   * @param {boolean} [resume=false] - Continue the current reply from the
+   *   last received event instead of starting over
    */
-  startStream() {
+  async startStream(resume = false) {
     // Pre-flight: validate channelId
     const channelId = this.props.channelId;
     if (!channelId || typeof channelId !== "number" || channelId <= 0) {
@@ -194,14 +198,39 @@ export class AiChat extends Component {
     }
 
     this.state.connectionState = "connecting";
-    this.closeStream();
+    if (resume && this._lastEventId) {
+      // Keep the partial reply; the server replays what was missed
+      this._closeEventSource();
+    } else {
+      this.closeStream();
+      this._lastEventId = null;
+    }
     this.state.streaming = true;
-    this.state.streamingText = "";
 
-    const url = aiService.getStreamUrl(this.props.channelId);
+    const ticketResult = await aiService.getStreamTicket(channelId);
+    if (!ticketResult.success) {
+      if (!ticketResult.error_code) {
+        // Network error: retry like a dropped stream
+        this._scheduleReconnect(resume);
+        return;
+      }
+      this.state.error = ERROR_MESSAGES[ticketResult.error_code] || ticketResult.error;
+      this.state.connectionState = "error";
+      this.closeStream();
+      return;
+    }
+    if (!this.state.streaming) {
+      // Closed while the ticket was requested
+      return;
+    }
+
+    const url = aiService.getStreamUrl(channelId, ticketResult.data.ticket, this._lastEventId);
     this.eventSource = new EventSource(url);
 
     this.eventSource.onmessage = (event) => {
+      if (event.lastEventId) {
+        this._lastEventId = event.lastEventId;
+      }
       try {
         const data = JSON.parse(event.data);
 
@@ -278,8 +307,9 @@ export class AiChat extends Component {
             : null;
           const hadContent = this.state.streamingText || toolCalls;
 
-          // Add the complete AI message to the list
-          if (hadContent) {
+          // Add the complete AI message to the list (a reply finished
+          // while disconnected arrives as full_response only)
+          if (hadContent || data.full_response) {
             const aiMsg = this._createAiMessage(
               data.full_response || this.state.streamingText,
               data.message_id,
@@ -312,6 +342,12 @@ export class AiChat extends Component {
 
     this.eventSource.onerror = (event) => {
       console.error("SSE connection error:", event);
+      if (this._lastEventId && this._reconnectAttempts < this._maxReconnectAttempts) {
+        // The reply keeps generating server-side: resume from the last event
+        this._closeEventSource();
+        this._scheduleReconnect(true);
+        return;
+      }
       const hadContent = !!this.state.streamingText;
       const partialText = this.state.streamingText;
       this.closeStream();
@@ -336,16 +372,23 @@ export class AiChat extends Component {
    */
   closeStream() {
     this._clearReconnectTimer();
+    this._closeEventSource();
+    this.state.streaming = false;
+    this.state.streamingText = "";
+    this.state.streamingToolCalls = [];
+  }
+
+  _closeEventSource() {
     if (this.eventSource) {
       this.eventSource.close();
       this.eventSource = null;
     }
-    this.state.streaming = false;
-    this.state.streamingText = "";
-    this.state.streamingToolCalls = [];
   }
 
-  _scheduleReconnect() {
+  /**
+   * @param {boolean} [resume=false] - Resume the current reply (see startStream)
+   */
+  _scheduleReconnect(resume = false) {
     if (this._reconnectAttempts >= this._maxReconnectAttempts) {
       this.state.error = "無法連線至 AI 服務，請稍後再試或重新整理頁面。";
       this.state.connectionState = "error";
@@ -357,7 +400,7 @@ export class AiChat extends Component {
     this.state.connectionState = "reconnecting";
 
     this._reconnectTimer = setTimeout(() => {
-      this.startStream();
+      this.startStream(resume);
     }, delay);
   }
 
@@ -545,7 +588,7 @@ export class AiChat extends Component {
   }
 
   /**
-   * Handle file selection and upload via multipart form data.
+   * Handle file selection and upload it in resumable chunks.
    * @param {Event} ev - The change event from the file input
    */
   async handleFileUpload(ev) {
@@ -558,17 +601,7 @@ export class AiChat extends Component {
     this.state.error = null;
 
     try {
-      const formData = new FormData();
-      formData.append("channel_id", this.props.channelId);
-      formData.append("file", file);
-      formData.append("csrf_token", odoo.csrf_token || "");
-
-      const response = await fetch("/api/ai/chat/upload", {
-        method: "POST",
-        body: formData,
-      });
-
-      const result = await response.json();
+      const result = await aiService.uploadFile(this.props.channelId, file);
 
       if (result.success && result.data) {
         // Add the uploaded message to the list
@@ -10,6 +10,7 @@ export class CategoryFilter extends Component {
     static props = {
         selectedCategory: { type: String },
         onCategoryChange: { type: Function },
+        counts: { type: Object, optional: true },
     };
 
     /**
@@ -36,6 +37,22 @@ export class CategoryFilter extends Component {
         }
     }
 
+    /**
+     * Number of templates in a category ("all" sums every category)
+     * @param {string} category - Category key
+     * @returns {number|null} Null when no counts were provided
+     */
+    getCount(category) {
+        const counts = this.props.counts;
+        if (!counts) {
+            return null;
+        }
+        if (category === "all") {
+            return Object.values(counts).reduce((sum, count) => sum + count, 0);
+        }
+        return counts[category] || 0;
+    }
+
     /**
      * Check if a category is currently selected
      * @param {string} category - Category key to check
@@ -1,5 +1,5 @@
 /** @odoo-module **/
-import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
+import { Component, useState, onMounted } from "@odoo/owl";
 import { WoowCard } from "../../components/card/WoowCard";
 import { WoowIcon } from "../../components/icon/WoowIcon";
 import { WoowButton } from "../../components/button/WoowButton";
@@ -12,6 +12,7 @@ import { RollbackModal } from "../../components/modal/RollbackModal";
 import { EditDomainModal } from "../../components/modal/EditDomainModal";
 import { CreateProjectModal } from "../../components/modal/CreateProjectModal";
 import { cloudService } from "../../services/cloud_service";
+import { useWorkspaceBus, BUS_EVENTS } from "../../services/workspace_bus";
 import { supportService } from "../../services/support_service";
 import { router } from "../../core/router";
 
@@ -23,7 +24,7 @@ import { router } from "../../core/router";
  * - Service header with icon, name, and status
  * - Tab navigation (Overview, Configuration)
  * - Action buttons (Open Web UI, Rollback, Delete)
- * - Status polling for deploying/upgrading states
+ * - Live status updates pushed over the workspace bus channel
  *
  * Props:
  *   - workspaceId (number): Parent workspace ID
@@ -65,15 +66,22 @@ export class ServiceDetailPage extends Component {
             supportProjectLoading: false,
         });
         this.router = useState(router);
-        this.pollingInterval = null;
 
         onMounted(() => {
             this.loadService();
             this.loadSupportProject();
         });
 
-        onWillUnmount(() => {
-            this.stopPolling();
+        const onServiceEvent = (payload) => {
+            if (payload.id === this.props.serviceId) {
+                this.loadService();
+            }
+        };
+        useWorkspaceBus(() => this.props.workspaceId, {
+            [BUS_EVENTS.SERVICE_UPDATED]: onServiceEvent,
+            [BUS_EVENTS.SERVICE_DELETED]: onServiceEvent,
+        }, {
+            onReconnect: () => this.loadService(),
         });
     }
 
@@ -88,7 +96,6 @@ export class ServiceDetailPage extends Component {
 
         if (result.success) {
             this.state.service = result.data;
-            this.startPollingIfNeeded();
         } else {
             this.state.error = result.error || "Failed to load service";
         }
@@ -96,23 +103,6 @@ export class ServiceDetailPage extends Component {
         this.state.loading = false;
     }
 
-    startPollingIfNeeded() {
-        const pendingStates = ["deploying", "initializing", "upgrading", "deleting"];
-        if (this.state.service && pendingStates.includes(this.state.service.state)) {
-            this.stopPolling(); // Clear any existing interval
-            this.pollingInterval = setInterval(() => this.loadService(), 5000);
-        } else {
-            this.stopPolling();
-        }
-    }
-
-    stopPolling() {
-        if (this.pollingInterval) {
-            clearInterval(this.pollingInterval);
-            this.pollingInterval = null;
-        }
-    }
-
     get service() {
         return this.state.service;
     }
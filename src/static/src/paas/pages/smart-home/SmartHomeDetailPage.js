@@ -1,11 +1,12 @@
 /** @odoo-module **/
-import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
+import { Component, useState, onMounted } from "@odoo/owl";
 import { WoowCard } from "../../components/card/WoowCard";
 import { WoowIcon } from "../../components/icon/WoowIcon";
 import { WoowButton } from "../../components/button/WoowButton";
 import { StatusBadge } from "../../components/common/StatusBadge";
 import { workspaceService } from "../../services/workspace_service";
 import { getDomain } from "../../services/cloud_service";
+import { useWorkspaceBus, BUS_EVENTS } from "../../services/workspace_bus";
 import { router } from "../../core/router";
 
 /**
@@ -42,15 +43,26 @@ export class SmartHomeDetailPage extends Component {
             domain: "woowtech.io",
         });
         this.router = useState(router);
-        this.pollingInterval = null;
 
         onMounted(async () => {
             this.state.domain = await getDomain();
             this.loadSmartHome();
         });
 
-        onWillUnmount(() => {
-            this.stopPolling();
+        useWorkspaceBus(() => this.props.workspaceId, {
+            [BUS_EVENTS.SMART_HOME_UPDATED]: (payload) => {
+                if (payload.id === this.props.homeId) {
+                    this.state.home = payload;
+                }
+            },
+            [BUS_EVENTS.SMART_HOME_DELETED]: (payload) => {
+                if (payload.id === this.props.homeId && !this.state.deleting) {
+                    this.state.home = null;
+                    this.state.error = "This smart home has been deleted";
+                }
+            },
+        }, {
+            onReconnect: () => this.loadSmartHome(),
         });
     }
 
@@ -65,7 +77,6 @@ export class SmartHomeDetailPage extends Component {
 
         if (result.success) {
             this.state.home = result.data;
-            this.startPollingIfNeeded();
         } else {
             this.state.error = result.error || "Failed to load smart home";
         }
@@ -73,23 +84,6 @@ export class SmartHomeDetailPage extends Component {
         this.state.loading = false;
     }
 
-    startPollingIfNeeded() {
-        const pendingStates = ["provisioning", "deleting"];
-        if (this.state.home && pendingStates.includes(this.state.home.state)) {
-            this.stopPolling();
-            this.pollingInterval = setInterval(() => this.loadSmartHome(), 5000);
-        } else {
-            this.stopPolling();
-        }
-    }
-
-    stopPolling() {
-        if (this.pollingInterval) {
-            clearInterval(this.pollingInterval);
-            this.pollingInterval = null;
-        }
-    }
-
     get home() {
         return this.state.home;
     }
@@ -1,5 +1,5 @@
 /** @odoo-module **/
-import { Component, useState, onMounted, onWillUnmount, onWillStart } from "@odoo/owl";
+import { Component, useState, onMounted, onWillStart } from "@odoo/owl";
 import { WoowCard } from "../../components/card/WoowCard";
 import { WoowIcon } from "../../components/icon/WoowIcon";
 import { WoowButton } from "../../components/button/WoowButton";
@@ -8,6 +8,7 @@ import { SmartHomeCard } from "../../components/smart-home/SmartHomeCard";
 import { CreateSmartHomeModal } from "../../components/smart-home/CreateSmartHomeModal";
 import { workspaceService } from "../../services/workspace_service";
 import { cloudService, getDomain } from "../../services/cloud_service";
+import { useWorkspaceBus, BUS_EVENTS } from "../../services/workspace_bus";
 import { router } from "../../core/router";
 import { getRoleBadgeClass, formatDate } from "../../services/utils";
 
@@ -33,8 +34,6 @@ export class WorkspaceDetailPage extends Component {
             showCreateSmartHomeModal: false,
         });
         this.router = useState(router);
-        this.servicesPollingInterval = null;
-        this.smartHomesPollingInterval = null;
 
         onWillStart(async () => {
             this.state.domain = await getDomain();
@@ -44,9 +43,17 @@ export class WorkspaceDetailPage extends Component {
             this.loadData();
         });
 
-        onWillUnmount(() => {
-            this.stopServicesPolling();
-            this.stopSmartHomesPolling();
+        // State transitions are pushed by the server; no polling
+        useWorkspaceBus(() => this.props.workspaceId, {
+            [BUS_EVENTS.SERVICE_UPDATED]: (payload) => this.onServiceUpdated(payload),
+            [BUS_EVENTS.SERVICE_DELETED]: (payload) => this.onServiceDeleted(payload),
+            [BUS_EVENTS.SMART_HOME_UPDATED]: (payload) => this.onSmartHomeUpdated(payload),
+            [BUS_EVENTS.SMART_HOME_DELETED]: (payload) => this.onSmartHomeDeleted(payload),
+        }, {
+            onReconnect: () => {
+                this.fetchServices();
+                this.fetchSmartHomes();
+            },
         });
     }
 
@@ -58,26 +65,34 @@ export class WorkspaceDetailPage extends Component {
         this.state.servicesError = null;
         this.state.smartHomesError = null;
 
-        // Load workspace, services, and smart homes in parallel
-        const [workspaceResult, servicesResult, smartHomesResult] = await Promise.all([
-            workspaceService.getWorkspace(this.props.workspaceId),
-            this.fetchServices(),
-            this.fetchSmartHomes(),
-        ]);
-
-        if (workspaceResult.success) {
-            this.state.workspace = workspaceResult.data;
+        // Workspace, services, and smart homes in one round trip
+        const result = await workspaceService.getDashboard(this.props.workspaceId);
+
+        if (result.success) {
+            const { workspace, services, smart_homes } = result.data;
+            this.state.workspace = workspace;
+            // The token only describes the complete list
+            cloudService.seedServices(
+                this.props.workspaceId,
+                services.items,
+                services.next_cursor ? null : services.list_version
+            );
+            this.state.services = cloudService.services;
+            this.state.smartHomes = smart_homes.items;
+            if (services.next_cursor) {
+                // Larger workspaces: page in the rest of the list
+                this.fetchServices();
+            }
+            if (smart_homes.next_cursor) {
+                this.fetchSmartHomes();
+            }
         } else {
-            this.state.error = workspaceResult.error || "Failed to load workspace";
+            this.state.error = result.error || "Failed to load workspace";
         }
 
         this.state.loading = false;
         this.state.loadingServices = false;
         this.state.loadingSmartHomes = false;
-
-        // Start polling if there are pending services or smart homes
-        this.startServicesPolling();
-        this.startSmartHomesPolling();
     }
 
     async fetchServices() {
@@ -92,32 +107,18 @@ export class WorkspaceDetailPage extends Component {
         }
     }
 
-    startServicesPolling() {
-        const hasPending = this.state.services.some(s =>
-            ["deploying", "initializing", "upgrading", "deleting", "pending"].includes(s.state)
-        );
-
-        if (hasPending && !this.servicesPollingInterval) {
-            this.servicesPollingInterval = setInterval(async () => {
-                await this.fetchServices();
-                this.state.services = cloudService.services;
-
-                const stillPending = this.state.services.some(s =>
-                    ["deploying", "initializing", "upgrading", "deleting", "pending"].includes(s.state)
-                );
-
-                if (!stillPending) {
-                    this.stopServicesPolling();
-                }
-            }, 5000);
+    onServiceUpdated(payload) {
+        if (cloudService.applyServiceUpdate(payload)) {
+            this.state.services = cloudService.services;
+        } else {
+            // New service (e.g. created from another session)
+            this.fetchServices();
         }
     }
 
-    stopServicesPolling() {
-        if (this.servicesPollingInterval) {
-            clearInterval(this.servicesPollingInterval);
-            this.servicesPollingInterval = null;
-        }
+    onServiceDeleted(payload) {
+        cloudService.removeService(payload.id);
+        this.state.services = cloudService.services;
     }
 
     // Smart Home methods
@@ -138,31 +139,17 @@ export class WorkspaceDetailPage extends Component {
         }
     }
 
-    startSmartHomesPolling() {
-        const hasPending = this.state.smartHomes.some(h =>
-            ["provisioning", "deleting"].includes(h.state)
-        );
-
-        if (hasPending && !this.smartHomesPollingInterval) {
-            this.smartHomesPollingInterval = setInterval(async () => {
-                await this.fetchSmartHomes();
-
-                const stillPending = this.state.smartHomes.some(h =>
-                    ["provisioning", "deleting"].includes(h.state)
-                );
-
-                if (!stillPending) {
-                    this.stopSmartHomesPolling();
-                }
-            }, 5000);
+    onSmartHomeUpdated(payload) {
+        const index = this.state.smartHomes.findIndex(h => h.id === payload.id);
+        if (index === -1) {
+            this.state.smartHomes = [payload, ...this.state.smartHomes];
+        } else {
+            this.state.smartHomes[index] = payload;
         }
     }
 
-    stopSmartHomesPolling() {
-        if (this.smartHomesPollingInterval) {
-            clearInterval(this.smartHomesPollingInterval);
-            this.smartHomesPollingInterval = null;
-        }
+    onSmartHomeDeleted(payload) {
+        this.state.smartHomes = this.state.smartHomes.filter(h => h.id !== payload.id);
     }
 
     get hasSmartHomes() {
@@ -181,7 +168,6 @@ export class WorkspaceDetailPage extends Component {
         this.state.showCreateSmartHomeModal = false;
         // Refresh smart homes list
         await this.fetchSmartHomes();
-        this.startSmartHomesPolling();
     }
 
     goToSmartHome(homeId) {
@@ -2,6 +2,41 @@
 import { reactive } from "@odoo/owl";
 import { jsonRpc } from "./rpc";
 
+const CHUNKED_UPLOAD_URL = "/api/ai/chat/upload/chunked";
+const UPLOAD_MAX_RETRIES = 5;
+
+/**
+ * POST multipart form data to the chunked upload endpoint
+ * @param {Object} fields - Form fields
+ * @param {Blob} [chunk=null] - Chunk data
+ * @returns {Promise<Object>} Parsed JSON response
+ */
+async function postUploadForm(fields, chunk = null) {
+    const formData = new FormData();
+    for (const [key, value] of Object.entries(fields)) {
+        formData.append(key, value);
+    }
+    if (chunk) {
+        formData.append("chunk", chunk, "chunk");
+    }
+    formData.append("csrf_token", odoo.csrf_token || "");
+    const response = await fetch(CHUNKED_UPLOAD_URL, { method: "POST", body: formData });
+    return response.json();
+}
+
+/**
+ * SHA-256 hex digest of a chunk, or "" where WebCrypto is unavailable (non-HTTPS)
+ * @param {Blob} chunk
+ * @returns {Promise<string>}
+ */
+async function chunkChecksum(chunk) {
+    if (!window.crypto?.subtle) {
+        return "";
+    }
+    const digest = await window.crypto.subtle.digest("SHA-256", await chunk.arrayBuffer());
+    return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, "0")).join("");
+}
+
 /**
  * @typedef {Object} AssistantData
  * @property {number} id - Assistant ID
@@ -125,15 +160,37 @@ export const aiService = reactive({
         }
     },
 
+    /**
+     * Get a ticket for streaming the reply to the latest message of a channel.
+     * The stream endpoint does not use the session; the ticket is short-lived,
+     * so ask for a new one on every (re)connection.
+     * @param {number} channelId - discuss.channel ID
+     * @returns {Promise<{success: boolean, data?: {ticket: string, expires_in: number}, error?: string, error_code?: string}>}
+     */
+    async getStreamTicket(channelId) {
+        try {
+            const result = await jsonRpc("/api/ai/chat/stream-ticket", { channel_id: channelId });
+            if (result.success) {
+                return { success: true, data: result.data };
+            } else {
+                return { success: false, error: result.error, error_code: result.error_code };
+            }
+        } catch (err) {
+            return { success: false, error: err.message };
+        }
+    },
+
     /**
      * Get the SSE stream URL for a channel
      * The frontend should create an EventSource with this URL
      * @param {number} channelId - discuss.channel ID
+     * @param {string} ticket - Stream ticket from getStreamTicket()
+     * @param {string|null} [lastEventId=null] - Last received event id, to resume a reply
      * @returns {string} SSE endpoint URL
      */
-    getStreamUrl(channelId) {
-        const csrfToken = encodeURIComponent(odoo.csrf_token || '');
-        return `/api/ai/stream/${channelId}?csrf_token=${csrfToken}`;
+    getStreamUrl(channelId, ticket, lastEventId = null) {
+        const url = `/api/ai/stream/${channelId}?ticket=${encodeURIComponent(ticket)}`;
+        return lastEventId ? `${url}&last_event_id=${encodeURIComponent(lastEventId)}` : url;
     },
 
     /**
@@ -159,6 +216,84 @@ export const aiService = reactive({
         }
     },
 
+    /**
+     * Upload a file to a channel in resumable chunks.
+     * After a dropped connection the upload resumes from the offset the
+     * server has, so only the missing chunks are sent again.
+     * @param {number} channelId - discuss.channel ID
+     * @param {File} file - File to upload
+     * @param {Function} [onProgress=null] - Called with the uploaded fraction (0-1)
+     * @returns {Promise<{success: boolean, data?: Object, error?: string}>}
+     */
+    async uploadFile(channelId, file, onProgress = null) {
+        this.operationLoading.upload = true;
+        try {
+            const init = await postUploadForm({
+                action: "init",
+                channel_id: channelId,
+                file_name: file.name,
+                file_size: file.size,
+            });
+            if (!init.success) {
+                return { success: false, error: init.error };
+            }
+            const { upload_id: uploadId, chunk_size: chunkSize } = init.data;
+
+            let offset = 0;
+            let retries = 0;
+            let resync = false;
+            while (offset < file.size) {
+                try {
+                    if (resync) {
+                        // Ask the server how much it has before resending
+                        const status = await postUploadForm({ action: "status", upload_id: uploadId });
+                        if (!status.success) {
+                            return { success: false, error: status.error };
+                        }
+                        offset = status.data.received;
+                        resync = false;
+                        continue;
+                    }
+                    const chunk = file.slice(offset, offset + chunkSize);
+                    const result = await postUploadForm({
+                        action: "append",
+                        upload_id: uploadId,
+                        offset: offset,
+                        checksum: await chunkChecksum(chunk),
+                    }, chunk);
+                    if (result.success) {
+                        offset = result.data.received;
+                        retries = 0;
+                        if (onProgress) {
+                            onProgress(file.size ? offset / file.size : 1);
+                        }
+                    } else if (result.received !== undefined && ++retries <= UPLOAD_MAX_RETRIES) {
+                        // The server has a different offset: continue from there
+                        offset = result.received;
+                    } else {
+                        return { success: false, error: result.error };
+                    }
+                } catch (err) {
+                    if (++retries > UPLOAD_MAX_RETRIES) {
+                        return { success: false, error: err.message };
+                    }
+                    await new Promise((resolve) => setTimeout(resolve, 1000 * retries));
+                    resync = true;
+                }
+            }
+
+            const result = await postUploadForm({ action: "finalize", upload_id: uploadId });
+            if (result.success) {
+                return { success: true, data: result.data };
+            }
+            return { success: false, error: result.error };
+        } catch (err) {
+            return { success: false, error: err.message };
+        } finally {
+            this.operationLoading.upload = false;
+        }
+    },
+
     /**
      * Check if a specific operation is loading
      * @param {string} operation - Operation name
@@ -1,5 +1,6 @@
 /** @odoo-module **/
 import { reactive } from "@odoo/owl";
+import { fetchPages, PAGE_SIZE } from "./pagination";
 
 /** Default timeout for API requests (30 seconds) */
 const REQUEST_TIMEOUT_MS = 30000;
@@ -137,8 +138,12 @@ export async function getDomain() {
 export const cloudService = reactive({
     /** @type {TemplateData[]} */
     templates: [],
+    /** @type {Object.<string, number>} Template count per category */
+    templateFacets: {},
     /** @type {ServiceData[]} */
     services: [],
+    /** @type {{workspaceId: number|null, token: string|null}} */
+    servicesVersion: { workspaceId: null, token: null },
     /** @type {boolean} */
     loading: false,
     /** @type {Object.<string, boolean>} */
@@ -166,13 +171,26 @@ export const cloudService = reactive({
         this.loading = true;
         this.error = null;
         try {
-            const result = await jsonRpc("/api/cloud/templates", {
-                category: category || null,
-                search: search || null,
-            });
-            if (result.success) {
-                this.templates = result.data;
-            } else {
+            const result = await fetchPages(
+                "templates",
+                async (cursor) => {
+                    const page = await jsonRpc("/api/cloud/templates", {
+                        category: category || null,
+                        search: search || null,
+                        limit: PAGE_SIZE,
+                        cursor,
+                    });
+                    if (!cursor && page.success) {
+                        this.templateFacets = page.facets || {};
+                    }
+                    return page;
+                },
+                (items, first) => {
+                    this.templates = first ? items : [...this.templates, ...items];
+                    this.loading = false;
+                }
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch templates";
             }
         } catch (err) {
@@ -211,13 +229,33 @@ export const cloudService = reactive({
     async fetchServices(workspaceId) {
         this.operationLoading.fetchServices = true;
         this.error = null;
+        // Only reuse the token for the workspace the local list belongs to
+        const listVersion = this.servicesVersion.workspaceId === workspaceId
+            ? this.servicesVersion.token
+            : null;
         try {
-            const result = await jsonRpc(`/api/workspaces/${workspaceId}/services`, {
-                action: "list",
-            });
-            if (result.success) {
-                this.services = result.data;
-            } else {
+            // The version token covers the whole list: it is checked and
+            // taken from the first page (a change while paging yields a newer token)
+            let token = null;
+            const result = await fetchPages(
+                "services",
+                async (cursor) => {
+                    const page = await jsonRpc(`/api/workspaces/${workspaceId}/services`, {
+                        action: "list",
+                        list_version: cursor ? null : listVersion,
+                        limit: PAGE_SIZE,
+                        cursor,
+                    });
+                    token = cursor ? token : page.list_version;
+                    return page;
+                },
+                (items, first) => {
+                    this.services = first ? items : [...this.services, ...items];
+                }
+            );
+            if (result.success && !result.superseded) {
+                this.servicesVersion = { workspaceId, token };
+            } else if (!result.success) {
                 this.error = result.error || "Failed to fetch services";
             }
         } catch (err) {
@@ -227,6 +265,42 @@ export const cloudService = reactive({
         }
     },
 
+    /**
+     * Replace the local list with services loaded by another call (e.g. the
+     * workspace dashboard)
+     * @param {number} workspaceId - Workspace the services belong to
+     * @param {Object[]} services - Service items
+     * @param {string|null} token - List version token, null if the list is partial
+     */
+    seedServices(workspaceId, services, token) {
+        this.services = services;
+        this.error = null;
+        this.servicesVersion = { workspaceId, token };
+    },
+
+    /**
+     * Merge a bus-pushed service update into the local list
+     * @param {Object} payload - Partial service data (id, state, error_message, ...)
+     * @returns {boolean} False if the service is not in the local list yet
+     */
+    applyServiceUpdate(payload) {
+        const index = this.services.findIndex(s => s.id === payload.id);
+        if (index === -1) {
+            return false;
+        }
+        const { workspace_id, ...fields } = payload;
+        this.services[index] = { ...this.services[index], ...fields };
+        return true;
+    },
+
+    /**
+     * Drop a bus-pushed deleted service from the local list
+     * @param {number} serviceId - Service ID
+     */
+    removeService(serviceId) {
+        this.services = this.services.filter(s => s.id !== serviceId);
+    },
+
     /**
      * Create a new service
      * @param {number} workspaceId - Workspace ID
@@ -366,6 +440,31 @@ export const cloudService = reactive({
         }
     },
 
+    /**
+     * Fetch CPU/memory usage percentiles of a service
+     * @param {number} workspaceId - Workspace ID
+     * @param {number} serviceId - Service ID
+     * @param {"24h"|"7d"|"30d"|"90d"} [period="7d"] - Lookback period
+     * @returns {Promise<{success: boolean, data?: Object, error?: string}>}
+     */
+    async fetchServiceUsage(workspaceId, serviceId, period = "7d") {
+        this.operationLoading.fetchServiceUsage = true;
+        try {
+            const result = await jsonRpc(`/api/workspaces/${workspaceId}/services/${serviceId}/usage`, {
+                period,
+            });
+            if (result.success) {
+                return { success: true, data: result.data };
+            } else {
+                return { success: false, error: result.error };
+            }
+        } catch (err) {
+            return { success: false, error: err.message };
+        } finally {
+            this.operationLoading.fetchServiceUsage = false;
+        }
+    },
+
     /**
      * Rollback a service to a previous revision
      * @param {number} workspaceId - Workspace ID
@@ -398,6 +497,41 @@ export const cloudService = reactive({
         }
     },
 
+    /**
+     * Run a batch operation on many services in one request
+     * @param {number} workspaceId - Workspace ID
+     * @param {string} action - 'batch_create', 'batch_upgrade', 'batch_delete' or 'batch_rollback'
+     * @param {Array<Object|number>} items - Batch items (create payloads or service IDs / {service_id, ...})
+     * @param {Object} [options] - Shared defaults, e.g. {version, values} for batch_upgrade
+     * @returns {Promise<{success: boolean, data?: Array<Object>, succeeded?: number, failed?: number, error?: string}>}
+     */
+    async batchServices(workspaceId, action, items, options = {}) {
+        this.operationLoading.batchServices = true;
+        try {
+            const result = await jsonRpc(`/api/workspaces/${workspaceId}/services`, {
+                action,
+                items,
+                ...options,
+            });
+            if (result.success) {
+                // Per-item results carry their own status; refresh the list once
+                await this.fetchServices(workspaceId);
+                return {
+                    success: true,
+                    data: result.data,
+                    succeeded: result.succeeded,
+                    failed: result.failed,
+                };
+            } else {
+                return { success: false, error: result.error, data: result.data };
+            }
+        } catch (err) {
+            return { success: false, error: err.message };
+        } finally {
+            this.operationLoading.batchServices = false;
+        }
+    },
+
     /**
      * Check if a specific operation is loading
      * @param {string} operation - Operation name
@@ -0,0 +1,44 @@
+/** @odoo-module **/
+
+/**
+ * Keyset-paginated list endpoints
+ *
+ * List endpoints return at most `limit` items plus an opaque `next_cursor`
+ * (null on the last page); the cursor is sent back as `cursor` to get the
+ * following page.
+ */
+export const PAGE_SIZE = 100;
+
+// Latest run per list key, so a newer fetch of the same list wins
+const latestRuns = new Map();
+
+/**
+ * Fetch every page of a list, handing each page over as it arrives
+ * so components can render the first items without waiting for the rest.
+ * @param {string} key - List identity; starting a new run for the same key stops older runs
+ * @param {(cursor: string|null) => Promise<Object>} fetchPage - Requests one page
+ * @param {(items: Array, first: boolean) => void} onPage - Receives each page's items
+ * @returns {Promise<Object>} Last page result, the first failed or `not_modified` result,
+ *     or `{superseded: true}` when a newer run took over
+ */
+export async function fetchPages(key, fetchPage, onPage) {
+    const run = Symbol(key);
+    latestRuns.set(key, run);
+    let cursor = null;
+    for (let first = true; ; first = false) {
+        const result = await fetchPage(cursor);
+        if (latestRuns.get(key) !== run) {
+            return { success: true, superseded: true };
+        }
+        if (!result.success || result.not_modified) {
+            latestRuns.delete(key);
+            return result;
+        }
+        onPage(result.data, first);
+        if (!result.next_cursor) {
+            latestRuns.delete(key);
+            return result;
+        }
+        cursor = result.next_cursor;
+    }
+}
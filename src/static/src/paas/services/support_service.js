@@ -1,5 +1,6 @@
 /** @odoo-module **/
 import { reactive } from "@odoo/owl";
+import { fetchPages, PAGE_SIZE } from "./pagination";
 import { jsonRpc } from "./rpc";
 
 /**
@@ -99,12 +100,18 @@ export const supportService = reactive({
         this.loading = true;
         this.error = null;
         try {
-            const result = await jsonRpc("/api/support/projects", {
-                action: "list",
-            });
-            if (result.success) {
-                this.projects = result.data;
-            } else {
+            const result = await fetchPages(
+                "projects",
+                (cursor) => jsonRpc("/api/support/projects", {
+                    action: "list",
+                    limit: PAGE_SIZE,
+                    cursor,
+                }),
+                (items, first) => {
+                    this.projects = first ? items : [...this.projects, ...items];
+                }
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch projects";
             }
         } catch (err) {
@@ -125,12 +132,18 @@ export const supportService = reactive({
         this.loading = true;
         this.error = null;
         try {
-            const result = await jsonRpc(`/api/support/projects/${workspaceId}`, {
-                action: "list",
-            });
-            if (result.success) {
-                this.projects = result.data;
-            } else {
+            const result = await fetchPages(
+                "projects",
+                (cursor) => jsonRpc(`/api/support/projects/${workspaceId}`, {
+                    action: "list",
+                    limit: PAGE_SIZE,
+                    cursor,
+                }),
+                (items, first) => {
+                    this.projects = first ? items : [...this.projects, ...items];
+                }
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch projects";
             }
         } catch (err) {
@@ -158,15 +171,15 @@ export const supportService = reactive({
                 action: "list",
                 ...filters,
             };
-            const result = await jsonRpc("/api/support/tasks", params);
-            if (result.success) {
-                this.tasks = result.data.tasks || result.data;
-                if (result.data.stats) {
-                    this.stats = result.data.stats;
-                } else {
+            const result = await fetchPages(
+                "tasks",
+                (cursor) => jsonRpc("/api/support/tasks", { ...params, limit: PAGE_SIZE, cursor }),
+                (items, first) => {
+                    this.tasks = first ? items : [...this.tasks, ...items];
                     this._computeStats();
                 }
-            } else {
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch tasks";
             }
         } catch (err) {
@@ -195,16 +208,15 @@ export const supportService = reactive({
                 action: "list",
                 ...filters,
             };
-            const result = await jsonRpc(`/api/support/tasks/${workspaceId}`, params);
-            if (result.success) {
-                this.tasks = result.data.tasks || result.data;
-                // Update stats if provided
-                if (result.data.stats) {
-                    this.stats = result.data.stats;
-                } else {
+            const result = await fetchPages(
+                "tasks",
+                (cursor) => jsonRpc(`/api/support/tasks/${workspaceId}`, { ...params, limit: PAGE_SIZE, cursor }),
+                (items, first) => {
+                    this.tasks = first ? items : [...this.tasks, ...items];
                     this._computeStats();
                 }
-            } else {
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch tasks";
             }
         } catch (err) {
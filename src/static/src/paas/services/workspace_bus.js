@@ -0,0 +1,78 @@
+/** @odoo-module **/
+import { useEffect } from "@odoo/owl";
+import { useService } from "@web/core/utils/hooks";
+
+/**
+ * Workspace bus channel
+ *
+ * Service and smart home state transitions are published server-side on a
+ * per-workspace bus channel (see models/ir_websocket.py), so pages listen
+ * for pushes instead of polling.
+ */
+export const WORKSPACE_CHANNEL_PREFIX = "woow_paas_platform.workspace_";
+
+export const BUS_EVENTS = {
+    SERVICE_UPDATED: "woow_paas_platform/service_updated",
+    SERVICE_DELETED: "woow_paas_platform/service_deleted",
+    SMART_HOME_UPDATED: "woow_paas_platform/smart_home_updated",
+    SMART_HOME_DELETED: "woow_paas_platform/smart_home_deleted",
+};
+
+// Several mounted pages may share a workspace channel
+const channelRefs = new Map();
+
+/**
+ * Subscribe the component to its workspace bus channel while mounted
+ * @param {() => number} getWorkspaceId - Returns the current workspace ID
+ * @param {Object<string, Function>} handlers - Notification type → callback(payload)
+ * @param {Object} [options]
+ * @param {Function} [options.onReconnect] - Called after the websocket reconnects (missed pushes)
+ */
+export function useWorkspaceBus(getWorkspaceId, handlers, { onReconnect } = {}) {
+    const busService = useService("bus_service");
+
+    useEffect(
+        (workspaceId) => {
+            if (!workspaceId) {
+                return;
+            }
+            const channel = `${WORKSPACE_CHANNEL_PREFIX}${workspaceId}`;
+            const refs = channelRefs.get(channel) || 0;
+            if (!refs) {
+                busService.addChannel(channel);
+            }
+            channelRefs.set(channel, refs + 1);
+
+            // Notification types are global; keep only this workspace's pushes
+            const subscriptions = Object.entries(handlers).map(([type, callback]) => {
+                const wrapped = (payload) => {
+                    if (payload?.workspace_id === workspaceId) {
+                        callback(payload);
+                    }
+                };
+                busService.subscribe(type, wrapped);
+                return [type, wrapped];
+            });
+            if (onReconnect) {
+                busService.addEventListener("reconnect", onReconnect);
+            }
+
+            return () => {
+                for (const [type, wrapped] of subscriptions) {
+                    busService.unsubscribe(type, wrapped);
+                }
+                if (onReconnect) {
+                    busService.removeEventListener("reconnect", onReconnect);
+                }
+                const remaining = (channelRefs.get(channel) || 1) - 1;
+                if (remaining) {
+                    channelRefs.set(channel, remaining);
+                } else {
+                    channelRefs.delete(channel);
+                    busService.deleteChannel(channel);
+                }
+            };
+        },
+        () => [getWorkspaceId()]
+    );
+}
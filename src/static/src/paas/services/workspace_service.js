@@ -1,5 +1,6 @@
 /** @odoo-module **/
 import { reactive } from "@odoo/owl";
+import { fetchPages, PAGE_SIZE } from "./pagination";
 
 /**
  * JSON-RPC helper for Odoo API calls
@@ -104,17 +105,23 @@ export const workspaceService = reactive({
     error: null,
 
     /**
-     * Fetch all workspaces for current user
+     * Fetch all workspaces for current user (page by page; the list
+     * renders as soon as the first page arrives)
      * @returns {Promise<void>}
      */
     async fetchWorkspaces() {
         this.loading = true;
         this.error = null;
         try {
-            const result = await jsonRpc("/api/workspaces", { action: "list" });
-            if (result.success) {
-                this.workspaces = result.data;
-            } else {
+            const result = await fetchPages(
+                "workspaces",
+                (cursor) => jsonRpc("/api/workspaces", { action: "list", limit: PAGE_SIZE, cursor }),
+                (items, first) => {
+                    this.workspaces = first ? items : [...this.workspaces, ...items];
+                    this.loading = false;
+                }
+            );
+            if (!result.success) {
                 this.error = result.error || "Failed to fetch workspaces";
             }
         } catch (err) {
@@ -184,6 +191,28 @@ export const workspaceService = reactive({
         }
     },
 
+    /**
+     * Get the aggregated dashboard of a workspace in one call: workspace
+     * details, first page of services, smart homes and support stats
+     * @param {number} workspaceId - Target workspace ID
+     * @returns {Promise<ApiResponse<Object>>}
+     */
+    async getDashboard(workspaceId) {
+        this.operationLoading.get = true;
+        try {
+            const result = await jsonRpc(`/api/workspaces/${workspaceId}/dashboard`, {});
+            if (result.success) {
+                return { success: true, data: result.data };
+            } else {
+                return { success: false, error: result.error };
+            }
+        } catch (err) {
+            return { success: false, error: err.message };
+        } finally {
+            this.operationLoading.get = false;
+        }
+    },
+
     /**
      * Update a workspace
      * @param {number} workspaceId - Target workspace ID
@@ -249,11 +278,20 @@ export const workspaceService = reactive({
     async getMembers(workspaceId) {
         this.operationLoading.getMembers = true;
         try {
-            const result = await jsonRpc(`/api/workspaces/${workspaceId}/members`, {
-                action: "list",
-            });
+            let members = [];
+            const result = await fetchPages(
+                `members:${workspaceId}`,
+                (cursor) => jsonRpc(`/api/workspaces/${workspaceId}/members`, {
+                    action: "list",
+                    limit: PAGE_SIZE,
+                    cursor,
+                }),
+                (items) => {
+                    members = [...members, ...items];
+                }
+            );
             if (result.success) {
-                return { success: true, data: result.data };
+                return { success: true, data: members };
             } else {
                 return { success: false, error: result.error };
             }
@@ -1,6 +1,7 @@
 # Test suite for woow_paas_platform
 from . import test_cloud_app_template
 from . import test_cloud_service
+from . import test_service_usage_series
 from . import test_cloud_api
 from . import test_paas_operator
 from . import test_smart_home
@@ -1,6 +1,8 @@
 """Tests for AI assistant integration with ai_base_gt."""
 from unittest.mock import patch, MagicMock
 
+from markupsafe import Markup
+
 from odoo.tests.common import TransactionCase
 
 
@@ -90,6 +92,335 @@ class TestAIAssistantIntegration(TransactionCase):
         )
         self.assertEqual(int(param), self.ai_assistant.id)
 
+    def test_llm_client_cached_per_config(self):
+        """Clients are reused for identical settings and rebuilt on change."""
+        from ..models.ai_client import AIClient
+
+        first = AIClient.from_assistant(self.ai_assistant)
+        self.assertIs(AIClient.from_assistant(self.ai_assistant).llm, first.llm)
+
+        self.ai_config.write({'temperature': 0.2})
+        self.assertIsNot(AIClient.from_assistant(self.ai_assistant).llm, first.llm)
+
+    def test_agent_graph_cached_per_tool_set(self):
+        """Compiled graphs are shared for the same model and tools."""
+        from ..models.ai_client import AIClient
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        tool_a, tool_b = MagicMock(metadata={'mcp_fingerprint': 'a'}), MagicMock(metadata={'mcp_fingerprint': 'b'})
+        tool_a.name, tool_b.name = 's1_a', 's1_b'
+        with patch.object(AIClient, '_compile_agent_graph', side_effect=lambda tools: object()) as compile_graph:
+            graph = client._build_agent_graph([tool_a, tool_b])
+            self.assertIs(client._build_agent_graph([tool_b, tool_a]), graph)
+            self.assertIsNot(client._build_agent_graph([tool_a]), graph)
+        self.assertEqual(compile_graph.call_count, 2)
+
+    def test_scheduler_serves_interactive_before_background(self):
+        """Queued calls go by priority; a full queue or long wait fails fast."""
+        import threading
+        import time
+
+        from ..services import llm_scheduler
+
+        queue = llm_scheduler._Queue()
+        release = threading.Event()
+        served = []
+
+        def waiter(name, priority):
+            def take():
+                served.append(name)
+                if name == 'head':
+                    release.wait(5)
+                return 0
+            return threading.Thread(target=queue.acquire, args=(take, priority, 10))
+
+        threads = [
+            waiter('head', llm_scheduler.PRIORITY_BACKGROUND),
+            waiter('background', llm_scheduler.PRIORITY_BACKGROUND),
+            waiter('interactive', llm_scheduler.PRIORITY_INTERACTIVE),
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(served, ['head', 'interactive', 'background'])
+
+        with self.assertRaises(llm_scheduler.SchedulerBusy):
+            queue.acquire(lambda: 0, llm_scheduler.PRIORITY_INTERACTIVE, 1, max_queue=0)
+        with self.assertRaises(llm_scheduler.SchedulerBusy):
+            queue.acquire(lambda: 120, llm_scheduler.PRIORITY_INTERACTIVE, 1)
+
+    def test_rate_limited_call_is_retried_after_reset(self):
+        """A 429 is retried after the delay announced by the provider headers."""
+        from ..models.ai_client import AIClient
+        from ..services import llm_scheduler
+
+        class RateLimitError(Exception):
+            status_code = 429
+            code = 'rate_limit_exceeded'
+
+            def __init__(self, headers):
+                super().__init__('Too Many Requests')
+                self.response = MagicMock(headers=headers)
+
+        self.assertEqual(llm_scheduler.retry_delay(RateLimitError({'retry-after-ms': '800'}), 0), 0.8)
+        self.assertEqual(llm_scheduler.retry_delay(RateLimitError({
+            'x-ratelimit-reset-requests': '1.5s',
+            'x-ratelimit-reset-tokens': '250ms',
+        }), 0), 1.5)
+        self.assertEqual(llm_scheduler.retry_delay(RateLimitError({}), 2), 4.0)
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        client.llm = MagicMock()
+        client.llm.invoke.side_effect = [RateLimitError({'retry-after': '2'}), MagicMock(content='ok')]
+        with patch('odoo.addons.woow_paas_platform.models.ai_client.time.sleep') as sleep:
+            self.assertEqual(client.chat_completion([]), 'ok')
+        sleep.assert_called_once_with(2.0)
+
+        # After failing over, a 429 of the fallback waits locally and leaves
+        # the primary's shared bucket alone
+        client.rate_limit = llm_scheduler.RateLimit(self.env.cr.dbname, 1, 60, 0)
+        client.llm.invoke.side_effect = ConnectionError('refused')
+        client.fallback_llms = [MagicMock()]
+        client.fallback_llms[0].invoke.side_effect = [RateLimitError({'retry-after': '3'}), MagicMock(content='backup')]
+        with patch.object(llm_scheduler, 'acquire') as acquire, \
+                patch.object(llm_scheduler, 'block') as block, \
+                patch('odoo.addons.woow_paas_platform.models.ai_client.time.sleep') as sleep:
+            self.assertEqual(client.chat_completion([]), 'backup')
+        acquire.assert_called_once()
+        block.assert_not_called()
+        sleep.assert_called_once_with(3.0)
+
+    def test_stream_hedges_slow_endpoint_and_fails_over(self):
+        """A stream without a first token races the next endpoint; errors fail over."""
+        import asyncio
+        import time
+        from types import SimpleNamespace
+
+        from ..models.ai_client import AIClient
+
+        class FakeLLM:
+            def __init__(self, text, delay=0.0, error=None):
+                self.text, self.delay, self.error = text, delay, error
+                self.cancelled = False
+
+            async def astream(self, messages):
+                try:
+                    await asyncio.sleep(self.delay)
+                    if self.error:
+                        raise self.error
+                    for word in self.text.split():
+                        yield SimpleNamespace(content=word)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        slow, fast = FakeLLM('slow reply', delay=5), FakeLLM('fast reply')
+        client.llm, client.fallback_llms, client.hedge_delay = slow, [fast], 0.05
+        started = time.monotonic()
+        self.assertEqual(list(client.chat_completion_stream([])), ['fast', 'reply'])
+        self.assertLess(time.monotonic() - started, 2)
+        for _i in range(20):
+            if slow.cancelled:
+                break
+            time.sleep(0.05)
+        self.assertTrue(slow.cancelled)
+
+        # Connection errors fail over at once, even without hedging
+        client.llm = FakeLLM('', error=ConnectionError('refused'))
+        client.fallback_llms, client.hedge_delay = [FakeLLM('backup reply')], 0
+        self.assertEqual(list(client.chat_completion_stream([])), ['backup', 'reply'])
+
+    def test_response_cache_exact_match(self):
+        """Cached answers are reused for the same normalized question and context."""
+        from types import SimpleNamespace
+
+        from ..models.ai_client import AIClient
+
+        Cache = self.env['woow_paas_platform.ai_response_cache']
+        client = AIClient.from_assistant(self.ai_assistant)
+        question = 'How do I reset my n8n password?'
+        self.assertIsNone(Cache._make_probe(self.ai_assistant, client, 'ctx', question))
+
+        self.ai_assistant.response_cache_enabled = True
+        probe = Cache._make_probe(self.ai_assistant, client, 'ctx', question)
+        self.assertIsNone(Cache._find_answer(probe))
+        Cache._store_answer(probe, 'Open Settings > Users.')
+
+        variant = Cache._make_probe(self.ai_assistant, client, 'ctx', '  how do I reset my N8N password ')
+        self.assertEqual(Cache._find_answer(variant), 'Open Settings > Users.')
+        entry = Cache.search([('key', '=', probe['key'])])
+        self.assertEqual(entry.hit_count, 1)
+        # The same question within another conversation misses
+        in_conversation = Cache._make_probe(
+            self.ai_assistant, client, 'ctx', question,
+            history=[SimpleNamespace(type='human', content='I use the second option')],
+        )
+        self.assertIsNone(Cache._find_answer(in_conversation))
+        # A changed system prompt (e.g. cloud service context) misses
+        other_context = Cache._make_probe(self.ai_assistant, client, 'ctx v2', question)
+        self.assertIsNone(Cache._find_answer(other_context))
+        # Short, conversation-dependent replies are never cached
+        self.assertIsNone(Cache._make_probe(self.ai_assistant, client, 'ctx', 'yes please'))
+
+    def test_response_cache_near_duplicate(self):
+        """Near-duplicate questions reuse an answer above the similarity threshold."""
+        import numpy as np
+
+        from ..models.ai_client import AIClient
+
+        Cache = self.env['woow_paas_platform.ai_response_cache']
+        vectors = {
+            'why is my service stuck deploying': np.array([1.0, 0.0], dtype=np.float32),
+            'why is my service stuck in deploying': np.array([0.99, 0.141], dtype=np.float32),
+            'how do i delete my service forever': np.array([0.0, 1.0], dtype=np.float32),
+        }
+        self.ai_assistant.write({'response_cache_enabled': True, 'response_cache_similarity': 0.9})
+        client = AIClient.from_assistant(self.ai_assistant)
+        with patch.object(type(Cache), '_embed', autospec=True, side_effect=lambda self, text: vectors[text]):
+            Cache._store_answer(
+                Cache._make_probe(self.ai_assistant, client, 'ctx', 'Why is my service stuck deploying?'),
+                'Check the pod events.',
+            )
+            similar = Cache._make_probe(self.ai_assistant, client, 'ctx', 'Why is my service stuck in deploying')
+            unrelated = Cache._make_probe(self.ai_assistant, client, 'ctx', 'How do I delete my service forever?')
+            self.assertEqual(Cache._find_answer(similar), 'Check the pod events.')
+            self.assertIsNone(Cache._find_answer(unrelated))
+
+    def test_worker_loop_is_reused(self):
+        """Coroutines from separate calls share the worker event loop."""
+        import asyncio
+
+        from ..services import async_loop
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = async_loop.run(current_loop())
+        self.assertIs(async_loop.run(current_loop()), first)
+        self.assertFalse(first.is_closed())
+
+        async def numbers():
+            for i in range(3):
+                yield i
+        self.assertEqual(list(async_loop.iterate(numbers())), [0, 1, 2])
+
+    def test_generation_buffer_resumes_after_disconnect(self):
+        """A reconnect replays missed events and joins the running generation."""
+        import threading
+
+        from ..services import generation_buffer
+
+        release = threading.Event()
+
+        def produce(generation):
+            generation.publish({'chunk': 'a', 'done': False})
+            generation.publish({'chunk': 'b', 'done': False})
+            release.wait(5)
+            generation.publish({'chunk': '', 'done': True, 'full_response': 'abc'}, final=True)
+
+        key = (self.env.cr.dbname, 0, self.ai_assistant.id)
+        generation = generation_buffer.start_generation(key, produce)
+        # Started once per (db, channel, user message)
+        self.assertIs(generation_buffer.start_generation(key, produce), generation)
+
+        # The first reader saw event 1, then lost its connection
+        event_id = f'{generation.id}:1'
+        gen_id, after_seq = generation_buffer.parse_event_id(event_id)
+        resumed = generation_buffer.get_generation(gen_id).follow(after_seq)
+        self.assertEqual(next(resumed), (2, {'chunk': 'b', 'done': False}))
+        release.set()
+        self.assertEqual([seq for seq, payload in resumed if payload], [3])
+
+    def test_stream_ticket_is_signed_and_expires(self):
+        """Stream tickets reject tampering and expire."""
+        import time
+
+        from ..services import stream_ticket
+
+        ticket = stream_ticket.make_ticket(self.env, 7, 42)
+        payload = stream_ticket.verify_ticket(self.env, ticket)
+        self.assertEqual(
+            (payload['uid'], payload['channel_id'], payload['message_id']),
+            (self.env.uid, 7, 42),
+        )
+
+        other = stream_ticket.make_ticket(self.env, 8, 42)
+        forged = f"{other.partition('.')[0]}.{ticket.partition('.')[2]}"
+        for bad in ('', 'garbage', forged):
+            with self.assertRaises(stream_ticket.InvalidTicket):
+                stream_ticket.verify_ticket(self.env, bad)
+
+        later = time.time() + stream_ticket.STREAM_TICKET_TTL + 1
+        with patch.object(stream_ticket.time, 'time', return_value=later):
+            with self.assertRaises(stream_ticket.InvalidTicket):
+                stream_ticket.verify_ticket(self.env, ticket)
+
+    def test_agent_events_stream_incrementally(self):
+        """Agent events reach the caller before the agent run finishes."""
+        import asyncio
+        import threading
+
+        from ..models.ai_client import AIClient
+
+        received_first = threading.Event()
+
+        async def fake_stream(messages, tools):
+            yield {'type': 'tool_call', 'tool': 'svc_list', 'args': {}}
+            # Only continues once the caller has consumed the first event
+            self.assertTrue(await asyncio.to_thread(received_first.wait, 5))
+            yield {'type': 'text_chunk', 'content': 'done'}
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        events = []
+        with patch.object(client, '_async_agent_stream', side_effect=fake_stream):
+            for event in client.stream_agent_events([], []):
+                events.append(event)
+                received_first.set()
+
+        self.assertEqual([e['type'] for e in events], ['tool_call', 'text_chunk'])
+
+    def test_agent_stream_falls_back_before_text(self):
+        """A failing agent falls back to plain streaming if no text was sent."""
+        from ..models.ai_client import AIClient
+
+        async def failing_stream(messages, tools):
+            yield {'type': 'tool_call', 'tool': 'svc_list', 'args': {}}
+            raise ConnectionError('MCP server unreachable')
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        with patch.object(client, '_async_agent_stream', side_effect=failing_stream), \
+                patch.object(client, 'chat_completion_stream', return_value=iter(['plain'])):
+            events = list(client.stream_agent_events([], []))
+
+        self.assertEqual(events[-1], {'type': 'text_chunk', 'content': 'plain'})
+
+    def test_agent_stream_forwards_token_deltas(self):
+        """Model tokens are streamed as chunks and not repeated from updates."""
+        from langchain_core.messages import AIMessage, AIMessageChunk
+
+        from ..models.ai_client import AIClient
+
+        async def astream(*args, **kwargs):
+            node = {'langgraph_node': 'call_model'}
+            yield 'messages', (AIMessageChunk(content='Hel', id='run-1'), node)
+            yield 'messages', (AIMessageChunk(content='lo', id='run-1'), node)
+            yield 'updates', {'call_model': {'messages': [AIMessage(content='Hello', id='run-1')]}}
+        graph = MagicMock()
+        graph.astream = astream
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        with patch.object(client, '_build_agent_graph', return_value=graph):
+            events = list(client.stream_agent_events([], [MagicMock()]))
+
+        self.assertEqual(
+            [e['content'] for e in events if e['type'] == 'text_chunk'],
+            ['Hel', 'lo'],
+        )
+
 
 class TestDiscussChannelAI(TransactionCase):
     """Test discuss.channel AI reply integration."""
@@ -200,12 +531,219 @@ class TestDiscussChannelAI(TransactionCase):
         self.assertEqual(history[1]['role'], 'assistant')
         self.assertEqual(history[1]['content'], 'AI response')
 
+    def test_message_stores_plain_body_and_role(self):
+        """Channel messages should store their plain text and AI flag at post time."""
+        channel = self.env['discuss.channel'].create({
+            'name': 'Plain Body Channel',
+            'channel_type': 'channel',
+        })
+        user_msg = channel.message_post(
+            body=Markup('<p>Hello <span>there</span></p>'),
+            message_type='comment',
+            subtype_xmlid='mail.mt_comment',
+            author_id=self.env.user.partner_id.id,
+        )
+        # AI replies are posted as escaped Markdown
+        ai_msg = channel.with_context(skip_ai_reply=True).message_post(
+            body='if a < b: **yes**',
+            message_type='comment',
+            subtype_xmlid='mail.mt_comment',
+            author_id=self.ai_assistant.partner_id.id,
+        )
+
+        self.assertFalse(user_msg.is_ai)
+        self.assertEqual(user_msg.plain_body, 'Hello there')
+        self.assertTrue(ai_msg.is_ai)
+        self.assertEqual(ai_msg.plain_body, 'if a < b: **yes**')
+
+        history = channel._get_chat_history(limit=10)
+        self.assertEqual(history[-1]['role'], 'assistant')
+        self.assertEqual(history[-1]['content'], 'if a < b: **yes**')
+
+    def test_chat_history_serializer_query_count_is_flat(self):
+        """Serializing history costs the same queries however many messages carry files."""
+        channel = self.env['discuss.channel'].create({
+            'name': 'Serializer Channel',
+            'channel_type': 'channel',
+        })
+        domain = [('model', '=', 'discuss.channel'), ('res_id', '=', channel.id)]
+        Message = self.env['mail.message'].sudo()
+
+        def post_with_file(index):
+            attachment = self.env['ir.attachment'].create({
+                'name': f'file{index}.txt',
+                'raw': b'x' * (index + 1),
+                'res_model': 'discuss.channel',
+                'res_id': channel.id,
+            })
+            channel.message_post(
+                body=f'File {index}',
+                message_type='comment',
+                subtype_xmlid='mail.mt_comment',
+                author_id=self.env.user.partner_id.id,
+                attachment_ids=attachment.ids,
+            )
+
+        def count_queries():
+            self.env.invalidate_all()
+            before = self.env.cr.sql_log_count
+            data = Message._read_chat_history(domain, limit=50)
+            return self.env.cr.sql_log_count - before, data
+
+        post_with_file(0)
+        few_queries, data = count_queries()
+        for index in range(1, 6):
+            post_with_file(index)
+        many_queries, data = count_queries()
+
+        self.assertEqual(many_queries, few_queries)
+        self.assertEqual(len(data), 6)
+        self.assertIn('File 0', data[0]['body'])
+        self.assertEqual(data[0]['author_name'], self.env.user.partner_id.name)
+        self.assertEqual(data[-1]['attachments'][0]['name'], 'file5.txt')
+        self.assertEqual(data[-1]['attachments'][0]['file_size'], 6)
+
+    def test_chunked_upload_resumes_and_finalizes(self):
+        """Chunks append at the received offset and finalize into an attachment."""
+        import hashlib
+        import io
+        import os
+
+        from ..models.chat_upload import ChatUploadError
+
+        channel = self.env['discuss.channel'].create({
+            'name': 'Upload Channel',
+            'channel_type': 'channel',
+        })
+        data = b'0123456789' * 1000
+        upload = self.env['woow_paas_platform.chat_upload'].create({
+            'channel_id': channel.id,
+            'file_name': 'notes.txt',
+            'file_size': len(data),
+        })
+        self.assertEqual(upload._append_chunk(0, io.BytesIO(data[:4000])), 4000)
+
+        # A retried chunk after a dropped response reports where to resume
+        with self.assertRaises(ChatUploadError) as ctx:
+            upload._append_chunk(0, io.BytesIO(data[:4000]))
+        self.assertEqual((ctx.exception.status, ctx.exception.received), (409, 4000))
+        # A corrupted chunk is rejected without touching the part file
+        with self.assertRaises(ChatUploadError):
+            upload._append_chunk(4000, io.BytesIO(data[4000:]), checksum='0' * 64)
+        self.assertEqual(upload._get_received(), 4000)
+
+        checksum = hashlib.sha256(data[4000:]).hexdigest()
+        self.assertEqual(upload._append_chunk(4000, io.BytesIO(data[4000:]), checksum), len(data))
+        part_path = upload._part_path()
+        attachment = upload._finalize()
+
+        self.assertEqual(attachment.raw, data)
+        self.assertEqual(attachment.checksum, hashlib.sha1(data).hexdigest())
+        self.assertEqual(attachment.file_size, len(data))
+        if attachment._storage() == 'file':
+            self.assertEqual(attachment.store_fname, f'{attachment.checksum[:2]}/{attachment.checksum}')
+            self.assertTrue(os.path.exists(attachment._full_path(attachment.store_fname)))
+        self.assertEqual((attachment.res_model, attachment.res_id), ('discuss.channel', channel.id))
+        self.assertFalse(upload.exists())
+        self.assertFalse(os.path.exists(part_path))
+
+    def _post_turns(self, channel, count):
+        messages = self.env['mail.message']
+        for i in range(count):
+            author = self.ai_assistant.partner_id if i % 2 else self.env.user.partner_id
+            messages |= channel.with_context(skip_ai_reply=True).message_post(
+                body=f'Turn {i}: ' + 'lorem ipsum dolor sit amet ' * 20,
+                message_type='comment',
+                subtype_xmlid='mail.mt_comment',
+                author_id=author.id,
+            )
+        return messages
+
+    def test_prompt_fits_token_budget(self):
+        """Older turns are left out so the prompt stays within the budget."""
+        from ..models.ai_client import AIClient
+        from ..services.context_window import count_message_tokens
+
+        channel = self.env['discuss.channel'].create({
+            'name': 'Budget Channel',
+            'channel_type': 'channel',
+        })
+        self._post_turns(channel, 30)
+        self.ai_assistant.context_token_budget = 600
+        client = AIClient.from_assistant(self.ai_assistant)
+
+        messages = channel._get_ai_prompt_messages(self.ai_assistant, client, 'Be helpful.', 'latest question')
+
+        total = sum(count_message_tokens(m.content, client.model_name) for m in messages)
+        self.assertLessEqual(total, 600)
+        self.assertEqual(messages[-1].content, 'latest question')
+        self.assertTrue(messages[-2].content.startswith('Turn 29:'))
+        self.assertLess(len(messages), 30)
+
+    def test_rolling_summary_replaces_older_turns(self):
+        """Summarized turns are sent as the summary instead of verbatim."""
+        from ..models.ai_client import AIClient
+
+        channel = self.env['discuss.channel'].create({
+            'name': 'Summary Channel',
+            'channel_type': 'channel',
+        })
+        posted = self._post_turns(channel, 6).sorted('id')
+        with patch.object(AIClient, 'summarize_conversation', return_value='They discussed turns 0 to 3.') as summarize:
+            channel._update_ai_summary(self.ai_assistant, posted[3].id)
+
+        summarize.assert_called_once()
+        self.assertEqual(channel.ai_summary, 'They discussed turns 0 to 3.')
+        self.assertEqual(channel.ai_summary_message_id, posted[3].id)
+
+        client = AIClient.from_assistant(self.ai_assistant)
+        messages = channel._get_ai_prompt_messages(self.ai_assistant, client, 'Be helpful.', 'next')
+        self.assertIn('They discussed turns 0 to 3.', messages[0].content)
+        self.assertEqual(
+            [m.content.split(':')[0] for m in messages[1:-1]], ['Turn 4', 'Turn 5'],
+        )
+
+    def test_summary_covers_turns_beyond_fetch_window(self):
+        """Turns older than the fetch window are summarized oldest first."""
+        from ..models.ai_client import AIClient
+        from ..models.discuss_channel import CHAT_HISTORY_FETCH_LIMIT, DiscussChannel
+
+        channel = self.env['discuss.channel'].create({
+            'name': 'Long Channel',
+            'channel_type': 'channel',
+        })
+        posted = self.env['mail.message']
+        for i in range(CHAT_HISTORY_FETCH_LIMIT + 20):
+            posted |= channel.with_context(skip_ai_reply=True).message_post(
+                body=f'Turn {i}',
+                message_type='comment',
+                subtype_xmlid='mail.mt_comment',
+                author_id=self.env.user.partner_id.id,
+            )
+        posted = posted.sorted('id')
+        client = AIClient.from_assistant(self.ai_assistant)
+
+        # Every fetched turn fits the budget, the 20 before the window do not
+        with patch.object(DiscussChannel, '_schedule_ai_summary', autospec=True) as schedule:
+            channel._get_ai_prompt_messages(self.ai_assistant, client, 'Be helpful.', 'next')
+        schedule.assert_called_once_with(channel, self.ai_assistant, posted[19].id)
+
+        with patch.object(AIClient, 'summarize_conversation', return_value='Turns 0 to 19.') as summarize:
+            channel._update_ai_summary(self.ai_assistant, posted[19].id)
+        transcript = summarize.call_args.args[1]
+        self.assertIn('Turn 0', transcript)
+        self.assertIn('Turn 19', transcript)
+        self.assertNotIn('Turn 20', transcript)
+        self.assertEqual(channel.ai_summary_message_id, posted[19].id)
+
     @patch('odoo.addons.woow_paas_platform.models.ai_client.AIClient')
     def test_post_ai_reply(self, MockAIClient):
         """_post_ai_reply should generate and post AI response."""
         mock_client = MagicMock()
+        mock_client.model_name = 'gpt-4o-mini'
         mock_client.build_messages.return_value = [{'role': 'user', 'content': 'hello'}]
         mock_client.chat_completion.return_value = 'AI says hello back'
+        mock_client.chat_completion_with_tools_status.return_value = ('AI says hello back', False)
         MockAIClient.from_assistant.return_value = mock_client
 
         channel = self.env['discuss.channel'].create({
@@ -242,6 +242,48 @@ class TestCloudAPI(HttpCase):
         self.assertEqual(service.state, 'error')
         self.assertIn('timeout', service.error_message)
 
+    def test_template_catalog_cache_invalidation(self):
+        """Test the cached catalog and facets follow template changes."""
+        catalog = self.Template._search_catalog('web', 'test template')
+        self.assertIn(self.template.id, [entry['id'] for entry in catalog])
+        self.assertIs(self.Template._get_catalog(), self.Template._get_catalog())
+        web_count = self.Template._get_catalog_facets().get('web', 0)
+
+        # Fields outside the catalog keep the cache
+        cached = self.Template._get_catalog()
+        self.template.write({'full_description': 'Longer text'})
+        self.assertIs(self.Template._get_catalog(), cached)
+
+        self.template.write({'is_active': False})
+        catalog = self.Template._search_catalog('web', 'Test Template')
+        self.assertNotIn(self.template.id, [entry['id'] for entry in catalog])
+        self.assertEqual(self.Template._get_catalog_facets().get('web', 0), web_count - 1)
+
+    def test_template_catalog_pagination(self):
+        """Test in-memory catalog pages cover every template exactly once."""
+        from ..controllers.paas import TEMPLATE_PAGE_ORDER
+        from ..services.pagination import paginate_entries
+
+        self.Template.create([{
+            'name': f'Paged Template {i}',
+            'slug': f'paged-{i}',
+            'category': 'database',
+            'helm_repo_url': 'https://charts.example.com',
+            'helm_chart_name': 'paged',
+            'helm_chart_version': '1.0.0',
+        } for i in range(5)])
+        catalog = self.Template._search_catalog('database', 'Paged Template')
+        self.assertEqual(len(catalog), 5)
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = paginate_entries(self.Template, catalog, TEMPLATE_PAGE_ORDER, 2, cursor)
+            seen.extend(entry['id'] for entry in page)
+            if not cursor:
+                break
+        self.assertEqual(seen, [entry['id'] for entry in catalog])
+
 
 class TestCloudServiceController(TransactionCase):
     """Test cases for cloud service controller logic."""
@@ -455,6 +497,52 @@ class TestCloudServiceController(TransactionCase):
         service.write({'helm_revision': 3})
         self.assertEqual(service.helm_revision, 3)
 
+    def test_workspace_dashboard_aggregates(self):
+        """Test the dashboard combines workspace, services and smart homes."""
+        from ..controllers.paas import PaasController
+
+        self.Service.create([{
+            'name': f'Dashboard Service {i}',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template_with_specs.id,
+            'state': state,
+            'allocated_vcpu': 2,
+            'allocated_ram_gb': 1.5,
+        } for i, state in enumerate(['running', 'running', 'error'])])
+        self.env['woow_paas_platform.smart_home'].create([{
+            'name': f'Dashboard HA {i}',
+            'workspace_id': self.workspace.id,
+        } for i in range(3)])
+
+        env = self.env(user=self.user)
+        with patch('odoo.addons.woow_paas_platform.controllers.paas.request', MagicMock(env=env)):
+            result = PaasController()._get_workspace_dashboard(self.workspace.id, limit=2)
+
+        self.assertTrue(result['success'])
+        data = result['data']
+        self.assertEqual(data['workspace']['id'], self.workspace.id)
+        self.assertEqual(data['workspace']['role'], 'owner')
+        services = data['services']
+        self.assertEqual(services['total'], 3)
+        self.assertEqual(services['by_state'], {'running': 2, 'error': 1})
+        self.assertEqual(services['resources']['vcpu'], 6)
+        self.assertAlmostEqual(services['resources']['ram_gb'], 4.5)
+        self.assertEqual(len(services['items']), 2)
+        self.assertTrue(services['next_cursor'])
+        smart_homes = data['smart_homes']
+        self.assertEqual(smart_homes['total'], 3)
+        self.assertEqual(len(smart_homes['items']), 2)
+        self.assertTrue(smart_homes['next_cursor'])
+        self.assertEqual(data['support']['total'], 0)
+
+        outsider = self.env['res.users'].create({
+            'name': 'Dashboard Outsider',
+            'login': 'dashboard_outsider@example.com',
+        })
+        with patch('odoo.addons.woow_paas_platform.controllers.paas.request', MagicMock(env=self.env(user=outsider))):
+            result = PaasController()._get_workspace_dashboard(self.workspace.id)
+        self.assertFalse(result['success'])
+
 
 class TestWorkspaceAPI(TransactionCase):
     """Test cases for workspace API operations."""
@@ -507,6 +595,101 @@ class TestWorkspaceAPI(TransactionCase):
         # Should now have 2 members
         self.assertEqual(workspace.member_count, 2)
 
+    def test_workspace_role_cache_invalidation(self):
+        """Test cached roles follow access record changes."""
+        workspace = self.Workspace.sudo().with_user(self.user).create({
+            'name': 'Role Cache Test',
+        })
+        test_user = self.env['res.users'].create({
+            'name': 'Role Cache User',
+            'login': 'role_cache_user',
+        })
+        self.assertFalse(workspace.check_user_access(test_user))
+
+        access = self.WorkspaceAccess.create({
+            'workspace_id': workspace.id,
+            'user_id': test_user.id,
+            'role': 'guest',
+        })
+        self.assertEqual(workspace.get_user_role(test_user), 'guest')
+        self.assertFalse(workspace.check_user_access(test_user, required_role='user'))
+
+        access.write({'role': 'admin'})
+        self.assertEqual(workspace.check_user_access(test_user, required_role='user'), access)
+
+        access.unlink()
+        self.assertIsNone(workspace.get_user_role(test_user))
+
+    def test_workspace_role_cache_cleared_on_delete(self):
+        """Test a deleted workspace leaves the cached role map."""
+        workspace = self.Workspace.sudo().with_user(self.user).create({
+            'name': 'Role Cache Delete Test',
+        })
+        workspace_id = workspace.id
+        self.assertEqual(workspace.get_user_roles(self.user), {workspace_id: 'owner'})
+
+        workspace.unlink()
+        self.assertEqual(self.Workspace.browse(workspace_id).get_user_roles(self.user), {})
+        self.assertNotIn(workspace_id, self.WorkspaceAccess._get_user_roles(self.user.id))
+
+    def test_workspace_roles_batch(self):
+        """Test roles for many workspaces resolve from one lookup."""
+        owned = self.Workspace.sudo().with_user(self.user).create([
+            {'name': 'Batch Role A'},
+            {'name': 'Batch Role B'},
+        ])
+        other_user = self.env['res.users'].create({
+            'name': 'Other Owner',
+            'login': 'batch_role_other_owner',
+        })
+        foreign = self.Workspace.sudo().with_user(other_user).create({'name': 'Batch Role C'})
+
+        self.WorkspaceAccess._get_user_roles(self.user.id)
+        with self.assertQueryCount(0):
+            roles = (owned | foreign).get_user_roles(self.user)
+
+        self.assertEqual(roles, {owned[0].id: 'owner', owned[1].id: 'owner'})
+
+    def test_provision_workspaces_allocates_unique_slugs(self):
+        """Test bulk provisioning uniquifies slugs across the DB and the batch."""
+        self.Workspace.create({'name': 'Demo Bulk'})
+        workspaces, errors = self.Workspace.provision_workspaces([
+            {'name': 'Demo Bulk'},
+            {'name': 'demo bulk'},
+            {'name': 'Other Bulk'},
+        ])
+
+        self.assertEqual(errors, {})
+        self.assertEqual(workspaces.mapped('slug'), ['demo-bulk-1', 'demo-bulk-2', 'other-bulk'])
+        self.assertEqual(workspaces.mapped('member_count'), [1, 1, 1])
+
+    def test_provision_workspaces_creates_namespaces(self):
+        """Test namespaces are pre-created and existing ones are tolerated."""
+        from odoo.addons.woow_paas_platform.services.paas_operator import PaaSOperatorError
+
+        client = MagicMock(base_url='http://operator', api_key='key')
+        calls = []
+
+        def create_namespace(namespace, **kwargs):
+            calls.append(namespace)
+            if len(calls) == 2:
+                raise PaaSOperatorError('exists', status_code=409)
+            return {'message': 'created'}
+
+        with patch('odoo.addons.woow_paas_platform.models.workspace.get_paas_operator_client', return_value=client), \
+                patch('odoo.addons.woow_paas_platform.services.paas_operator.PaaSOperatorClient') as client_cls:
+            client_cls.return_value.create_namespace.side_effect = create_namespace
+            workspaces, errors = self.Workspace.provision_workspaces(
+                [{'name': 'NS Bulk A'}, {'name': 'NS Bulk B'}],
+                create_namespaces=True,
+                max_workers=1,
+            )
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(all(ns.startswith('paas-ws-') for ns in calls))
+        self.assertEqual(len(workspaces), 2)
+
     def test_workspace_archive(self):
         """Test workspace archiving."""
         workspace = self.Workspace.sudo().with_user(self.user).create({
@@ -175,3 +175,38 @@ class TestCloudAppTemplate(TransactionCase):
         active_templates = self.Template.search([('is_active', '=', True)])
         self.assertGreaterEqual(len(active_templates), 1)
         self.assertTrue(all(t.is_active for t in active_templates))
+
+    def test_json_field_cache(self):
+        """Test parsed JSON fields are cached and refreshed on change."""
+        template = self.Template.create({
+            'name': 'Cached Template',
+            'slug': 'cached',
+            'helm_repo_url': 'https://charts.example.com',
+            'helm_chart_name': 'test',
+            'helm_chart_version': '1.0.0',
+            'tags': '["a", "b"]',
+            'helm_value_specs': '{"required": [], "optional": ["replicas"]}',
+        })
+
+        specs = template._get_json_field('helm_value_specs', {})
+        self.assertEqual(specs['optional'], ['replicas'])
+        # Same parsed object is served from the cache
+        self.assertIs(template._get_json_field('helm_value_specs', {}), specs)
+
+        # Rewritten in the same transaction (same write_date) → re-parsed
+        template.write({'helm_value_specs': '{"required": ["image.tag"]}'})
+        self.assertEqual(template._get_json_field('helm_value_specs', {}), {'required': ['image.tag']})
+        self.assertEqual(template._get_json_field('tags', []), ['a', 'b'])
+
+    def test_json_field_cache_invalid_or_empty(self):
+        """Test empty or invalid JSON returns the default."""
+        template = self.Template.create({
+            'name': 'Broken Template',
+            'slug': 'broken',
+            'helm_repo_url': 'https://charts.example.com',
+            'helm_chart_name': 'test',
+            'helm_chart_version': '1.0.0',
+            'tags': 'not json',
+        })
+        self.assertEqual(template._get_json_field('tags', []), [])
+        self.assertEqual(template._get_json_field('helm_default_values', {}), {})
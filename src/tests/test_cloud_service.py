@@ -1,4 +1,6 @@
 """Tests for Cloud Service model."""
+from unittest.mock import MagicMock, patch
+
 from odoo.tests.common import TransactionCase
 from odoo.exceptions import ValidationError
 
@@ -261,3 +263,107 @@ class TestCloudService(TransactionCase):
         ])
         self.assertGreaterEqual(len(services_t1), 1)
         self.assertTrue(all(s.template_id.id == self.template.id for s in services_t1))
+
+    def test_state_change_pushed_to_workspace_bus(self):
+        """Test state transitions are published on the workspace channel."""
+        service = self.Service.create({
+            'name': 'Bus Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+        })
+        BusBus = type(self.env['bus.bus'])
+        with patch.object(BusBus, '_sendone') as mock_send:
+            service.write({'state': 'running'})
+
+        mock_send.assert_called_once()
+        target, notification_type, payload = mock_send.call_args.args
+        self.assertEqual(target, self.workspace)
+        self.assertEqual(notification_type, 'woow_paas_platform/service_updated')
+        self.assertEqual(payload['id'], service.id)
+        self.assertEqual(payload['state'], 'running')
+
+    def test_untracked_write_not_pushed(self):
+        """Test writes to non-display fields do not notify the bus."""
+        service = self.Service.create({
+            'name': 'Quiet Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+        })
+        BusBus = type(self.env['bus.bus'])
+        with patch.object(BusBus, '_sendone') as mock_send:
+            service.write({'helm_values': '{}'})
+            service.unlink()
+
+        mock_send.assert_called_once()
+        self.assertEqual(mock_send.call_args.args[1], 'woow_paas_platform/service_deleted')
+
+    def test_ai_context_masks_secrets(self):
+        """Test the AI context block lists compact values with secrets masked."""
+        service = self.Service.create({
+            'name': 'AI Context Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+            'subdomain': 'paas-ws-1-ctx.example.com',
+            'helm_values': '{"replicas": 2, "auth": {"username": "woow", "password": "hunter2"},'
+                           ' "secret": {"N8N_API_KEY": "abc123"}, "extra": ""}',
+        })
+        block = service._get_ai_context()
+
+        self.assertIn('- URL: https://paas-ws-1-ctx.example.com', block)
+        self.assertIn('  - auth.username: woow', block)
+        self.assertIn('  - replicas: 2', block)
+        self.assertIn('  - auth.password: ********', block)
+        self.assertIn('  - secret.N8N_API_KEY: ********', block)
+        self.assertNotIn('hunter2', block)
+        self.assertNotIn('abc123', block)
+        self.assertNotIn('extra', block)
+
+    def test_ai_context_cached_per_write_date(self):
+        """Test the AI context block is built once per service version."""
+        service = self.Service.create({
+            'name': 'Cached Context Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+        })
+        ServiceModel = type(service)
+        with patch.object(ServiceModel, '_get_ai_context_values', autospec=True, return_value={}) as values:
+            first = service._get_ai_context()
+            self.assertEqual(service._get_ai_context(), first)
+        values.assert_called_once()
+
+    def test_refresh_operator_status_marks_deployed_running(self):
+        """Test a deployed release with ready pods moves the service to running."""
+        service = self.Service.create({
+            'name': 'Deploying Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+            'state': 'deploying',
+        })
+        client = MagicMock()
+        client.get_status.return_value = {
+            'release': {'status': 'deployed', 'revision': 2},
+            'pods': [{'phase': 'Running', 'ready': '1/1'}],
+        }
+
+        with patch('odoo.addons.woow_paas_platform.models.cloud_service.get_paas_operator_client', return_value=client):
+            service._refresh_operator_status()
+
+        self.assertEqual(service.state, 'running')
+        self.assertEqual(service.helm_revision, 2)
+
+    def test_trigger_status_refresh_queues_cron(self):
+        """Test operations queue an immediate run of the status refresh cron."""
+        service = self.Service.create({
+            'name': 'Upgrading Service',
+            'workspace_id': self.workspace.id,
+            'template_id': self.template.id,
+            'state': 'upgrading',
+        })
+        cron = self.env.ref('woow_paas_platform.ir_cron_refresh_cloud_service_status')
+        Trigger = self.env['ir.cron.trigger']
+        before = Trigger.search_count([('cron_id', '=', cron.id)])
+
+        service._trigger_status_refresh()
+        self.Service._trigger_status_refresh()
+
+        self.assertEqual(Trigger.search_count([('cron_id', '=', cron.id)]), before + 1)
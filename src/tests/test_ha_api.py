@@ -167,6 +167,65 @@ class TestHAApiData(TestHAApiBase):
         ])
         self.assertEqual(len(homes), 0)
 
+    def test_homes_version_token(self):
+        """Test the list version token tracks additions and removals."""
+        from ..services.list_version import get_version_token
+
+        domain = [('workspace_id', '=', self.workspace.id)]
+        token = get_version_token(self.SmartHome, domain)
+        self.assertEqual(token, get_version_token(self.SmartHome, domain))
+
+        second = self.SmartHome.create({
+            'name': 'Second HA',
+            'workspace_id': self.workspace.id,
+        })
+        token_after_create = get_version_token(self.SmartHome, domain)
+        self.assertNotEqual(token, token_after_create)
+
+        second.unlink()
+        self.assertNotEqual(token_after_create, get_version_token(self.SmartHome, domain))
+
+    def test_empty_list_version_token(self):
+        """Test an empty list still yields a stable token."""
+        from ..services.list_version import get_version_token
+
+        other_ws = self.Workspace.create({'name': 'Empty WS'})
+        token = get_version_token(self.SmartHome, [('workspace_id', '=', other_ws.id)])
+        self.assertEqual(token, '0.0.')
+
+    def test_homes_keyset_pagination(self):
+        """Test cursor pages cover every home exactly once, in order."""
+        from ..controllers.ha_api import HOME_PAGE_ORDER
+        from ..services.pagination import paginate
+
+        self.SmartHome.create([
+            {'name': f'Paged HA {i}', 'workspace_id': self.workspace.id}
+            for i in range(4)
+        ])
+        domain = [('workspace_id', '=', self.workspace.id)]
+        expected = self.SmartHome.search(domain, order='create_date desc, id desc')
+
+        seen = self.SmartHome
+        cursor = None
+        pages = 0
+        while True:
+            page, cursor = paginate(self.SmartHome, domain, HOME_PAGE_ORDER, 2, cursor)
+            seen |= page
+            pages += 1
+            if not cursor:
+                break
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen.ids, expected.ids)
+
+    def test_invalid_cursor_rejected(self):
+        """Test a tampered cursor raises InvalidCursor."""
+        from ..controllers.ha_api import HOME_PAGE_ORDER
+        from ..services.pagination import InvalidCursor, paginate
+
+        with self.assertRaises(InvalidCursor):
+            paginate(self.SmartHome, [], HOME_PAGE_ORDER, 10, 'not-a-cursor')
+
     @patch('odoo.addons.woow_paas_platform.models.smart_home.get_paas_operator_client')
     def test_refresh_status_updates_home(self, mock_get_client):
         """Test that refresh status updates the home record."""
@@ -525,7 +525,7 @@ class TestMCPServerSyncSafe(TransactionCase):
     @patch('odoo.addons.woow_paas_platform.models.mcp_server.McpServer._async_sync_tools')
     def test_sync_safe_success(self, mock_async):
         """Successful sync sets state to connected and resets retry count."""
-        mock_async.return_value = True
+        mock_async.return_value = []
 
         server = self.McpServer.sudo().create({
             'name': 'Safe Sync Test',
@@ -776,3 +776,66 @@ class TestMCPServerModel(TransactionCase):
         self.assertFalse(server.auto_created)
         self.assertEqual(server.sync_retry_count, 0)
         self.assertEqual(server.state, 'draft')
+
+    def test_build_mcp_tools_from_synced_schema(self):
+        """Tools are built from stored schemas and rebuilt after a re-sync."""
+        from ..services.mcp_pool import build_mcp_tools
+
+        server = self.McpServer.sudo().create({
+            'name': 'Pool Test',
+            'url': 'http://localhost:3000/mcp',
+            'transport': 'streamable_http',
+            'last_sync': '2026-01-01 00:00:00',
+        })
+        tool = self.McpTool.sudo().create({
+            'name': 'list_workflows',
+            'description': 'List workflows',
+            'input_schema': json.dumps({
+                'type': 'object',
+                'properties': {'limit': {'type': 'integer'}},
+            }),
+            'server_id': server.id,
+        })
+
+        tools = build_mcp_tools(tool)
+        self.assertEqual([t.name for t in tools], [f's{server.id}_list_workflows'])
+        self.assertIn('limit', tools[0].args)
+        self.assertIs(build_mcp_tools(tool)[0], tools[0])
+
+        # Another assistant enabling a different subset shares the entry
+        other = self.McpTool.sudo().create({
+            'name': 'run_workflow',
+            'description': 'Run a workflow',
+            'server_id': server.id,
+        })
+        self.assertEqual(len(build_mcp_tools(other)), 1)
+        self.assertIs(build_mcp_tools(tool)[0], tools[0])
+        self.assertIs(build_mcp_tools(tool | other)[0], tools[0])
+
+        server.write({'last_sync': '2026-01-02 00:00:00'})
+        self.assertIsNot(build_mcp_tools(tool)[0], tools[0])
+
+    def test_mcp_tool_calls_use_session_pool(self):
+        """Invoking a built tool goes through the pooled session."""
+        import asyncio
+
+        from ..services.mcp_pool import build_mcp_tools, get_mcp_session_pool
+
+        server = self.McpServer.sudo().create({
+            'name': 'Pool Call Test',
+            'url': 'http://localhost:3000/mcp',
+            'transport': 'streamable_http',
+        })
+        tool = self.McpTool.sudo().create({
+            'name': 'ping',
+            'input_schema': json.dumps({'type': 'object', 'properties': {}}),
+            'server_id': server.id,
+        })
+        result = MagicMock(isError=False, content=[MagicMock(text='pong')])
+        pool = get_mcp_session_pool()
+        with patch.object(pool, 'call_tool', AsyncMock(return_value=result)) as call_tool:
+            output = asyncio.run(build_mcp_tools(tool)[0].ainvoke({}))
+
+        self.assertEqual(output, 'pong')
+        self.assertEqual(call_tool.call_args.args[0], server.id)
+        self.assertEqual(call_tool.call_args.args[2], 'ping')
@@ -370,3 +370,61 @@ class TestGetPaaSOperatorClient(TransactionCase):
         self.assertIsInstance(client, PaaSOperatorClient)
         self.assertEqual(client.base_url, 'http://localhost:8000')
         self.assertEqual(client.api_key, 'test-key')
+
+
+class TestRunOperatorBatch(TransactionCase):
+    """Test cases for the bounded concurrent batch helper."""
+
+    def setUp(self):
+        super().setUp()
+        from ..services.paas_operator import PaaSOperatorClient, run_operator_batch
+        self.client = PaaSOperatorClient(
+            base_url='http://paas-operator:8000',
+            api_key='test-api-key',
+        )
+        self.run_operator_batch = run_operator_batch
+
+    def test_empty_items(self):
+        """Test empty batch returns no results."""
+        self.assertEqual(self.run_operator_batch(self.client, lambda c, i: i, []), [])
+
+    @patch('requests.Session.request')
+    def test_results_in_input_order_with_errors(self, mock_request):
+        """Test results keep input order and failures are captured per item."""
+        from ..services.paas_operator import PaaSOperatorAPIError
+
+        def fake_request(method=None, url=None, **kwargs):
+            response = MagicMock()
+            if url.endswith('/svc-bad'):
+                response.status_code = 500
+                response.json.return_value = {'detail': 'boom'}
+            else:
+                response.status_code = 200
+                response.content = b'{"revision": 2}'
+                response.json.return_value = {'revision': 2}
+            return response
+
+        mock_request.side_effect = fake_request
+
+        releases = ['svc-1', 'svc-bad', 'svc-3']
+        results = self.run_operator_batch(
+            self.client,
+            lambda c, name: c.upgrade_release('paas-ws-a1b2c3d4', name, chart='nginx'),
+            releases,
+            max_workers=2,
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], ({'revision': 2}, None))
+        self.assertIsNone(results[1][0])
+        self.assertIsInstance(results[1][1], PaaSOperatorAPIError)
+        self.assertEqual(results[2], ({'revision': 2}, None))
+
+    def test_workers_use_own_client(self):
+        """Test worker threads never share the caller's client session."""
+        seen = []
+        self.run_operator_batch(self.client, lambda c, i: seen.append(c), [1, 2, 3])
+        self.assertEqual(len(seen), 3)
+        for worker_client in seen:
+            self.assertIsNot(worker_client, self.client)
+            self.assertEqual(worker_client.base_url, self.client.base_url)
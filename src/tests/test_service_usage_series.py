@@ -0,0 +1,101 @@
+"""Tests for the cloud service usage series store."""
+import time
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+class TestServiceUsageSeries(TransactionCase):
+    """Test cases for woow_paas_platform.service_usage_series model."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.Series = self.env['woow_paas_platform.service_usage_series']
+        workspace = self.env['woow_paas_platform.workspace'].create({'name': 'Usage Workspace'})
+        template = self.env['woow_paas_platform.cloud_app_template'].create({
+            'name': 'Usage Template',
+            'slug': 'usage',
+            'helm_repo_url': 'https://charts.example.com',
+            'helm_chart_name': 'usage',
+            'helm_chart_version': '1.0.0',
+        })
+        self.service = self.env['woow_paas_platform.cloud_service'].create({
+            'name': 'Usage Service',
+            'workspace_id': workspace.id,
+            'template_id': template.id,
+            'helm_namespace': 'paas-ws-usage',
+            'helm_release_name': 'usage-svc',
+        })
+        # Start of the hour two hours ago, so its raw chunk is closed
+        now = int(time.time())
+        self.hour = now - now % 3600 - 7200
+
+    def _sample(self, ts, cpu, memory_mb, release='usage-svc'):
+        return {
+            'namespace': 'paas-ws-usage',
+            'release': release,
+            'timestamp': ts,
+            'cpu_millicores': cpu,
+            'memory_bytes': memory_mb * 1024 * 1024,
+        }
+
+    def _arrays(self, resolution):
+        self.env.cr.execute(
+            f"SELECT ts, cpu, mem, cpu_max FROM {self.Series._table} "
+            "WHERE service_id = %s AND resolution = %s ORDER BY bucket_start",
+            (self.service.id, resolution),
+        )
+        return self.env.cr.fetchall()
+
+    def test_ingest_dedupes_replica_samples(self):
+        """Test duplicate timestamps from several replicas are stored once."""
+        samples = [self._sample(self.hour + 60 * i, 100 + i, 256) for i in range(3)]
+        result = self.Series._ingest_samples(samples + [self._sample(self.hour, 1, 1, release='other')])
+        self.assertEqual(result, {'accepted': 3, 'unknown': 1})
+
+        # Second replica pushes overlapping samples plus one new point
+        self.Series._ingest_samples(samples[1:] + [self._sample(self.hour + 180, 103, 256)])
+
+        rows = self._arrays('raw')
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], [0, 60, 120, 180])
+        self.assertEqual(rows[0][1], [100, 101, 102, 103])
+
+    def test_downsample_closed_chunks(self):
+        """Test closed raw chunks roll up into 5-minute buckets."""
+        self.Series._ingest_samples([
+            self._sample(self.hour + 60 * i, 100 if i < 5 else 300, 512) for i in range(10)
+        ])
+
+        self.Series._downsample('raw', '5m', fields.Datetime.now())
+
+        rows = self._arrays('5m')
+        self.assertEqual(len(rows), 1)
+        ts, cpu, _mem, cpu_max = rows[0]
+        self.assertEqual(ts[1] - ts[0], 300)
+        self.assertEqual(cpu, [100, 300])
+        self.assertEqual(cpu_max, [100, 300])
+        self.assertTrue(self.Series.search([
+            ('service_id', '=', self.service.id), ('resolution', '=', 'raw'),
+        ]).downsampled)
+
+    def test_usage_summary_percentiles(self):
+        """Test usage percentiles over the raw series."""
+        self.Series._ingest_samples([
+            self._sample(self.hour + 60 * i, float(i + 1), 100 + i) for i in range(100)
+        ])
+
+        usage = self.Series._usage_summary(self.service, '24h')
+
+        self.assertEqual(usage['samples'], 100)
+        self.assertEqual(usage['resolution'], 'raw')
+        self.assertAlmostEqual(usage['cpu_millicores']['p50'], 50.5)
+        self.assertEqual(usage['cpu_millicores']['max'], 100)
+        self.assertEqual(usage['memory_mb']['max'], 199)
+
+    def test_usage_summary_empty(self):
+        """Test a service without samples reports no statistics."""
+        usage = self.Series._usage_summary(self.service, '7d')
+        self.assertEqual(usage['samples'], 0)
+        self.assertIsNone(usage['cpu_millicores'])